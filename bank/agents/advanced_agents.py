@@ -6,20 +6,15 @@ learning algorithms and provide tough competition during training.
 
 from __future__ import annotations
 
-from bank.agents.base import Action, Agent, Observation
+from collections.abc import Sequence
+
+from bank.agents.base import Action, Agent, Observation, max_opponent_score, player_rank
 
 
 class LeaderPlusBaseAgent(Agent):
     def on_new_round(self, observation: Observation) -> None:
         """Call this at the start of each round to handle lost-lead state if needed."""
-        my_id = observation["player_id"]
-        my_score = observation["player_score"]
-        all_scores = observation["all_player_scores"]
-        max_opponent = max(
-            [score for pid, score in all_scores.items() if pid != my_id],
-            default=0,
-        )
-        is_leader = my_score > max_opponent
+        is_leader = observation["player_score"] > max_opponent_score(observation)
         if not is_leader and self._was_leader:
             self._wait_counter = self.plus_n
             self._was_leader = False
@@ -33,6 +28,12 @@ class LeaderPlusBaseAgent(Agent):
         self._wait_counter = 0
         self._last_roll_count = None
 
+    def reset(self) -> None:
+        """Clear leader and wait-period tracking for a new game."""
+        self._was_leader = False
+        self._wait_counter = 0
+        self._last_roll_count = None
+
     def act(self, observation: Observation) -> Action:
         # If this is the first act() call of a new round, check for lost-lead state
         if observation["roll_count"] == 1:
@@ -41,14 +42,9 @@ class LeaderPlusBaseAgent(Agent):
             return "pass"
         if not observation["can_bank"]:
             return "pass"
-        my_id = observation["player_id"]
         my_score = observation["player_score"]
         bank = observation["current_bank"]
-        all_scores = observation["all_player_scores"]
-        max_opponent = max(
-            [score for pid, score in all_scores.items() if pid != my_id],
-            default=0,
-        )
+        max_opponent = max_opponent_score(observation)
         is_leader = my_score > max_opponent
         will_be_leader = my_score + bank > max_opponent
 
@@ -235,6 +231,26 @@ class RankBasedAgent(Agent):
         self.middle_threshold = middle_threshold
         self.last_threshold = last_threshold
 
+    def rank_threshold(self, rank: int, num_players: int) -> int:
+        """Return the bank threshold for a rank.
+
+        Args:
+            rank: Current rank (1 = first place, higher = worse)
+            num_players: Number of players in the game
+
+        Returns:
+            Bank value at which to bank
+
+        """
+        if rank == 1:
+            # Leading - be conservative
+            return self.leader_threshold
+        if rank == num_players:
+            # Last place - be aggressive
+            return self.last_threshold
+        # Middle - balanced
+        return self.middle_threshold
+
     def act(self, observation: Observation) -> Action:
         """Bank based on rank-adjusted threshold.
 
@@ -249,29 +265,32 @@ class RankBasedAgent(Agent):
         if not observation["can_bank"]:
             return "pass"
 
-        # Calculate current rank (1 = first place, higher = worse)
-        my_score = observation["player_score"]
-        all_scores = observation["all_player_scores"]
-
-        # Count how many players have higher scores
-        rank = 1 + sum(1 for score in all_scores.values() if score > my_score)
-
-        # Determine number of players
-        num_players = len(all_scores)
-
-        # Set threshold based on rank
-        if rank == 1:
-            # Leading - be conservative
-            threshold = self.leader_threshold
-        elif rank == num_players:
-            # Last place - be aggressive
-            threshold = self.last_threshold
-        else:
-            # Middle - balanced
-            threshold = self.middle_threshold
+        threshold = self.rank_threshold(player_rank(observation), len(observation["all_player_scores"]))
 
         # Bank if current bank meets or exceeds threshold
         if observation["current_bank"] >= threshold:
             return "bank"
 
         return "pass"
+
+    @classmethod
+    def act_batch(cls, agents: Sequence[Agent], observations: Sequence[Observation]) -> list[Action]:
+        """Apply every agent's rank-based threshold in a single pass.
+
+        Args:
+            agents: Rank-based agents, one per observation
+            observations: Observation for each agent
+
+        Returns:
+            List of actions, one per agent
+
+        """
+        if cls.act is not RankBasedAgent.act:
+            return super().act_batch(agents, observations)
+        return [
+            "bank"
+            if obs["can_bank"]
+            and obs["current_bank"] >= agent.rank_threshold(player_rank(obs), len(obs["all_player_scores"]))
+            else "pass"
+            for agent, obs in zip(agents, observations, strict=True)
+        ]
@@ -3,9 +3,13 @@
 Defines the interface that all agents (manual, AI, etc.) must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import Literal, TypedDict
 
+import numpy as np
+
 # Type alias for agent actions
 Action = Literal["bank", "pass"]
 
@@ -18,11 +22,25 @@ class Observation(TypedDict):
         roll_count: Number of rolls in current round (1-based)
         current_bank: Current value in the bank
         last_roll: Tuple of (die1, die2) from most recent roll, or None
-        active_player_ids: Set of player IDs still active in the round
+        active_player_ids: Set of player IDs still active in the round. A
+            snapshot shared by every observation in the same poll, so it is
+            read-only.
+        active_mask: The same players as a bitmask (bit i set if player i
+            is active); ``active_mask.bit_count()`` is the number active.
         player_id: ID of the player receiving this observation
         player_score: Current score of the player
         can_bank: Whether the player can bank (hasn't banked yet this round)
-        all_player_scores: Dict mapping player_id to their current scores
+        all_player_scores: Read-only mapping of player_id to their current
+            scores, shared by every observation in the same poll
+        all_player_scores_arr: Read-only array of every player's score,
+            indexed by player_id. This is a live view of the game's scores:
+            it reflects later score changes, so copy it to keep a snapshot.
+        max_opponent_score: Highest score among the other players, computed
+            once per poll by the engine (0 if there are no opponents). Use
+            max_opponent_score() to read it from hand-built observations.
+        my_rank: 1 + the number of players with a strictly higher score, so
+            tied players share a rank. Use player_rank() to read it from
+            hand-built observations.
 
     """
 
@@ -30,11 +48,53 @@ class Observation(TypedDict):
     roll_count: int
     current_bank: int
     last_roll: tuple[int, int] | None
-    active_player_ids: set[int]
+    active_player_ids: frozenset[int]
+    active_mask: int
     player_id: int
     player_score: int
     can_bank: bool
-    all_player_scores: dict[int, int]
+    all_player_scores: Mapping[int, int]
+    all_player_scores_arr: np.ndarray
+    max_opponent_score: int
+    my_rank: int
+
+
+def max_opponent_score(observation: Observation) -> int:
+    """Return the highest score among the observing player's opponents.
+
+    Reads the engine's precomputed ``max_opponent_score`` field, falling back
+    to a scan of ``all_player_scores`` for observations built without it.
+
+    Args:
+        observation: Observation for the deciding player
+
+    Returns:
+        Best opponent score, or 0 if there are no opponents
+
+    """
+    if "max_opponent_score" in observation:
+        return observation["max_opponent_score"]
+    my_id = observation["player_id"]
+    return max((score for pid, score in observation["all_player_scores"].items() if pid != my_id), default=0)
+
+
+def player_rank(observation: Observation) -> int:
+    """Return the observing player's rank (1 = leading, ties share a rank).
+
+    Reads the engine's precomputed ``my_rank`` field, falling back to counting
+    higher scores in ``all_player_scores`` for observations built without it.
+
+    Args:
+        observation: Observation for the deciding player
+
+    Returns:
+        1 + the number of players with a strictly higher score
+
+    """
+    if "my_rank" in observation:
+        return observation["my_rank"]
+    my_score = observation["player_score"]
+    return 1 + sum(1 for score in observation["all_player_scores"].values() if score > my_score)
 
 
 class Agent(ABC):
@@ -68,6 +128,42 @@ class Agent(ABC):
         """
         ...
 
+    @classmethod
+    def act_batch(cls, agents: Sequence["Agent"], observations: Sequence[Observation]) -> list[Action]:
+        """Make decisions for several agents of this class at once.
+
+        Used by BankGame's simultaneous polling, which groups agents by class
+        and makes one call per group. The default calls act() on each agent;
+        classes whose decision is a simple rule can override this to decide
+        the whole group in one pass.
+
+        Args:
+            agents: Agents of this class, one per observation
+            observations: Observation for each agent
+
+        Returns:
+            List of actions, one per agent
+
+        """
+        return [agent.act(observation) for agent, observation in zip(agents, observations, strict=True)]
+
+    async def aact(self, observation: Observation) -> Action:
+        """Asynchronously make a decision based on the current observation.
+
+        Used by BankGame.poll_decisions_async(). The default runs act() in a
+        worker thread so a blocking agent does not stall the event loop.
+        Agents backed by network or other I/O should override this with a
+        native coroutine.
+
+        Args:
+            observation: Current game state observation
+
+        Returns:
+            Action: either "bank" or "pass"
+
+        """
+        return await asyncio.to_thread(self.act, observation)
+
     def reset(self) -> None:
         """Reset the agent's internal state for a new game.
 
@@ -7,6 +7,7 @@ Useful for testing, baselines, and as a reference implementation.
 from __future__ import annotations
 
 import random
+from collections.abc import Sequence
 
 from bank.agents.base import Action, Agent, Observation
 
@@ -65,6 +66,28 @@ class RandomAgent(Agent):
             return "bank"
         return "pass"
 
+    @classmethod
+    def act_batch(cls, agents: Sequence[Agent], observations: Sequence[Observation]) -> list[Action]:
+        """Decide for a group of random agents in one pass.
+
+        Each agent still draws from its own RNG, so seeded agents make the
+        same choices as when act() is called one at a time.
+
+        Args:
+            agents: Random agents, one per observation
+            observations: Observation for each agent
+
+        Returns:
+            List of actions, one per agent
+
+        """
+        if cls.act is not RandomAgent.act:
+            return super().act_batch(agents, observations)
+        return [
+            "bank" if obs["can_bank"] and agent.rng.random() < agent.bank_probability else "pass"
+            for agent, obs in zip(agents, observations, strict=True)
+        ]
+
     def reset(self) -> None:
         """Reset agent state for a new game.
 
@@ -7,7 +7,28 @@ as baselines for comparing learning agents.
 
 from __future__ import annotations
 
-from bank.agents.base import Action, Agent, Observation
+from collections.abc import Sequence
+
+from bank.agents.base import Action, Agent, Observation, max_opponent_score
+
+
+def _threshold_action(agent: ThresholdAgent | ConservativeAgent | AggressiveAgent, observation: Observation) -> Action:
+    """Bank when the pot meets the agent's threshold for the current roll.
+
+    Shared by ``act()`` and ``act_batch()`` of the threshold-style agents so
+    the banking rule lives in one place.
+
+    Args:
+        agent: Agent providing ``bank_threshold(roll_count)``
+        observation: Current game state information
+
+    Returns:
+        "bank" if banking is allowed and the threshold is met, otherwise "pass"
+
+    """
+    if observation["can_bank"] and observation["current_bank"] >= agent.bank_threshold(observation["roll_count"]):
+        return "bank"
+    return "pass"
 
 
 class ThresholdAgent(Agent):
@@ -36,6 +57,18 @@ class ThresholdAgent(Agent):
         super().__init__(player_id, name or f"Threshold-{threshold}")
         self.threshold = threshold
 
+    def bank_threshold(self, roll_count: int) -> int:  # noqa: ARG002
+        """Return the fixed threshold, regardless of roll count.
+
+        Args:
+            roll_count: Number of rolls so far this round (unused)
+
+        Returns:
+            Bank value at which to bank
+
+        """
+        return self.threshold
+
     def act(self, observation: Observation) -> Action:
         """Bank if current bank meets or exceeds threshold.
 
@@ -46,9 +79,23 @@ class ThresholdAgent(Agent):
             "bank" if threshold is met and can_bank is True, otherwise "pass"
 
         """
-        if observation["can_bank"] and observation["current_bank"] >= self.threshold:
-            return "bank"
-        return "pass"
+        return _threshold_action(self, observation)
+
+    @classmethod
+    def act_batch(cls, agents: Sequence[Agent], observations: Sequence[Observation]) -> list[Action]:
+        """Apply every agent's threshold in a single pass.
+
+        Args:
+            agents: Threshold agents, one per observation
+            observations: Observation for each agent
+
+        Returns:
+            List of actions, one per agent
+
+        """
+        if cls.act is not ThresholdAgent.act:
+            return super().act_batch(agents, observations)
+        return [_threshold_action(agent, obs) for agent, obs in zip(agents, observations, strict=True)]
 
 
 class ConservativeAgent(Agent):
@@ -80,13 +127,28 @@ class ConservativeAgent(Agent):
         self.early_threshold = early_threshold
         self.late_threshold = late_threshold
 
-    def act(self, observation: Observation) -> Action:
-        """Bank conservatively based on roll count.
+    def bank_threshold(self, roll_count: int) -> int:
+        """Return the threshold for the given roll count.
 
         Strategy:
         - First 3 rolls: Bank at early_threshold (less risky period)
         - After roll 3: Bank at late_threshold (more risk of seven)
 
+        Args:
+            roll_count: Number of rolls so far this round
+
+        Returns:
+            Bank value at which to bank
+
+        """
+        # After the safe first 3 rolls, be more conservative
+        if roll_count > 3:
+            return self.late_threshold
+        return self.early_threshold
+
+    def act(self, observation: Observation) -> Action:
+        """Bank conservatively based on roll count.
+
         Args:
             observation: Current game state information
 
@@ -94,18 +156,23 @@ class ConservativeAgent(Agent):
             "bank" if conditions are met, otherwise "pass"
 
         """
-        if not observation["can_bank"]:
-            return "pass"
+        return _threshold_action(self, observation)
 
-        # After the safe first 3 rolls, be more conservative
-        if observation["roll_count"] > 3:
-            threshold = self.late_threshold
-        else:
-            threshold = self.early_threshold
+    @classmethod
+    def act_batch(cls, agents: Sequence[Agent], observations: Sequence[Observation]) -> list[Action]:
+        """Apply every agent's roll-dependent threshold in a single pass.
 
-        if observation["current_bank"] >= threshold:
-            return "bank"
-        return "pass"
+        Args:
+            agents: Conservative agents, one per observation
+            observations: Observation for each agent
+
+        Returns:
+            List of actions, one per agent
+
+        """
+        if cls.act is not ConservativeAgent.act:
+            return super().act_batch(agents, observations)
+        return [_threshold_action(agent, obs) for agent, obs in zip(agents, observations, strict=True)]
 
 
 class AggressiveAgent(Agent):
@@ -137,13 +204,28 @@ class AggressiveAgent(Agent):
         self.min_threshold = min_threshold
         self.early_multiplier = early_multiplier
 
-    def act(self, observation: Observation) -> Action:
-        """Bank aggressively, waiting for high values.
+    def bank_threshold(self, roll_count: int) -> int:
+        """Return the threshold for the given roll count.
 
         Strategy:
         - First 3 rolls: Even higher threshold (safest time to be greedy)
         - After roll 3: Still high threshold but slightly more cautious
 
+        Args:
+            roll_count: Number of rolls so far this round
+
+        Returns:
+            Bank value at which to bank
+
+        """
+        # During first 3 rolls, be even more aggressive (less risk)
+        if roll_count <= 3:
+            return int(self.min_threshold * self.early_multiplier)
+        return self.min_threshold
+
+    def act(self, observation: Observation) -> Action:
+        """Bank aggressively, waiting for high values.
+
         Args:
             observation: Current game state information
 
@@ -151,18 +233,23 @@ class AggressiveAgent(Agent):
             "bank" if high-value conditions are met, otherwise "pass"
 
         """
-        if not observation["can_bank"]:
-            return "pass"
+        return _threshold_action(self, observation)
 
-        # During first 3 rolls, be even more aggressive (less risk)
-        if observation["roll_count"] <= 3:
-            threshold = int(self.min_threshold * self.early_multiplier)
-        else:
-            threshold = self.min_threshold
+    @classmethod
+    def act_batch(cls, agents: Sequence[Agent], observations: Sequence[Observation]) -> list[Action]:
+        """Apply every agent's roll-dependent threshold in a single pass.
 
-        if observation["current_bank"] >= threshold:
-            return "bank"
-        return "pass"
+        Args:
+            agents: Aggressive agents, one per observation
+            observations: Observation for each agent
+
+        Returns:
+            List of actions, one per agent
+
+        """
+        if cls.act is not AggressiveAgent.act:
+            return super().act_batch(agents, observations)
+        return [_threshold_action(agent, obs) for agent, obs in zip(agents, observations, strict=True)]
 
 
 class SmartAgent(Agent):
@@ -304,18 +391,14 @@ class AdaptiveAgent(Agent):
             return "pass"
 
         my_score = observation["player_score"]
-        all_scores = observation["all_player_scores"]
         bank = observation["current_bank"]
         roll_count = observation["roll_count"]
 
-        # Find opponent scores
-        opponent_scores = [score for pid, score in all_scores.items() if pid != observation["player_id"]]
-
-        if not opponent_scores:
+        if len(observation["all_player_scores"]) < 2:
             # Solo play or testing - use default
             threshold = self.default_threshold
         else:
-            leader_score = max(opponent_scores)
+            leader_score = max_opponent_score(observation)
             score_diff = my_score - leader_score
 
             # Adjust threshold based on position
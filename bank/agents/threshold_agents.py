@@ -8,7 +8,7 @@ Implements threshold agents for 300, 350, 400, 450, 500 with adaptive protocols:
 
 from __future__ import annotations
 
-from bank.agents.base import Action, Agent, Observation
+from bank.agents.base import Action, Agent, Observation, max_opponent_score
 
 
 class AdaptiveThresholdAgent(Agent):
@@ -45,12 +45,10 @@ class AdaptiveThresholdAgent(Agent):
             return "pass"
 
         my_score = observation["player_score"]
-        all_scores = observation["all_player_scores"]
         round_num = observation.get("round_number", 1)
         total_rounds = observation.get("total_rounds", 10)
         bank = observation["current_bank"]
-        my_id = observation["player_id"]
-        max_opponent = max([score for pid, score in all_scores.items() if pid != my_id], default=0)
+        max_opponent = max_opponent_score(observation)
         is_leader = my_score > max_opponent
         LAST_ROUNDS = 3
         is_last_3 = total_rounds - round_num < LAST_ROUNDS
@@ -0,0 +1,11 @@
+"""Experiments Module.
+
+Batch simulation helpers for running many BANK! games, e.g. Monte-Carlo
+strategy sweeps and tournaments.
+"""
+
+from bank.experiments.compiled import simulate_games
+from bank.experiments.parallel import run_tournament
+from bank.experiments.vectorized import simulate_threshold_games
+
+__all__ = ["run_tournament", "simulate_games", "simulate_threshold_games"]
@@ -0,0 +1,192 @@
+"""Compiled whole-game kernel for strategy sweeps.
+
+Plays a complete BANK! game with the round, roll and polling loops in one
+function, so Numba (when installed, see bank.utils.jit) compiles it to
+native code. Agent classes are replaced by a strategy ID and one integer
+parameter per player:
+
+    STRATEGY_THRESHOLD    bank once the bank reaches ``param`` (ThresholdAgent)
+    STRATEGY_LEADER_PLUS  LeaderPlusN protocol with ``plus_n = param``
+
+Dice come from a small 48-bit LCG seeded per game rather than from
+``random.Random``, so each game is reproducible from its seed alone.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from bank.utils.jit import njit, prange
+
+STRATEGY_THRESHOLD = 0
+STRATEGY_LEADER_PLUS = 1
+
+# java.util.Random's 48-bit LCG. The multiply is split into 24-bit halves
+# so no intermediate overflows int64: compiled code must not rely on signed
+# wraparound (LLVM treats it as undefined), and pure Python must match it.
+_LCG_MULTIPLIER = 0x5DEECE66D
+_LCG_INCREMENT = 0xB
+_LCG_MASK = (1 << 48) - 1
+_HALF_BITS = 24
+_HALF_MASK = (1 << _HALF_BITS) - 1
+# Die faces come from the top 31 bits of the state
+_DIE_SHIFT = 17
+
+_FIRST_THREE_ROLLS = 3
+_SEVEN = 7
+_SEVEN_BONUS = 70
+# LeaderPlusN agents never bank before this roll
+_LEADER_MIN_ROLL = 3
+
+
+@njit(cache=True)
+def lcg_next(state: int) -> int:
+    """Advance the dice generator by one step.
+
+    Args:
+        state: Current generator state
+
+    Returns:
+        The next generator state
+
+    """
+    high = ((state >> _HALF_BITS) * _LCG_MULTIPLIER) & _HALF_MASK
+    low = (state & _HALF_MASK) * _LCG_MULTIPLIER
+    return ((high << _HALF_BITS) + low + _LCG_INCREMENT) & _LCG_MASK
+
+
+@njit(cache=True)
+def lcg_die(state: int) -> int:
+    """Map a generator state to a die face (1-6) using its high bits."""
+    return (state >> _DIE_SHIFT) % 6 + 1
+
+
+@njit(cache=True)
+def play_game(
+    strategies: np.ndarray,
+    params: np.ndarray,
+    total_rounds: int,
+    seed: int,
+    scores: np.ndarray,
+) -> None:
+    """Play one game with simultaneous polling and write the final scores.
+
+    Follows BankGame's rules and each strategy's act() exactly; only the
+    source of the dice differs.
+
+    Args:
+        strategies: Strategy ID for each player (int8)
+        params: Threshold or plus_n for each player (int64)
+        total_rounds: Number of rounds to play
+        seed: Seed for this game's dice
+        scores: Output array of final scores, one per player (zeroed here)
+
+    """
+    num_players = strategies.shape[0]
+    state = seed & _LCG_MASK
+
+    active = np.empty(num_players, dtype=np.bool_)
+    banks = np.empty(num_players, dtype=np.bool_)
+    # LeaderPlusN state; last_roll of -1 stands for "not seen yet"
+    was_leader = np.zeros(num_players, dtype=np.bool_)
+    wait = np.zeros(num_players, dtype=np.int64)
+    last_roll = np.full(num_players, -1, dtype=np.int64)
+
+    for i in range(num_players):
+        scores[i] = 0
+
+    for _ in range(total_rounds):
+        bank = 0
+        roll_count = 0
+        num_active = num_players
+        for i in range(num_players):
+            active[i] = True
+
+        while num_active > 0:
+            state = lcg_next(state)
+            die1 = lcg_die(state)
+            state = lcg_next(state)
+            die2 = lcg_die(state)
+            dice_sum = die1 + die2
+            roll_count += 1
+
+            if dice_sum == _SEVEN:
+                if roll_count > _FIRST_THREE_ROLLS:
+                    break  # Bank is lost; round over
+                bank += _SEVEN_BONUS
+            elif die1 == die2 and roll_count > _FIRST_THREE_ROLLS:
+                bank *= 2
+            else:
+                bank += dice_sum
+
+            # Every active player decides against the same scores
+            for i in range(num_players):
+                banks[i] = False
+                if not active[i]:
+                    continue
+
+                if strategies[i] == STRATEGY_THRESHOLD:
+                    banks[i] = bank >= params[i]
+                    continue
+
+                # LeaderPlusN: best opponent score before anyone banks
+                max_opponent = 0
+                for j in range(num_players):
+                    if j != i and scores[j] > max_opponent:
+                        max_opponent = scores[j]
+                is_leader = scores[i] > max_opponent
+
+                if roll_count == 1 and not is_leader and was_leader[i]:
+                    wait[i] = params[i]
+                    was_leader[i] = False
+                if roll_count < _LEADER_MIN_ROLL:
+                    continue
+
+                will_be_leader = scores[i] + bank > max_opponent
+                if last_roll[i] == -1:
+                    last_roll[i] = roll_count
+                if roll_count != last_roll[i]:
+                    if wait[i] > 0 and will_be_leader:
+                        wait[i] -= 1
+                    last_roll[i] = roll_count
+
+                if is_leader:
+                    was_leader[i] = True
+                    continue
+                if was_leader[i]:
+                    wait[i] = params[i]
+                    was_leader[i] = False
+                if will_be_leader and wait[i] == 0:
+                    was_leader[i] = True
+                    banks[i] = True
+
+            for i in range(num_players):
+                if banks[i]:
+                    scores[i] += bank
+                    active[i] = False
+                    num_active -= 1
+
+
+@njit(cache=True, parallel=True)
+def play_games(
+    strategies: np.ndarray,
+    params: np.ndarray,
+    total_rounds: int,
+    seed: int,
+    scores: np.ndarray,
+) -> None:
+    """Play many independent games, spread across CPU cores.
+
+    Game ``g`` is seeded with ``seed + g`` and writes row ``g`` of scores,
+    so results do not depend on how games are split between threads.
+
+    Args:
+        strategies: Strategy ID for each player (int8)
+        params: Threshold or plus_n for each player (int64)
+        total_rounds: Number of rounds per game
+        seed: Base seed; game g uses seed + g
+        scores: Output array with shape (n_games, num_players)
+
+    """
+    for g in prange(scores.shape[0]):
+        play_game(strategies, params, total_rounds, seed + g, scores[g])
@@ -0,0 +1,60 @@
+"""Compiled strategy sweeps.
+
+Plays whole games through the kernel in bank.experiments._numba_core, which
+Numba compiles to native code when it is installed. Players are described
+by (strategy, parameter) pairs instead of Agent objects:
+
+    ("threshold", 50)     ThresholdAgent(threshold=50)
+    ("leader_plus", 2)    LeaderPlusTwoAgent (plus_n=2; 0 is LeaderOnlyAgent)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bank.experiments._numba_core import STRATEGY_LEADER_PLUS, STRATEGY_THRESHOLD, play_games
+
+STRATEGIES = {
+    "threshold": STRATEGY_THRESHOLD,
+    "leader_plus": STRATEGY_LEADER_PLUS,
+}
+
+
+def simulate_games(
+    players: Sequence[tuple[str, int]],
+    n_games: int,
+    seed: int = 0,
+    total_rounds: int = 10,
+) -> np.ndarray:
+    """Play many independent games with the compiled kernel.
+
+    Game ``i`` draws its dice from a generator seeded with ``seed + i``.
+    With numba installed the games run in parallel across CPU cores.
+
+    Args:
+        players: (strategy name, parameter) for each player
+        n_games: Number of games to play
+        seed: Base seed; game i uses seed + i
+        total_rounds: Number of rounds per game
+
+    Returns:
+        Final scores with shape (n_games, num_players)
+
+    Raises:
+        ValueError: If a strategy name is unknown
+
+    """
+    strategies = np.empty(len(players), dtype=np.int8)
+    params = np.empty(len(players), dtype=np.int64)
+    for i, (name, param) in enumerate(players):
+        if name not in STRATEGIES:
+            msg = f"Unknown strategy: {name}. Choose from {sorted(STRATEGIES)}"
+            raise ValueError(msg)
+        strategies[i] = STRATEGIES[name]
+        params[i] = param
+
+    scores = np.zeros((n_games, len(players)), dtype=np.int64)
+    play_games(strategies, params, total_rounds, seed, scores)
+    return scores
@@ -0,0 +1,98 @@
+"""Process-parallel game simulation.
+
+Games share no state, so a sweep of many games is embarrassingly parallel.
+The helpers here scatter independent, seeded games across CPU cores with a
+process pool (the GIL rules out threads for this pure-Python CPU work).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from bank.agents.rule_based import ThresholdAgent
+from bank.game.engine import BankGame
+
+
+def pool_context() -> multiprocessing.context.BaseContext:
+    """Return the multiprocessing context for game worker pools.
+
+    Uses forkserver where available and spawn elsewhere, never fork: the
+    parent may hold Numba worker threads (see bank.experiments.compiled),
+    which a forked child inherits as locked. Callers need the usual
+    ``if __name__ == "__main__"`` guard, since workers re-import the main
+    module.
+
+    Returns:
+        Context to create pools or ProcessPoolExecutors from
+
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _run_one(seed: int, thresholds: tuple[int, ...], total_rounds: int) -> np.ndarray:
+    """Play a single seeded game between threshold agents.
+
+    Args:
+        seed: Seed for the game's dice RNG
+        thresholds: Banking threshold for each player
+        total_rounds: Number of rounds to play
+
+    Returns:
+        Final score of each player, shape (num_players,)
+
+    """
+    agents = [ThresholdAgent(i, threshold=t) for i, t in enumerate(thresholds)]
+    game = BankGame(
+        num_players=len(agents),
+        agents=agents,
+        total_rounds=total_rounds,
+        rng=random.Random(seed),
+    )
+    state = game.play_game()
+    return state.scores_arr.copy()
+
+
+def run_tournament(
+    thresholds: list[int],
+    n_games: int,
+    seed: int = 0,
+    workers: int | None = os.cpu_count(),
+    total_rounds: int = 10,
+) -> np.ndarray:
+    """Play many independent games between threshold agents in parallel.
+
+    Game ``i`` is seeded with ``seed + i``, so results are identical for any
+    number of workers.
+
+    Args:
+        thresholds: Banking threshold for each player (one ThresholdAgent per entry)
+        n_games: Number of games to play
+        seed: Base seed; game i uses seed + i
+        workers: Number of worker processes. 1 (or None) plays every game in the
+            calling process.
+        total_rounds: Number of rounds per game
+
+    Returns:
+        Final scores with shape (n_games, num_players)
+
+    """
+    play = partial(_run_one, thresholds=tuple(thresholds), total_rounds=total_rounds)
+    seeds = range(seed, seed + n_games)
+
+    if not workers or workers <= 1 or n_games <= 1:
+        results = [play(s) for s in seeds]
+    else:
+        chunksize = max(1, n_games // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+            results = list(pool.map(play, seeds, chunksize=chunksize))
+
+    if not results:
+        return np.empty((0, len(thresholds)), dtype=np.int64)
+    return np.stack(results)
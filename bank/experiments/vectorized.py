@@ -0,0 +1,48 @@
+"""Vectorized game simulation.
+
+Plays many threshold-agent games in lockstep with NumPy through
+bank.game.vector_engine.BatchedBankGame: each roll updates the banks of
+every game at once, and every player's banking decision is a single array
+comparison, so no BankGame, PlayerState or Agent objects are created per game.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bank.game.vector_engine import BatchedBankGame
+
+
+def simulate_threshold_games(
+    thresholds: Sequence[int],
+    n_games: int,
+    seed: int = 0,
+    total_rounds: int = 10,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Play many games between threshold agents, all games at once.
+
+    Follows the engine's rules with simultaneous polling: after every roll
+    that does not end the round, each player still in the round banks if
+    the bank has reached their threshold (as ThresholdAgent does). Rounds
+    are independent, so all games play round r together.
+
+    Dice come from a NumPy generator, so results match BankGame
+    statistically but not game for game; use
+    bank.experiments.parallel.run_tournament for seed-exact replays.
+
+    Args:
+        thresholds: Banking threshold for each player
+        n_games: Number of games to play
+        seed: Seed for the dice generator (ignored if rng is given)
+        total_rounds: Number of rounds per game
+        rng: Optional generator to draw dice from
+
+    Returns:
+        Final scores with shape (n_games, num_players)
+
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    return BatchedBankGame(thresholds, n_games, total_rounds=total_rounds, rng=rng).play_all()
@@ -5,12 +5,20 @@ Core game logic and rules implementation for the BANK! dice game.
 
 from __future__ import annotations
 
+import asyncio
 import random
-from typing import TYPE_CHECKING
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
 
-from bank.game.state import GameState, PlayerState, RoundState
+from bank.game.features import fill_features
+from bank.game.state import GameState, PlayerState, RoundState, unpack_roll
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy as np
+
     from bank.agents.base import Action, Agent, Observation
     from bank.replay.recorder import GameRecorder
 
@@ -23,6 +31,18 @@ DOUBLE_MULTIPLIER = 2
 MIN_PLAYERS = 2
 
 
+class _PollSummary(NamedTuple):
+    """Values shared by every observation built during one poll."""
+
+    top_slot: int
+    top_score: int
+    runner_up_score: int
+    ascending_scores: list[int]
+    all_player_scores: Mapping[int, int]
+    active_player_ids: frozenset[int]
+    active_mask: int
+
+
 class BankGame:
     """Main game engine for BANK! dice game.
 
@@ -124,9 +144,8 @@ class BankGame:
         else:
             round_number = self.state.current_round.round_number + 1
 
-        # Reset all players' banking status
-        for player in self.state.players:
-            player.has_banked_this_round = False
+        # Reset all players' banking status in one vectorized write
+        self.state.banked_arr[:] = False
 
         # Create new round with all players active
         active_player_ids = {p.player_id for p in self.state.players}
@@ -178,7 +197,7 @@ class BankGame:
 
         # Update round state
         self.state.current_round.roll_count += 1
-        self.state.current_round.last_roll = (die1, die2)
+        self.state.current_round.set_last_roll(die1, die2)
 
         # Determine if we're in first three rolls
         is_first_three = self.state.current_round.is_first_three_rolls()
@@ -222,6 +241,50 @@ class BankGame:
         Returns:
             Observation dictionary for the player
 
+        """
+        return self._create_observation(player_id, self._poll_summary())
+
+    def _poll_summary(self) -> _PollSummary:
+        """Summarize the scores and active players for building observations.
+
+        Returns:
+            Leaders, score snapshots and an active-player snapshot for this poll
+
+        """
+        scores = self.state.scores_arr.tolist()
+        top_slot = max(range(len(scores)), key=scores.__getitem__)
+        runner_up = max(scores[:top_slot] + scores[top_slot + 1 :], default=0)
+        # Read-only, since every observation in the poll shares it
+        score_map = MappingProxyType(dict(zip((p.player_id for p in self.state.players), scores, strict=True)))
+        active_ids = frozenset(self.state.current_round.active_player_ids if self.state.current_round else ())
+        active_mask = 0
+        for pid in active_ids:
+            active_mask |= 1 << pid
+        return _PollSummary(
+            top_slot,
+            scores[top_slot],
+            runner_up,
+            sorted(scores),
+            score_map,
+            active_ids,
+            active_mask,
+        )
+
+    def _create_observation(self, player_id: int, summary: _PollSummary) -> Observation:
+        """Create an observation using a precomputed poll summary.
+
+        Polling computes ``summary`` once per poll with _poll_summary() so
+        each player's max_opponent_score and rank are lookups rather than
+        scans, and all observations share one snapshot of the scores and
+        active players.
+
+        Args:
+            player_id: ID of the player to create observation for
+            summary: Result of _poll_summary() for the current state
+
+        Returns:
+            Observation dictionary for the player
+
         """
         if not self.state.current_round:
             msg = "Cannot create observation: no active round"
@@ -240,11 +303,60 @@ class BankGame:
             roll_count=self.state.current_round.roll_count,
             current_bank=self.state.current_round.current_bank,
             last_roll=self.state.current_round.last_roll,
-            active_player_ids=self.state.current_round.active_player_ids.copy(),
+            active_player_ids=summary.active_player_ids,
+            active_mask=summary.active_mask,
             player_id=player_id,
             player_score=player.score,
             can_bank=not player.has_banked_this_round,
-            all_player_scores={p.player_id: p.score for p in self.state.players},
+            all_player_scores=summary.all_player_scores,
+            all_player_scores_arr=self.state.scores_view,
+            max_opponent_score=summary.runner_up_score if player.slot == summary.top_slot else summary.top_score,
+            my_rank=len(summary.ascending_scores) - bisect_right(summary.ascending_scores, player.score) + 1,
+        )
+
+    def fill_observation_array(self, player_id: int, total_rounds: int, out: np.ndarray) -> None:
+        """Write a player's observation features straight into an array.
+
+        Equivalent to flattening create_observation(player_id), but reads the
+        round state and score array directly, so no Observation dict is built.
+
+        Args:
+            player_id: ID of the player to observe for
+            total_rounds: Total rounds in the game (for normalization)
+            out: Float32 array of shape (14,) to write into
+
+        Raises:
+            RuntimeError: If there is no active round
+            ValueError: If player_id is invalid
+
+        """
+        current_round = self.state.current_round
+        if not current_round:
+            msg = "Cannot create observation: no active round"
+            raise RuntimeError(msg)
+
+        player = self.state.get_player(player_id)
+        if not player:
+            msg = f"Invalid player_id: {player_id}"
+            raise ValueError(msg)
+
+        last_roll = unpack_roll(current_round.last_roll_packed)
+        die1, die2 = last_roll if last_roll is not None else (0, 0)
+
+        fill_features(
+            float(die1),
+            float(die2),
+            float(current_round.round_number),
+            1.0 / total_rounds,
+            float(current_round.roll_count),
+            float(current_round.current_bank),
+            float(player.score),
+            not player.has_banked_this_round,
+            float(len(current_round.active_player_ids)),
+            float(len(self.state.players)),
+            self.state.scores_view,
+            player.slot,
+            out,
         )
 
     def poll_decisions(self) -> list[int]:
@@ -268,12 +380,7 @@ class BankGame:
             # No agents configured, return empty list
             return []
 
-        # Get active players who can still bank
-        active_ids = [
-            pid
-            for pid in self.state.current_round.active_player_ids
-            if not self.state.get_player(pid).has_banked_this_round  # type: ignore[union-attr]
-        ]
+        active_ids = self._get_pollable_player_ids()
 
         if self.deterministic_polling:
             # Sequential polling: process each decision immediately
@@ -281,6 +388,87 @@ class BankGame:
         # Async polling: collect all decisions, then process simultaneously
         return self._poll_simultaneous(active_ids)
 
+    async def poll_decisions_async(self) -> list[int]:
+        """Poll all active players for banking decisions concurrently.
+
+        Asyncio counterpart of poll_decisions() for agents whose decisions are
+        I/O-bound (e.g. network or model-server backed). Each agent's aact()
+        coroutine is scheduled with asyncio.gather, so the latency of a poll is
+        the slowest agent rather than the sum of all agents. Synchronous agents
+        work unchanged: the default Agent.aact() runs act() in a worker thread.
+
+        Deterministic mode awaits agents one at a time in player ID order and
+        processes each banking action immediately, matching poll_decisions().
+
+        Returns:
+            List of player IDs who banked during this poll
+
+        Raises:
+            Exception: Re-raises the first exception raised by an agent, after
+                all other agents have finished deciding
+
+        """
+        if not self.state.current_round:
+            return []
+
+        if not self.agents:
+            return []
+
+        active_ids = self._get_pollable_player_ids()
+
+        if self.deterministic_polling:
+            banked_players = []
+            for player_id in sorted(active_ids):
+                agent = self._get_agent(player_id)
+                if agent is None:
+                    continue
+                action: Action = await agent.aact(self.create_observation(player_id))
+                if action == "bank" and self.player_banks(player_id):
+                    banked_players.append(player_id)
+            return banked_players
+
+        # Build every observation before awaiting anything so all agents see
+        # the same bank state, as in simultaneous synchronous polling
+        polled = [(pid, agent) for pid in active_ids if (agent := self._get_agent(pid)) is not None]
+        summary = self._poll_summary()
+        tasks = [agent.aact(self._create_observation(pid, summary)) for pid, agent in polled]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        decisions: dict[int, Action] = {}
+        for (player_id, _), result in zip(polled, results, strict=True):
+            if isinstance(result, BaseException):
+                raise result
+            decisions[player_id] = result
+
+        return self._process_simultaneous_decisions(decisions)
+
+    def _get_pollable_player_ids(self) -> list[int]:
+        """Get IDs of players in the current round who can still bank.
+
+        Returns:
+            List of player IDs that are active and have not banked
+
+        """
+        return [
+            pid
+            for pid in self.state.current_round.active_player_ids  # type: ignore[union-attr]
+            if not self.state.get_player(pid).has_banked_this_round  # type: ignore[union-attr]
+        ]
+
+    def _get_agent(self, player_id: int) -> Agent | None:
+        """Get the agent controlling a player, if any.
+
+        Args:
+            player_id: ID of the player
+
+        Returns:
+            The Agent instance, or None if the slot is empty or externally controlled
+
+        """
+        if not self.agents or player_id >= len(self.agents):
+            return None
+        return self.agents[player_id]
+
     def _poll_deterministic(self, active_ids: list[int]) -> list[int]:
         """Poll agents sequentially in order, processing each decision immediately.
 
@@ -321,8 +509,10 @@ class BankGame:
             List of player IDs who banked
 
         """
-        # Collect all decisions without processing any yet
-        decisions: dict[int, Action] = {}
+        # Everyone sees the same state, so summarize it once per poll
+        summary = self._poll_summary()
+        # Group agents by class so each class decides in one act_batch() call
+        groups: dict[type[Agent], tuple[list[int], list[Agent], list[Observation]]] = {}
         for player_id in active_ids:
             if player_id >= len(self.agents):  # type: ignore[arg-type]
                 continue  # No agent for this player
@@ -331,11 +521,28 @@ class BankGame:
             if agent is None:
                 continue  # Agent slot is None (externally controlled)
 
-            observation = self.create_observation(player_id)
-            action: Action = agent.act(observation)
-            decisions[player_id] = action
+            ids, agents, observations = groups.setdefault(type(agent), ([], [], []))
+            ids.append(player_id)
+            agents.append(agent)
+            observations.append(self._create_observation(player_id, summary))
 
-        # Now process all banking decisions together
+        # Collect all decisions without processing any yet
+        decisions: dict[int, Action] = {}
+        for agent_cls, (ids, agents, observations) in groups.items():
+            decisions.update(zip(ids, agent_cls.act_batch(agents, observations), strict=True))
+
+        return self._process_simultaneous_decisions(decisions)
+
+    def _process_simultaneous_decisions(self, decisions: dict[int, Action]) -> list[int]:
+        """Apply a set of simultaneously collected decisions.
+
+        Args:
+            decisions: Mapping of player ID to the action that player chose
+
+        Returns:
+            List of player IDs who banked
+
+        """
         # Use sorted order for consistent results when multiple players bank
         banked_players = []
         for player_id in sorted(decisions.keys()):
@@ -473,8 +680,10 @@ class BankGame:
         winner_ids = []
         winner_names = []
         if self.state.players:
-            max_score = max(p.score for p in self.state.players)
-            winners = [p for p in self.state.players if p.score == max_score]
+            # Read the shared score array once rather than each player's score
+            scores = self.state.scores_arr.tolist()
+            max_score = max(scores)
+            winners = [p for p, score in zip(self.state.players, scores, strict=True) if score == max_score]
             winner_ids = [w.player_id for w in winners]
             winner_names = [w.name for w in winners]
             # Set first winner as the winner (legacy single-winner field)
@@ -574,6 +783,75 @@ class BankGame:
 
         return self.state
 
+    def play_game_fast(self) -> GameState:
+        """Play a complete game with the compiled kernel when the agents allow it.
+
+        Games in which every agent is a plain ThresholdAgent or a LeaderPlusN
+        agent are played start to finish by bank.experiments._numba_core,
+        which Numba compiles to native code when installed. The kernel draws
+        its dice from its own generator seeded from this game's rng, so the
+        game is reproducible from that rng but plays out differently from
+        play_game() with the same seed. The agents' own state is not advanced.
+
+        Anything the kernel cannot play falls back to play_game(): other agent
+        classes, a recorder, deterministic polling, or a game already underway.
+
+        Returns:
+            The final GameState after all rounds are complete
+
+        Raises:
+            RuntimeError: If agents are not configured
+
+        """
+        strategies = self._compiled_strategies()
+        if strategies is None:
+            return self.play_game()
+
+        from bank.experiments._numba_core import play_game
+
+        play_game(*strategies, self.state.total_rounds, self.rng.getrandbits(48), self.state.scores_arr)
+        self._end_game()
+        return self.state
+
+    def _compiled_strategies(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Describe the agents as compiled-kernel strategies, if possible.
+
+        Returns:
+            (strategy IDs, parameters) per player, or None if play_game_fast()
+            must fall back to play_game()
+
+        """
+        if (
+            not self.agents
+            or None in self.agents
+            or self.recorder is not None
+            or self.deterministic_polling
+            or self.state.current_round is not None
+            or self.state.game_over
+            or any(self.state.scores_arr)
+        ):
+            return None
+
+        import numpy as np
+
+        from bank.agents.advanced_agents import LeaderPlusBaseAgent
+        from bank.agents.rule_based import ThresholdAgent
+        from bank.experiments._numba_core import STRATEGY_LEADER_PLUS, STRATEGY_THRESHOLD
+
+        strategies = np.empty(len(self.agents), dtype=np.int8)
+        params = np.empty(len(self.agents), dtype=np.int64)
+        for i, agent in enumerate(self.agents):
+            if type(agent) is ThresholdAgent:
+                strategies[i], params[i] = STRATEGY_THRESHOLD, agent.threshold
+            elif isinstance(agent, LeaderPlusBaseAgent) and all(
+                getattr(type(agent), method) is getattr(LeaderPlusBaseAgent, method)
+                for method in ("act", "on_new_round")
+            ):
+                strategies[i], params[i] = STRATEGY_LEADER_PLUS, agent.plus_n
+            else:
+                return None
+        return strategies, params
+
     def play_round(self) -> None:
         """Play a single round to completion.
 
@@ -593,3 +871,62 @@ class BankGame:
             # Poll agents for banking decisions (if round not ended by seven)
             if not self.is_round_over():
                 self.poll_decisions()
+
+    def play_round_until(self, max_rolls: int) -> list[tuple[tuple[int, int], list[int]]]:
+        """Advance the current round by up to max_rolls rolls in one call.
+
+        Each roll is processed and, unless it ended the round, followed by a
+        decision poll, exactly as in play_round(). Stops early when the round
+        ends, so callers can inspect the state between batches of rolls.
+
+        Args:
+            max_rolls: Maximum number of rolls to make
+
+        Returns:
+            One (dice roll, IDs of players who banked) entry per roll made;
+            empty if no round is in progress
+
+        """
+        rolls: list[tuple[tuple[int, int], list[int]]] = []
+        while len(rolls) < max_rolls and not self.is_round_over():
+            roll = self.process_roll()
+            banked = self.poll_decisions() if not self.is_round_over() else []
+            rolls.append((roll, banked))
+        return rolls
+
+    async def play_game_async(self) -> GameState:
+        """Play a complete game, polling agents concurrently each roll.
+
+        Asyncio counterpart of play_game(); see poll_decisions_async().
+
+        Returns:
+            The final GameState after all rounds are complete
+
+        Raises:
+            RuntimeError: If agents are not configured
+
+        """
+        if self.agents is None:
+            msg = "Cannot play game without agents. Provide agents in constructor."
+            raise RuntimeError(msg)
+
+        while not self.is_game_over():
+            await self.play_round_async()
+
+        return self.state
+
+    async def play_round_async(self) -> None:
+        """Play a single round to completion, polling agents concurrently.
+
+        Mirrors play_round(). Rolling and the seven check stay sequential since
+        every decision depends on the dice result; only the agent polling
+        between rolls is concurrent.
+
+        """
+        self.start_new_round()
+
+        while not self.is_round_over():
+            self.process_roll()
+
+            if not self.is_round_over():
+                await self.poll_decisions_async()
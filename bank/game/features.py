@@ -0,0 +1,126 @@
+"""Observation feature encoding for BANK!
+
+Numeric kernel that turns a player's view of the game into the fixed-size,
+tanh-normalized feature vector used for reinforcement learning. It works on
+plain scalars and the game's score array, so the engine can fill features
+straight from its state without building an Observation dict.
+
+Features (all bounded to [-1, 1]):
+    0. round_number / total_rounds - Game progress (exact: [0, 1])
+    1. tanh(roll_count / 7.0) - Rolls this round
+    2. tanh(current_bank / 250.0) - Points in bank (250 → 0.76, 500 → 0.95)
+    3. die1 / 6.0 - First die value (exact: [0, 1]) or 0 if no roll
+    4. die2 / 6.0 - Second die value (exact: [0, 1]) or 0 if no roll
+    5. is_first_three - Binary flag (exact: {0, 1})
+    6. tanh(player_score / 500.0) - Player's score (500 → 0.76, 1000 → 0.96)
+    7. can_bank - Binary flag (exact: {0, 1})
+    8. num_active / num_players - Active players ratio (exact: [0, 1])
+    9. tanh(avg_opponent / 500.0) - Average opponent score
+    10. tanh(max_opponent / 500.0) - Best opponent score
+    11. tanh(min_opponent / 500.0) - Worst opponent score
+    12. is_leading - Binary flag (exact: {0, 1})
+    13. tanh(score_gap / 500.0) - Gap to best opponent (centered at 0)
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from bank.utils.jit import njit
+
+# Number of features written by fill_features
+OBS_SIZE = 14
+
+# Reciprocals of the feature scale factors
+_INV_6 = 1.0 / 6.0
+_INV_7 = 1.0 / 7.0
+_INV_250 = 1.0 / 250.0
+_INV_500 = 1.0 / 500.0
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def fill_features(
+    die1: float,
+    die2: float,
+    round_number: float,
+    inv_total_rounds: float,
+    roll_count: float,
+    current_bank: float,
+    player_score: float,
+    can_bank: bool,
+    num_active: float,
+    num_players: float,
+    scores: np.ndarray,
+    player_index: int,
+    out: np.ndarray,
+) -> None:
+    """Write the 14 observation features into ``out``.
+
+    Compiled with numba when it is installed. Dice are raw values (0 if no
+    roll) and opponent statistics are taken over every entry of ``scores``
+    except ``player_index``.
+
+    Args:
+        die1: First die of the last roll, or 0 if no roll yet
+        die2: Second die of the last roll, or 0 if no roll yet
+        round_number: Current round number
+        inv_total_rounds: 1 / total rounds in the game
+        roll_count: Rolls made this round
+        current_bank: Points in the bank
+        player_score: The player's score
+        can_bank: Whether the player can still bank this round
+        num_active: Players still active in the round
+        num_players: Players in the game
+        scores: Every player's score
+        player_index: The player's position in ``scores``
+        out: Float32 array of shape (14,) to write into
+
+    """
+    # Opponent statistics in one pass over the score array
+    num_opponents = 0
+    total = 0.0
+    max_opponent = 0.0
+    min_opponent = 0.0
+    for i in range(scores.shape[0]):
+        if i == player_index:
+            continue
+        score = float(scores[i])
+        if num_opponents == 0:
+            max_opponent = score
+            min_opponent = score
+        else:
+            max_opponent = max(max_opponent, score)
+            min_opponent = min(min_opponent, score)
+        total += score
+        num_opponents += 1
+
+    if num_opponents > 0:
+        avg_opponent = total / num_opponents
+        is_leading = 1.0 if player_score > max_opponent else 0.0
+        score_gap = player_score - max_opponent
+    else:
+        # Single player edge case
+        avg_opponent = 0.0
+        max_opponent = 0.0
+        min_opponent = 0.0
+        is_leading = 1.0
+        score_gap = 0.0
+
+    # Tanh normalization for unbounded features; scale factors are
+    # precomputed reciprocals so each feature costs a multiply, not a divide
+    out[0] = round_number * inv_total_rounds  # Exact [0, 1]
+    out[1] = math.tanh(roll_count * _INV_7)  # ~7 rolls typical
+    out[2] = math.tanh(current_bank * _INV_250)  # ~250 typical, 500 high
+    out[3] = die1 * _INV_6  # Exact [0, 1]
+    out[4] = die2 * _INV_6  # Exact [0, 1]
+    out[5] = 1.0 if roll_count <= 3.0 else 0.0  # Exact {0, 1}
+    out[6] = math.tanh(player_score * _INV_500)  # ~500 typical, 1000+ high
+    out[7] = 1.0 if can_bank else 0.0  # Exact {0, 1}
+    out[8] = num_active / num_players  # Exact [0, 1]
+    out[9] = math.tanh(avg_opponent * _INV_500)  # ~500 typical
+    out[10] = math.tanh(max_opponent * _INV_500)  # ~500 typical
+    out[11] = math.tanh(min_opponent * _INV_500)  # ~500 typical
+    out[12] = is_leading  # Exact {0, 1}
+    out[13] = math.tanh(score_gap * _INV_500)  # Centered at 0, ±500 is ±0.76
@@ -3,26 +3,121 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 # Magic number for first three rolls special rules
 FIRST_THREE_ROLLS = 3
 
+# Sentinel for "no roll yet" in RoundState's packed last-roll storage
+NO_ROLL = -1
+
+
+def pack_roll(die1: int, die2: int) -> int:
+    """Pack two dice (1-6) into a single int as ``(d1-1)<<3 | (d2-1)``.
+
+    Args:
+        die1: Value of the first die (1-6)
+        die2: Value of the second die (1-6)
+
+    Returns:
+        Packed roll using the low 6 bits
+
+    """
+    return ((die1 - 1) << 3) | (die2 - 1)
+
+
+def unpack_roll(packed: int) -> tuple[int, int] | None:
+    """Unpack a roll produced by pack_roll.
+
+    Args:
+        packed: Packed roll, or NO_ROLL
+
+    Returns:
+        Tuple of (die1, die2), or None if packed is NO_ROLL
+
+    """
+    if packed < 0:
+        return None
+    return ((packed >> 3) & 7) + 1, (packed & 7) + 1
+
+
+class _SlotField:
+    """Dataclass field descriptor whose value can live in a shared array.
+
+    Until the owning PlayerState is bound (see PlayerState.bind) the value is
+    stored on the instance; afterwards reads and writes go to
+    ``array[player.slot]``, where ``array`` is the instance attribute named by
+    ``array_attr``.
+    """
+
+    def __init__(self, default: Any, array_attr: str, cast: type) -> None:
+        self._default = default
+        self._array_attr = array_attr
+        self._cast = cast
+        self._local = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._local = f"_{name}_value"
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            # Class access; dataclass reads the field default this way
+            return self._default
+        array = getattr(obj, self._array_attr)
+        if array is None:
+            return obj.__dict__[self._local]
+        return self._cast(array[obj.slot])
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        array = getattr(obj, self._array_attr)
+        if array is None:
+            obj.__dict__[self._local] = value
+        else:
+            array[obj.slot] = value
+
 
 @dataclass
 class PlayerState:
     """Represents the state of a single player in the BANK! dice game.
 
+    Once a GameState binds the player, ``score`` and ``has_banked_this_round``
+    are stored in the game's shared ``scores_arr``/``banked_arr`` at index
+    ``slot``.
+
     Attributes:
         player_id: Unique identifier for the player
         name: Display name for the player
         score: Total accumulated score across all rounds
         has_banked_this_round: Whether the player has banked in the current round
+        slot: Index into the owning GameState's arrays, or -1 if unbound
 
     """
 
     player_id: int
     name: str
-    score: int = 0
-    has_banked_this_round: bool = False
+    score: int = _SlotField(0, "_scores_ref", int)  # type: ignore[assignment]
+    has_banked_this_round: bool = _SlotField(False, "_banked_ref", bool)  # type: ignore[assignment]
+    slot: int = field(default=-1, init=False, repr=False, compare=False)
+    _scores_ref: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _banked_ref: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
+    def bind(self, scores: np.ndarray, banked: np.ndarray, slot: int) -> None:
+        """Back this player's score and banked flag by slots in shared arrays.
+
+        The current values are copied into the arrays first, so binding (or
+        rebinding to larger arrays) never loses state.
+
+        Args:
+            scores: Shared int64 score array owned by a GameState
+            banked: Shared bool array of banked flags owned by a GameState
+            slot: This player's index into both arrays
+
+        """
+        scores[slot] = self.score
+        banked[slot] = self.has_banked_this_round
+        self._scores_ref = scores
+        self._banked_ref = banked
+        self.slot = slot
 
     def to_dict(self) -> dict[str, Any]:
         """Convert player state to a dictionary for serialization."""
@@ -48,6 +143,23 @@ class PlayerState:
         return f"Player({self.name}, score={self.score}, banked={self.has_banked_this_round})"
 
 
+class _PackedRoll:
+    """Dataclass field descriptor that keeps RoundState.last_roll packed.
+
+    Reads unpack ``last_roll_packed`` into a (die1, die2) tuple (or None);
+    writes pack the tuple back.
+    """
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> tuple[int, int] | None:
+        if obj is None:
+            # Class access; dataclass reads the field default this way
+            return None
+        return unpack_roll(obj.last_roll_packed)
+
+    def __set__(self, obj: Any, value: tuple[int, int] | None) -> None:
+        obj.last_roll_packed = NO_ROLL if value is None else pack_roll(value[0], value[1])
+
+
 @dataclass
 class RoundState:
     """Represents the state of the current round in the BANK! game.
@@ -58,15 +170,30 @@ class RoundState:
         current_bank: Current points available in the bank
         last_roll: The most recent dice roll (die1, die2) or None if no roll yet
         active_player_ids: Set of player IDs still active (not yet banked) in this round
+        last_roll_packed: last_roll in pack_roll form, or NO_ROLL
 
     """
 
     round_number: int
     roll_count: int = 0
     current_bank: int = 0
-    last_roll: tuple[int, int] | None = None
+    # Rolls are stored packed (see pack_roll) and only unpacked into a tuple
+    # when last_roll is read. Declared before last_roll so __init__ sets its
+    # default first and a last_roll argument then overwrites it.
+    last_roll_packed: int = field(default=NO_ROLL, init=False, repr=False, compare=False)
+    last_roll: tuple[int, int] | None = _PackedRoll()  # type: ignore[assignment]
     active_player_ids: set[int] = field(default_factory=set)
 
+    def set_last_roll(self, die1: int, die2: int) -> None:
+        """Record a roll without building a tuple.
+
+        Args:
+            die1: Value of the first die (1-6)
+            die2: Value of the second die (1-6)
+
+        """
+        self.last_roll_packed = pack_roll(die1, die2)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert round state to a dictionary for serialization."""
         return {
@@ -111,6 +238,12 @@ class GameState:
         total_rounds: Total number of rounds to play (10, 15, or 20)
         game_over: Whether the game has ended
         winner: Player ID of the winner, or None if game isn't over
+        scores_arr: Structure-of-arrays view of all player scores (int64),
+            indexed by position in ``players``. PlayerState.score reads and
+            writes this array, so numeric kernels can operate on it in place.
+            Add players with add_player() so they are bound to it.
+        banked_arr: Parallel bool array of has_banked_this_round flags
+        scores_view: Read-only view of ``scores_arr`` handed out to agents
 
     """
 
@@ -119,6 +252,51 @@ class GameState:
     current_round: RoundState | None = None
     game_over: bool = False
     winner: int | None = None
+    scores_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    banked_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    scores_view: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Allocate the shared score arrays and bind every player to them."""
+        self._bind_players()
+
+    def _bind_players(self) -> None:
+        """(Re)allocate scores_arr/banked_arr for ``players`` and bind them all."""
+        num_players = len(self.players)
+        self.scores_arr = np.zeros(num_players, dtype=np.int64)
+        self.banked_arr = np.zeros(num_players, dtype=np.bool_)
+        for slot, player in enumerate(self.players):
+            player.bind(self.scores_arr, self.banked_arr, slot)
+        self._make_scores_view()
+
+    def _make_scores_view(self) -> None:
+        """Point scores_view at a fresh read-only view of scores_arr."""
+        self.scores_view = self.scores_arr.view()
+        self.scores_view.flags.writeable = False
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore after copy.deepcopy or unpickling.
+
+        Players come back bound to the copied scores_arr (it is the same
+        object in the copy), but a copied view is an independent, writeable
+        array, so scores_view is derived again.
+        """
+        self.__dict__.update(state)
+        self._make_scores_view()
+
+    def add_player(self, player: PlayerState) -> None:
+        """Add a player after construction and bind it to the score arrays.
+
+        Use this instead of appending to ``players`` directly. The arrays are
+        reallocated, so views taken from scores_arr/scores_view before the
+        call keep showing the old players only.
+
+        Args:
+            player: Player to add; its current score and banked flag are kept
+
+        """
+        self.players.append(player)
+        self._bind_players()
 
     @property
     def num_players(self) -> int:
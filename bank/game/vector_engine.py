@@ -0,0 +1,123 @@
+"""BANK! Game Engine - batched threshold games.
+
+Advances many independent games in lockstep with NumPy. State is kept as
+arrays (structure of arrays) rather than GameState/PlayerState objects:
+one row per game, one column per player. Every player is a threshold
+agent, so each player's banking decision is a single array comparison.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bank.game.engine import DICE_FACES, DOUBLE_MULTIPLIER, NUM_DICE, SEVEN_BONUS_POINTS, SEVEN_VALUE
+from bank.game.state import FIRST_THREE_ROLLS
+
+
+class BatchedBankGame:
+    """Many games between threshold agents, advanced one roll at a time.
+
+    Follows BankGame's rules with simultaneous polling: after every roll that
+    does not end the round, each player still in the round banks if the bank
+    has reached their threshold (as ThresholdAgent does). All games play the
+    same round together; a game whose round has ended waits for the others.
+
+    Attributes:
+        thresholds: Banking threshold for each player, shape (num_players,)
+        total_rounds: Number of rounds per game
+        scores: Score of every player in every game, shape (num_games, num_players)
+        bank: Current bank of each game, shape (num_games,)
+        active: Whether each player is still in the round, shape (num_games, num_players)
+        in_round: Whether each game's current round is still going, shape (num_games,)
+        round_number: Current round (1-based; 0 before the first round)
+        roll_count: Rolls made in the current round
+
+    """
+
+    def __init__(
+        self,
+        thresholds: Sequence[int],
+        num_games: int,
+        total_rounds: int = 10,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        """Initialize a batch of games with every score at zero.
+
+        Args:
+            thresholds: Banking threshold for each player
+            num_games: Number of games to play in lockstep
+            total_rounds: Number of rounds per game
+            rng: Generator to draw dice from (default: unseeded)
+
+        """
+        self.thresholds = np.asarray(thresholds, dtype=np.int64)
+        self.total_rounds = total_rounds
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        shape = (num_games, len(self.thresholds))
+        self.scores = np.zeros(shape, dtype=np.int64)
+        self.bank = np.zeros(num_games, dtype=np.int64)
+        self.active = np.zeros(shape, dtype=np.bool_)
+        self.in_round = np.zeros(num_games, dtype=np.bool_)
+        self.round_number = 0
+        self.roll_count = 0
+
+    def is_game_over(self) -> bool:
+        """Check if every game has finished its last round.
+
+        Returns:
+            True once the final round is over in all games
+
+        """
+        return self.round_number >= self.total_rounds and not self.in_round.any()
+
+    def start_new_round(self) -> None:
+        """Start the next round in every game."""
+        self.round_number += 1
+        self.roll_count = 0
+        self.bank[:] = 0
+        self.active[:] = True
+        self.in_round[:] = self.bank.size > 0
+
+    def step(self) -> None:
+        """Roll once in every game still in its round, then poll the players."""
+        self.roll_count += 1
+        dice = self.rng.integers(1, DICE_FACES + 1, size=(self.bank.size, NUM_DICE))
+        dice_sum = dice.sum(axis=1)
+        is_seven = dice_sum == SEVEN_VALUE
+
+        if self.roll_count <= FIRST_THREE_ROLLS:
+            # Sevens add the bonus; doubles count at face value
+            new_bank = self.bank + np.where(is_seven, SEVEN_BONUS_POINTS, dice_sum)
+        else:
+            # Sevens end the round; doubles double the bank
+            is_double = dice[:, 0] == dice[:, 1]
+            new_bank = np.where(is_double, self.bank * DOUBLE_MULTIPLIER, self.bank + dice_sum)
+            self.in_round &= ~is_seven
+        # Finished games keep their bank so it cannot keep doubling
+        self.bank = np.where(self.in_round, new_bank, self.bank)
+
+        # Every still-active player at or over their threshold banks
+        banks_now = self.active & self.in_round[:, None] & (self.bank[:, None] >= self.thresholds)
+        self.scores += np.where(banks_now, self.bank[:, None], 0)
+        self.active &= ~banks_now
+        self.in_round &= self.active.any(axis=1)
+
+    def play_round(self) -> None:
+        """Start a round and roll until it has ended in every game."""
+        self.start_new_round()
+        while self.in_round.any():
+            self.step()
+
+    def play_all(self) -> np.ndarray:
+        """Play every remaining round of every game.
+
+        Returns:
+            Final scores with shape (num_games, num_players)
+
+        """
+        while self.round_number < self.total_rounds:
+            self.play_round()
+        return self.scores
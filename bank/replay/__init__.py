@@ -4,6 +4,22 @@ This module provides functionality for recording, saving, and replaying
 BANK! dice games for analysis, debugging, and demonstration purposes.
 """
 
-from bank.replay.recorder import GameRecorder, load_replay, save_replay
+from bank.replay.recorder import (
+    EventType,
+    GameRecorder,
+    RecordedEvents,
+    iter_replay_events,
+    load_replay,
+    load_replay_streaming,
+    save_replay,
+)
 
-__all__ = ["GameRecorder", "load_replay", "save_replay"]
+__all__ = [
+    "EventType",
+    "GameRecorder",
+    "RecordedEvents",
+    "iter_replay_events",
+    "load_replay",
+    "load_replay_streaming",
+    "save_replay",
+]
@@ -3,10 +3,254 @@
 Records game events during play for later analysis and replay.
 """
 
+import gzip
 import json
+import time
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+
+class EventType(IntEnum):
+    """Integer codes for recorded event types.
+
+    Events are tagged with these codes in memory; the lowercase name (e.g.
+    "round_start") is the type string written to replay files.
+    """
+
+    GAME_START = 0
+    ROUND_START = 1
+    ROLL = 2
+    BANK = 3
+    ROUND_END = 4
+    GAME_END = 5
+
+    @property
+    def label(self) -> str:
+        """Return the type string used in replay files."""
+        return _EVENT_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "EventType":
+        """Look up an event type by its replay-file string.
+
+        Args:
+            label: Type string such as "roll"
+
+        Returns:
+            Matching EventType
+
+        Raises:
+            ValueError: If the label is not a known event type
+
+        """
+        try:
+            return _EVENT_CODES[label]
+        except KeyError:
+            msg = f"Unknown event type: {label}"
+            raise ValueError(msg) from None
+
+
+# Replay-file type strings indexed by code, and the reverse mapping
+_EVENT_LABELS = tuple(event_type.name.lower() for event_type in EventType)
+_EVENT_CODES = {label: EventType(code) for code, label in enumerate(_EVENT_LABELS)}
+
+
+@dataclass(slots=True)
+class GameStartEvent:
+    """Data recorded when a game starts."""
+
+    num_players: int
+    player_names: list[str]
+    total_rounds: int
+    seed: int | None
+    start_time: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the event data to its replay file form."""
+        return {
+            "num_players": self.num_players,
+            "player_names": self.player_names,
+            "total_rounds": self.total_rounds,
+            "seed": self.seed,
+            "start_time": self.start_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GameStartEvent":
+        """Create the event from its replay file form."""
+        return cls(
+            num_players=data["num_players"],
+            player_names=data["player_names"],
+            total_rounds=data["total_rounds"],
+            seed=data["seed"],
+            start_time=data["start_time"],
+        )
+
+
+@dataclass(slots=True)
+class RoundEndEvent:
+    """Data recorded when a round ends."""
+
+    round_number: int
+    reason: str
+    final_bank: int
+    player_scores: dict[int, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the event data to its replay file form."""
+        return {
+            "round_number": self.round_number,
+            "reason": self.reason,
+            "final_bank": self.final_bank,
+            "player_scores": self.player_scores,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RoundEndEvent":
+        """Create the event from its replay file form."""
+        return cls(
+            round_number=data["round_number"],
+            reason=data["reason"],
+            final_bank=data["final_bank"],
+            player_scores=data["player_scores"],
+        )
+
+
+@dataclass(slots=True)
+class GameEndEvent:
+    """Data recorded when a game ends."""
+
+    final_scores: dict[int, int]
+    winner_ids: list[int]
+    winner_names: list[str]
+    end_time: str
+    duration_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the event data to its replay file form."""
+        return {
+            "final_scores": self.final_scores,
+            "winner_ids": self.winner_ids,
+            "winner_names": self.winner_names,
+            "end_time": self.end_time,
+            "duration_seconds": self.duration_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GameEndEvent":
+        """Create the event from its replay file form."""
+        return cls(
+            final_scores=data["final_scores"],
+            winner_ids=data["winner_ids"],
+            winner_names=data["winner_names"],
+            end_time=data["end_time"],
+            duration_seconds=data["duration_seconds"],
+        )
+
+
+RareEvent = GameStartEvent | RoundEndEvent | GameEndEvent
+_RARE_EVENT_CLASSES = {
+    EventType.GAME_START: GameStartEvent,
+    EventType.ROUND_END: RoundEndEvent,
+    EventType.GAME_END: GameEndEvent,
+}
+
+# Leading bytes of every gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
+# Light compression: replay JSON is repetitive enough that higher levels
+# cost far more CPU for little extra ratio
+GZIP_COMPRESSLEVEL = 3
+
+
+def _is_jsonl(filepath: Path) -> bool:
+    """Check whether a replay path uses the JSON Lines format (.jsonl or .jsonl.gz)."""
+    suffixes = filepath.suffixes
+    return bool(suffixes) and (suffixes[-1] == ".jsonl" or suffixes[-2:] == [".jsonl", ".gz"])
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode one compact JSON Lines record, including the trailing newline."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj).encode() + b"\n"
+
+
+def _loads(payload: bytes) -> Any:
+    """Decode JSON with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string."""
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000).isoformat()
+
+
+def _iso_to_ns(timestamp: str) -> int:
+    """Parse an ISO 8601 timestamp written by _ns_to_iso back into nanoseconds."""
+    parsed = datetime.fromisoformat(timestamp)
+    seconds = int(parsed.replace(microsecond=0).timestamp())
+    return seconds * 1_000_000_000 + parsed.microsecond * 1000
+
+
+class RecordedEvents(Sequence):
+    """Read-only sequence of event dicts backed by a recorder's columns.
+
+    Indexing builds just the requested event, in O(1). Event dicts are built
+    fresh on every access, so editing one does not change the recording;
+    record new events with the recorder's record_* or append_event methods.
+    Compares equal to any sequence (e.g. a list) holding the same events.
+    """
+
+    __slots__ = ("_recorder",)
+
+    def __init__(self, recorder: "GameRecorder") -> None:
+        self._recorder = recorder
+
+    def __len__(self) -> int:
+        return self._recorder.num_events
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._recorder.event_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._recorder.event_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str | bytes):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} events)"
 
 
 class GameRecorder:
@@ -14,13 +258,118 @@ class GameRecorder:
 
     Captures all significant game events (rolls, banks, round progression)
     with timestamps for complete game reconstruction.
+
+    Events are stored column-wise: the frequent event types (rolls, banks and
+    round starts) append to typed ``array.array`` columns, and a pair of
+    parallel order columns records each event's type code and row within its
+    type. ``events`` is a lazy read-only view over those columns; event
+    dicts are only built when read, e.g. by ``to_dict()`` at save time.
     """
 
     def __init__(self) -> None:
         """Initialize a new game recorder."""
-        self.events: list[dict[str, Any]] = []
         self.metadata: dict[str, Any] = {}
         self.start_time: datetime | None = None
+        self._stream: IO[bytes] | None = None
+        self._init_columns()
+
+    def _init_columns(self) -> None:
+        """Allocate empty event columns."""
+        # Play-by-play order: type code and row index within that type's columns
+        self._order_type = array("b")
+        self._order_row = array("i")
+        # Raw time.time_ns() values; ISO strings are only built on export
+        self._timestamps = array("q")
+
+        self._round_start_round = array("i")
+
+        self.roll_round = array("i")
+        self.roll_count = array("i")
+        self.roll_die1 = array("b")
+        self.roll_die2 = array("b")
+        self.roll_bank_before = array("q")
+        self.roll_bank_after = array("q")
+
+        self.bank_round = array("i")
+        self.bank_player_id = array("i")
+        self.bank_player_name: list[str] = []
+        self.bank_amount = array("q")
+        self.bank_score_before = array("q")
+        self.bank_score_after = array("q")
+
+        # Rare events (one or two per round/game) as slotted records
+        self._other_data: list[RareEvent] = []
+
+    @property
+    def events(self) -> RecordedEvents:
+        """Read-only view of the recorded events.
+
+        Previously a list of dicts; it is now a lazy Sequence, so indexing
+        is O(1) but the view cannot be appended to and edits to a returned
+        event are not kept. Use list(recorder.events) for a mutable copy.
+
+        Returns:
+            Events in recording order, each with "type", "timestamp" and "data"
+
+        """
+        return RecordedEvents(self)
+
+    @property
+    def num_events(self) -> int:
+        """Return the number of recorded events."""
+        return len(self._order_type)
+
+    def event_at(self, index: int) -> dict[str, Any]:
+        """Build the event dict for the event at a position in recording order.
+
+        Args:
+            index: Position of the event in recording order
+
+        Returns:
+            Event dict with "type", "timestamp" and "data"
+
+        """
+        code = self._order_type[index]
+        return {
+            "type": _EVENT_LABELS[code],
+            "timestamp": _ns_to_iso(self._timestamps[index]),
+            "data": self._event_data(code, self._order_row[index]),
+        }
+
+    def _event_data(self, code: int, row: int) -> dict[str, Any]:
+        """Build the data dict for one stored event.
+
+        Args:
+            code: Event type code
+            row: Row of the event within its type's columns
+
+        Returns:
+            Event data in the replay file format
+
+        """
+        if code == EventType.ROLL:
+            bank_before = self.roll_bank_before[row]
+            bank_after = self.roll_bank_after[row]
+            return {
+                "round_number": self.roll_round[row],
+                "roll_count": self.roll_count[row],
+                "dice": [self.roll_die1[row], self.roll_die2[row]],
+                "bank_before": bank_before,
+                "bank_after": bank_after,
+                "delta": bank_after - bank_before,
+            }
+        if code == EventType.BANK:
+            return {
+                "round_number": self.bank_round[row],
+                "player_id": self.bank_player_id[row],
+                "player_name": self.bank_player_name[row],
+                "amount": self.bank_amount[row],
+                "score_before": self.bank_score_before[row],
+                "score_after": self.bank_score_after[row],
+            }
+        if code == EventType.ROUND_START:
+            return {"round_number": self._round_start_round[row]}
+        return self._other_data[row].to_dict()
 
     def start_game(
         self,
@@ -46,7 +395,7 @@ class GameRecorder:
             "seed": seed,
             "start_time": self.start_time.isoformat(),
         }
-        self._add_event("game_start", self.metadata.copy())
+        self._add_other_event(EventType.GAME_START, GameStartEvent.from_dict(self.metadata))
 
     def record_round_start(self, round_number: int) -> None:
         """Record the start of a round.
@@ -55,7 +404,8 @@ class GameRecorder:
             round_number: Round number (1-based)
 
         """
-        self._add_event("round_start", {"round_number": round_number})
+        self._round_start_round.append(round_number)
+        self._add_event(EventType.ROUND_START, len(self._round_start_round) - 1)
 
     def record_roll(
         self,
@@ -75,17 +425,13 @@ class GameRecorder:
             bank_after: Bank value after roll
 
         """
-        self._add_event(
-            "roll",
-            {
-                "round_number": round_number,
-                "roll_count": roll_count,
-                "dice": list(dice),
-                "bank_before": bank_before,
-                "bank_after": bank_after,
-                "delta": bank_after - bank_before,
-            },
-        )
+        self.roll_round.append(round_number)
+        self.roll_count.append(roll_count)
+        self.roll_die1.append(dice[0])
+        self.roll_die2.append(dice[1])
+        self.roll_bank_before.append(bank_before)
+        self.roll_bank_after.append(bank_after)
+        self._add_event(EventType.ROLL, len(self.roll_round) - 1)
 
     def record_bank(
         self,
@@ -107,17 +453,13 @@ class GameRecorder:
             score_after: Player's score after banking
 
         """
-        self._add_event(
-            "bank",
-            {
-                "round_number": round_number,
-                "player_id": player_id,
-                "player_name": player_name,
-                "amount": amount,
-                "score_before": score_before,
-                "score_after": score_after,
-            },
-        )
+        self.bank_round.append(round_number)
+        self.bank_player_id.append(player_id)
+        self.bank_player_name.append(player_name)
+        self.bank_amount.append(amount)
+        self.bank_score_before.append(score_before)
+        self.bank_score_after.append(score_after)
+        self._add_event(EventType.BANK, len(self.bank_round) - 1)
 
     def record_round_end(
         self,
@@ -132,17 +474,18 @@ class GameRecorder:
             round_number: Round number that ended
             reason: Reason for round end ("all_banked", "seven_rolled")
             final_bank: Final bank value (0 if lost)
-            player_scores: Current scores of all players
+            player_scores: Current scores of all players. The dict is stored
+                by reference, so callers must not mutate it afterwards.
 
         """
-        self._add_event(
-            "round_end",
-            {
-                "round_number": round_number,
-                "reason": reason,
-                "final_bank": final_bank,
-                "player_scores": player_scores.copy(),
-            },
+        self._add_other_event(
+            EventType.ROUND_END,
+            RoundEndEvent(
+                round_number=round_number,
+                reason=reason,
+                final_bank=final_bank,
+                player_scores=player_scores,
+            ),
         )
 
     def record_game_end(
@@ -153,6 +496,9 @@ class GameRecorder:
     ) -> None:
         """Record game end.
 
+        The arguments are stored by reference, so callers must not mutate
+        them afterwards.
+
         Args:
             final_scores: Final scores of all players
             winner_ids: IDs of winning player(s)
@@ -162,32 +508,44 @@ class GameRecorder:
         end_time = datetime.now()
         duration = (end_time - self.start_time).total_seconds() if self.start_time else 0
 
-        self._add_event(
-            "game_end",
-            {
-                "final_scores": final_scores.copy(),
-                "winner_ids": winner_ids,
-                "winner_names": winner_names,
-                "end_time": end_time.isoformat(),
-                "duration_seconds": duration,
-            },
+        self._add_other_event(
+            EventType.GAME_END,
+            GameEndEvent(
+                final_scores=final_scores,
+                winner_ids=winner_ids,
+                winner_names=winner_names,
+                end_time=end_time.isoformat(),
+                duration_seconds=duration,
+            ),
         )
 
-    def _add_event(self, event_type: str, data: dict[str, Any]) -> None:
-        """Add an event to the recording.
+    def _add_event(self, code: EventType, row: int) -> None:
+        """Append an already-stored event to the play-by-play order.
 
         Args:
-            event_type: Type of event
-            data: Event data
+            code: Event type code
+            row: Row of the event within its type's columns
 
         """
-        timestamp = datetime.now()
-        event = {
-            "type": event_type,
-            "timestamp": timestamp.isoformat(),
-            "data": data,
-        }
-        self.events.append(event)
+        self._order_type.append(code)
+        self._order_row.append(row)
+        self._timestamps.append(time.time_ns())
+
+        if self._stream is not None:
+            if code == EventType.GAME_START:
+                self._write_line({"metadata": self.metadata})
+            self._write_line(self.event_at(len(self._order_type) - 1))
+
+    def _add_other_event(self, code: EventType, event: RareEvent) -> None:
+        """Store a rare event record and add it to the recording.
+
+        Args:
+            code: Event type code
+            event: Event record
+
+        """
+        self._other_data.append(event)
+        self._add_event(code, len(self._other_data) - 1)
 
     def to_dict(self) -> dict[str, Any]:
         """Export recording to a dictionary.
@@ -198,12 +556,104 @@ class GameRecorder:
         """
         return {
             "metadata": self.metadata,
-            "events": self.events,
+            "events": list(self.events),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GameRecorder":
+        """Rebuild a recorder's columns from a replay dictionary.
+
+        Args:
+            data: Dictionary produced by to_dict() or load_replay()
+
+        Returns:
+            GameRecorder holding the same events
+
+        Raises:
+            ValueError: If an event has an unknown type
+
+        """
+        recorder = cls()
+        recorder.metadata = data.get("metadata", {})
+        for event in data.get("events", []):
+            recorder.append_event(event)
+        return recorder
+
+    def append_event(self, event: dict[str, Any]) -> None:
+        """Append an event dict in replay file form, keeping its timestamp.
+
+        Args:
+            event: Event with "type", "timestamp" and "data" keys
+
+        Raises:
+            ValueError: If the event has an unknown type
+
+        """
+        code = EventType.from_label(event["type"])
+        data = event["data"]
+        if code == EventType.ROLL:
+            self.record_roll(
+                data["round_number"],
+                data["roll_count"],
+                tuple(data["dice"]),
+                data["bank_before"],
+                data["bank_after"],
+            )
+        elif code == EventType.BANK:
+            self.record_bank(
+                data["round_number"],
+                data["player_id"],
+                data["player_name"],
+                data["amount"],
+                data["score_before"],
+                data["score_after"],
+            )
+        elif code == EventType.ROUND_START:
+            self.record_round_start(data["round_number"])
+        else:
+            self._add_other_event(code, _RARE_EVENT_CLASSES[code].from_dict(data))
+        # Keep the original timestamp rather than the reconstruction time
+        self._timestamps[-1] = _iso_to_ns(event["timestamp"])
+
+    def stream_to(self, filepath: str | Path) -> None:
+        """Also write every event to a JSON Lines file as it is recorded.
+
+        The metadata header is written before the game_start event (or right
+        away if the game has already started, followed by the events recorded
+        so far). Each line is flushed so a crash loses at most the event being
+        written. Paths ending in ``.gz`` are gzip-compressed.
+
+        Args:
+            filepath: Path of the JSON Lines replay to create
+
+        """
+        self.stop_streaming()
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        if filepath.suffix == ".gz":
+            self._stream = gzip.open(filepath, "wb", compresslevel=GZIP_COMPRESSLEVEL)
+        else:
+            self._stream = filepath.open("wb")
+
+        if self.metadata:
+            self._write_line({"metadata": self.metadata})
+            for i in range(len(self._order_type)):
+                self._write_line(self.event_at(i))
+
+    def stop_streaming(self) -> None:
+        """Close the stream opened by stream_to, if any."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        """Append one record to the event stream and flush it."""
+        self._stream.write(_dumps_line(record))  # type: ignore[union-attr]
+        self._stream.flush()  # type: ignore[union-attr]
+
     def clear(self) -> None:
         """Clear all recorded events."""
-        self.events.clear()
+        self._init_columns()
         self.metadata.clear()
         self.start_time = None
 
@@ -211,22 +661,46 @@ class GameRecorder:
 def save_replay(recorder: GameRecorder, filepath: str | Path) -> None:
     """Save a game recording to a file.
 
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise. Both produce JSON with integer dict keys written as
+    strings. Paths ending in ``.jsonl`` are written as JSON Lines (a metadata
+    header line, then one event per line); anything else is a single indented
+    JSON document. Paths ending in ``.gz`` are gzip-compressed.
+
     Args:
         recorder: GameRecorder instance with recorded game
-        filepath: Path to save the replay file (JSON format)
+        filepath: Path to save the replay file (.json or .jsonl, optionally .gz)
 
     """
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    # Encode the whole payload in memory and hand it to the OS in one write
+    # instead of json.dump's per-token writes.
     data = recorder.to_dict()
-    with filepath.open("w") as f:
-        json.dump(data, f, indent=2)
+    if _is_jsonl(filepath):
+        lines = [_dumps_line({"metadata": data["metadata"]})]
+        lines.extend(_dumps_line(event) for event in data["events"])
+        payload = b"".join(lines)
+    elif ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+
+    if filepath.suffix == ".gz":
+        payload = gzip.compress(payload, compresslevel=GZIP_COMPRESSLEVEL)
+
+    with filepath.open("wb") as f:
+        f.write(payload)
 
 
 def load_replay(filepath: str | Path) -> dict[str, Any]:
     """Load a game recording from a file.
 
+    Gzip-compressed replays are detected by their magic bytes, whatever the
+    file name. JSON Lines replays (``.jsonl``) are returned in the same
+    dictionary form as monolithic JSON replays.
+
     Args:
         filepath: Path to the replay file
 
@@ -235,5 +709,99 @@ def load_replay(filepath: str | Path) -> dict[str, Any]:
 
     """
     filepath = Path(filepath)
-    with filepath.open() as f:
-        return json.load(f)
+    if _is_jsonl(filepath):
+        metadata: dict[str, Any] = {}
+        events = []
+        for record in _iter_jsonl(filepath):
+            if "type" in record:
+                events.append(record)
+            else:
+                metadata = record.get("metadata", {})
+        return {"metadata": metadata, "events": events}
+
+    with filepath.open("rb") as f:
+        payload = f.read()
+
+    if payload[:2] == GZIP_MAGIC:
+        payload = gzip.decompress(payload)
+
+    return _loads(payload)
+
+
+def iter_replay_events(filepath: str | Path) -> Iterator[dict[str, Any]]:
+    """Iterate over a replay's events.
+
+    JSON Lines replays are decoded one line at a time, so the whole file is
+    never held in memory. Monolithic JSON replays are loaded in full first.
+
+    Args:
+        filepath: Path to the replay file
+
+    Yields:
+        Event dicts in recording order
+
+    """
+    filepath = Path(filepath)
+    if not _is_jsonl(filepath):
+        yield from load_replay(filepath)["events"]
+        return
+
+    for record in _iter_jsonl(filepath):
+        if "type" in record:
+            yield record
+
+
+def load_replay_streaming(filepath: str | Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Stream a replay as tagged records without loading the whole file.
+
+    Yields ``("metadata", metadata)`` first, then ``("event", event)`` for
+    each event. JSON Lines replays are streamed natively one line at a time.
+    Monolithic JSON replays are stream-parsed with ijson when it is
+    installed, and otherwise fall back to load_replay.
+
+    Args:
+        filepath: Path to the replay file
+
+    Yields:
+        Tuples of (record kind, record)
+
+    """
+    filepath = Path(filepath)
+    if _is_jsonl(filepath):
+        for record in _iter_jsonl(filepath):
+            if "type" in record:
+                yield "event", record
+            else:
+                yield "metadata", record.get("metadata", {})
+        return
+
+    if not IJSON_AVAILABLE:
+        data = load_replay(filepath)
+        yield "metadata", data.get("metadata", {})
+        for event in data.get("events", []):
+            yield "event", event
+        return
+
+    # Metadata is written before the events, so the first pass stops early
+    with _open_replay(filepath) as f:
+        metadata = next(ijson.items(f, "metadata", use_float=True), {})
+    yield "metadata", metadata
+
+    with _open_replay(filepath) as f:
+        for event in ijson.items(f, "events.item", use_float=True):
+            yield "event", event
+
+
+def _open_replay(filepath: Path) -> IO[bytes]:
+    """Open a replay for binary reading, transparently decompressing gzip."""
+    with filepath.open("rb") as raw:
+        compressed = raw.read(2) == GZIP_MAGIC
+    return gzip.open(filepath, "rb") if compressed else filepath.open("rb")
+
+
+def _iter_jsonl(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Decode the records of a (possibly gzip-compressed) JSON Lines file."""
+    with _open_replay(filepath) as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
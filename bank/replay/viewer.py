@@ -3,8 +3,15 @@
 Provides utilities for viewing and analyzing recorded games.
 """
 
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from operator import itemgetter
 from typing import Any
 
+from bank.replay.recorder import EventType, GameRecorder
+
 
 class ReplayViewer:
     """Views and analyzes recorded games.
@@ -21,8 +28,97 @@ class ReplayViewer:
 
         """
         self.metadata = replay_data.get("metadata", {})
-        self.events = replay_data.get("events", [])
+        # A recorder's lazy event view rebuilds an event dict on every access,
+        # so build each event once here for the repeated queries below
+        self.events = list(replay_data.get("events", []))
         self.current_index = 0
+        # Integer event type codes in order, converted once from the file's
+        # type strings and shared by the filters below
+        self.types: list[EventType] = []
+
+        self._standings: list[tuple[Any, int]] | None = None
+        self._score_order: list[Any] | None = None
+
+        # One pass to read types and index events by round and by type, so
+        # per-round and per-type queries don't rescan the whole replay
+        self._by_round: dict[int, list[int]] = {}
+        self._by_type: dict[EventType, list[int]] = {}
+        for i, event in enumerate(self.events):
+            event_type = EventType.from_label(event["type"])
+            self.types.append(event_type)
+            self._by_type.setdefault(event_type, []).append(i)
+            round_number = event.get("data", {}).get("round_number")
+            if round_number is not None:
+                self._by_round.setdefault(round_number, []).append(i)
+
+    @classmethod
+    def from_recorder(cls, recorder: GameRecorder) -> ReplayViewer:
+        """Create a viewer directly from an in-memory recorder.
+
+        Skips the save/load round trip. Player-id keys in score dicts stay
+        ints instead of the strings produced by JSON.
+
+        Args:
+            recorder: GameRecorder with a recorded game
+
+        Returns:
+            ReplayViewer over the recorder's events
+
+        """
+        return cls(recorder.to_dict())
+
+    @classmethod
+    def from_stream(cls, records: Iterable[tuple[str, dict[str, Any]]]) -> ReplayViewer:
+        """Create a viewer from streamed replay records.
+
+        Events are validated and normalized by a GameRecorder as they
+        arrive, then built into dicts once by the viewer.
+
+        Args:
+            records: Tagged records from load_replay_streaming()
+
+        Returns:
+            ReplayViewer over the streamed replay
+
+        """
+        recorder = GameRecorder()
+        metadata: dict[str, Any] = {}
+        for kind, record in records:
+            if kind == "metadata":
+                metadata = record
+            else:
+                recorder.append_event(record)
+        return cls({"metadata": metadata, "events": recorder.events})
+
+    def _first_event(self, event_type: EventType) -> dict[str, Any] | None:
+        """Return the first event of a given type.
+
+        Args:
+            event_type: Event type to look for
+
+        Returns:
+            The first matching event, or None if there is none
+
+        """
+        indices = self._by_type.get(event_type)
+        return self.events[indices[0]] if indices else None
+
+    def _final_standings(self, game_end_data: dict[str, Any]) -> list[tuple[Any, int]]:
+        """Return final (player_id, score) pairs sorted by score, highest first.
+
+        The sorted list is computed once and reused by every report.
+
+        Args:
+            game_end_data: Data of the game_end event
+
+        Returns:
+            List of (player_id, score) tuples
+
+        """
+        if self._standings is None:
+            final_scores = game_end_data.get("final_scores", {})
+            self._standings = sorted(final_scores.items(), key=itemgetter(1), reverse=True)
+        return self._standings
 
     def print_summary(self) -> None:
         """Print a summary of the game."""
@@ -41,21 +137,12 @@ class ReplayViewer:
             print(f"Seed: {self.metadata.get('seed')}")
 
         # Find game end event
-        game_end = next(
-            (e for e in self.events if e["type"] == "game_end"),
-            None,
-        )
+        game_end = self._first_event(EventType.GAME_END)
 
         if game_end:
             data = game_end["data"]
             print("\nFinal Scores:")
-            final_scores = data.get("final_scores", {})
-            sorted_scores = sorted(
-                final_scores.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )
-            for player_id, score in sorted_scores:
+            for player_id, score in self._final_standings(data):
                 name = player_names[int(player_id)] if int(player_id) < len(player_names) else f"Player {player_id}"
                 is_winner = int(player_id) in data.get("winner_ids", [])
                 marker = "🏆" if is_winner else "  "
@@ -65,14 +152,11 @@ class ReplayViewer:
             print(f"\nGame Duration: {duration:.1f} seconds")
 
         # Event statistics
-        event_counts = {}
-        for event in self.events:
-            event_type = event["type"]
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        event_counts = Counter(self.types)
 
         print("\nEvent Counts:")
-        for event_type, count in sorted(event_counts.items()):
-            print(f"  {event_type}: {count}")
+        for label, count in sorted((event_type.label, count) for event_type, count in event_counts.items()):
+            print(f"  {label}: {count}")
 
         print()
 
@@ -83,74 +167,75 @@ class ReplayViewer:
         print("=" * 70 + "\n")
 
         player_names = self.metadata.get("player_names", [])
+        handlers = {
+            EventType.GAME_START: self._render_game_start,
+            EventType.ROUND_START: self._render_round_start,
+            EventType.ROLL: self._render_roll,
+            EventType.BANK: self._render_bank,
+            EventType.ROUND_END: self._render_round_end,
+            EventType.GAME_END: self._render_game_end,
+        }
 
-        for event in self.events:
-            event_type = event["type"]
-            data = event["data"]
-
-            if event_type == "game_start":
-                print("🎮 GAME START")
-                print(f"   Players: {', '.join(player_names)}")
-                print(f"   Rounds: {data.get('total_rounds')}\n")
-
-            elif event_type == "round_start":
-                round_num = data.get("round_number")
-                print(f"\n📍 ROUND {round_num} START")
-                print("-" * 70)
-
-            elif event_type == "roll":
-                roll_count = data.get("roll_count")
-                dice = data.get("dice", [])
-                bank_after = data.get("bank_after")
-                delta = data.get("delta")
-
-                dice_str = f"[{dice[0]}] [{dice[1]}]" if len(dice) == 2 else str(dice)
-                print(f"   Roll #{roll_count}: {dice_str} → Bank: {bank_after} ({delta:+d})")
-
-            elif event_type == "bank":
-                player_id = data.get("player_id")
-                player_name = data.get("player_name")
-                amount = data.get("amount")
-                score_after = data.get("score_after")
-                print(f"   💰 {player_name} BANKS {amount} points! (Total: {score_after})")
-
-            elif event_type == "round_end":
-                reason = data.get("reason")
-                final_bank = data.get("final_bank")
-
-                if reason == "seven_rolled":
-                    print(f"   ❌ ROUND OVER - Seven rolled! Bank lost ({final_bank} points)")
-                elif reason == "all_banked":
-                    print("   ✅ ROUND OVER - All players banked")
-
-                player_scores = data.get("player_scores", {})
-                print(
-                    f"   Scores: {', '.join(f'{player_names[int(pid)]}: {score}' for pid, score in sorted(player_scores.items()))}"
-                )
-
-            elif event_type == "game_end":
-                print("\n" + "=" * 70)
-                print("🏁 GAME OVER")
-                print("=" * 70)
-                winner_names = data.get("winner_names", [])
-                if len(winner_names) == 1:
-                    print(f"   🏆 Winner: {winner_names[0]}")
-                else:
-                    print(f"   🤝 Tie: {', '.join(winner_names)}")
-
-                final_scores = data.get("final_scores", {})
-                print("\n   Final Standings:")
-                sorted_scores = sorted(
-                    final_scores.items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )
-                for rank, (player_id, score) in enumerate(sorted_scores, 1):
-                    name = player_names[int(player_id)] if int(player_id) < len(player_names) else f"Player {player_id}"
-                    print(f"     {rank}. {name}: {score} points")
+        for event, event_type in zip(self.events, self.types, strict=True):
+            handlers[event_type](event["data"], player_names)
 
         print()
 
+    def _render_game_start(self, data: dict[str, Any], player_names: list[str]) -> None:
+        """Print the play-by-play line for a game_start event."""
+        print("🎮 GAME START")
+        print(f"   Players: {', '.join(player_names)}")
+        print(f"   Rounds: {data.get('total_rounds')}\n")
+
+    def _render_round_start(self, data: dict[str, Any], player_names: list[str]) -> None:
+        """Print the play-by-play header for a round_start event."""
+        print(f"\n📍 ROUND {data.get('round_number')} START")
+        print("-" * 70)
+
+    def _render_roll(self, data: dict[str, Any], player_names: list[str]) -> None:
+        """Print the play-by-play line for a roll event."""
+        get = data.get
+        dice = get("dice", [])
+        dice_str = f"[{dice[0]}] [{dice[1]}]" if len(dice) == 2 else str(dice)
+        print(f"   Roll #{get('roll_count')}: {dice_str} → Bank: {get('bank_after')} ({get('delta'):+d})")
+
+    def _render_bank(self, data: dict[str, Any], player_names: list[str]) -> None:
+        """Print the play-by-play line for a bank event."""
+        get = data.get
+        print(f"   💰 {get('player_name')} BANKS {get('amount')} points! (Total: {get('score_after')})")
+
+    def _render_round_end(self, data: dict[str, Any], player_names: list[str]) -> None:
+        """Print the play-by-play summary for a round_end event."""
+        get = data.get
+        reason = get("reason")
+        if reason == "seven_rolled":
+            print(f"   ❌ ROUND OVER - Seven rolled! Bank lost ({get('final_bank')} points)")
+        elif reason == "all_banked":
+            print("   ✅ ROUND OVER - All players banked")
+
+        player_scores = get("player_scores", {})
+        # Every round_end has the same player ids, so sort them once
+        if self._score_order is None:
+            self._score_order = sorted(player_scores)
+        print(f"   Scores: {', '.join(f'{player_names[int(pid)]}: {player_scores[pid]}' for pid in self._score_order)}")
+
+    def _render_game_end(self, data: dict[str, Any], player_names: list[str]) -> None:
+        """Print the play-by-play summary for a game_end event."""
+        print("\n" + "=" * 70)
+        print("🏁 GAME OVER")
+        print("=" * 70)
+        winner_names = data.get("winner_names", [])
+        if len(winner_names) == 1:
+            print(f"   🏆 Winner: {winner_names[0]}")
+        else:
+            print(f"   🤝 Tie: {', '.join(winner_names)}")
+
+        print("\n   Final Standings:")
+        num_names = len(player_names)
+        for rank, (player_id, score) in enumerate(self._final_standings(data), 1):
+            name = player_names[int(player_id)] if int(player_id) < num_names else f"Player {player_id}"
+            print(f"     {rank}. {name}: {score} points")
+
     def analyze_round(self, round_number: int) -> None:
         """Analyze a specific round in detail.
 
@@ -162,15 +247,15 @@ class ReplayViewer:
         print(f"ROUND {round_number} ANALYSIS")
         print("=" * 70 + "\n")
 
-        round_events = [e for e in self.events if e.get("data", {}).get("round_number") == round_number]
+        round_indices = self._by_round.get(round_number, [])
 
-        if not round_events:
+        if not round_indices:
             print(f"No events found for round {round_number}")
             return
 
-        rolls = [e for e in round_events if e["type"] == "roll"]
-        banks = [e for e in round_events if e["type"] == "bank"]
-        round_end = next((e for e in round_events if e["type"] == "round_end"), None)
+        rolls = [self.events[i] for i in round_indices if self.types[i] == EventType.ROLL]
+        banks = [self.events[i] for i in round_indices if self.types[i] == EventType.BANK]
+        round_end = next((self.events[i] for i in round_indices if self.types[i] == EventType.ROUND_END), None)
 
         print(f"Total Rolls: {len(rolls)}")
         print(f"Players Banked: {len(banks)}")
@@ -214,18 +299,21 @@ class ReplayViewer:
         player_names = self.metadata.get("player_names", [])
         player_name = player_names[player_id] if player_id < len(player_names) else f"Player {player_id}"
 
-        bank_events = [e for e in self.events if e["type"] == "bank" and e["data"].get("player_id") == player_id]
+        bank_events = [
+            self.events[i] for i in self._by_type.get(EventType.BANK, []) if self.events[i]["data"].get("player_id") == player_id
+        ]
 
         total_banked = sum(e["data"].get("amount", 0) for e in bank_events)
         num_banks = len(bank_events)
         avg_bank = total_banked / num_banks if num_banks > 0 else 0
 
         # Find final score
-        game_end = next((e for e in self.events if e["type"] == "game_end"), None)
+        game_end = self._first_event(EventType.GAME_END)
         final_score = 0
         if game_end:
             final_scores = game_end["data"].get("final_scores", {})
-            final_score = final_scores.get(str(player_id), 0)
+            # Loaded replays have string keys, in-memory recordings have ints
+            final_score = final_scores.get(str(player_id), final_scores.get(player_id, 0))
 
         return {
             "name": player_name,
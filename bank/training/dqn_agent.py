@@ -2,12 +2,12 @@
 
 Deep Q-Network agent for playing BANK!
 
-NOTE: This module is part of Phase 4 (Training Environment & DQN) and is
-currently in development. It uses legacy interfaces from the card game
-implementation and needs to be updated for the dice game. See Phase 4
-in docs/PROJECT_PLAN.md for implementation roadmap.
+The agent acts on the same 14-feature vector BankEnv produces (see
+flatten_observation), with action 0 = pass and 1 = bank, so a network
+trained through the environment can be seated in a BankGame directly.
 """
 
+import copy
 from typing import Any
 
 import numpy as np
@@ -23,8 +23,12 @@ except ImportError:
     nn = None
     optim = None
 
-from bank.agents.base import BaseAgent
-from bank.game.state import GameState
+from bank.agents.base import Action, Agent, Observation
+from bank.game.features import OBS_SIZE
+from bank.training.environment import flatten_observation
+
+# Game action for each network output index, matching BankEnv's action space
+_ACTIONS: tuple[Action, ...] = ("pass", "bank")
 
 
 class DQNetwork(nn.Module if TORCH_AVAILABLE else object):
@@ -67,7 +71,7 @@ class DQNetwork(nn.Module if TORCH_AVAILABLE else object):
         return self.network(x)
 
 
-class DQNAgent(BaseAgent):
+class DQNAgent(Agent):
     """Deep Q-Network agent for BANK!
 
     This agent uses deep reinforcement learning to learn optimal strategies.
@@ -77,13 +81,19 @@ class DQNAgent(BaseAgent):
         self,
         player_id: int,
         name: str = "DQN-Agent",
-        state_dim: int = 107,  # Matches BankEnv observation space
-        action_dim: int = 105,  # Matches BankEnv action space
+        state_dim: int = OBS_SIZE,  # Matches BankEnv observation space
+        action_dim: int = len(_ACTIONS),  # Matches BankEnv action space
+        total_rounds: int = 10,
         learning_rate: float = 0.001,
         gamma: float = 0.99,
         epsilon: float = 1.0,
         epsilon_min: float = 0.01,
         epsilon_decay: float = 0.995,
+        memory_size: int = 10000,
+        inference_dtype: str | None = None,
+        compile_network: bool = False,
+        cuda_graph: bool = False,
+        seed: int | None = None,
     ):
         """Initialize the DQN agent.
 
@@ -92,11 +102,25 @@ class DQNAgent(BaseAgent):
             name: Agent name
             state_dim: State space dimension
             action_dim: Action space dimension
+            total_rounds: Rounds per game, used to normalize observations
+                in act()
             learning_rate: Learning rate
             gamma: Discount factor
             epsilon: Initial exploration rate
             epsilon_min: Minimum exploration rate
             epsilon_decay: Exploration decay rate
+            memory_size: Capacity of the experience replay buffer
+            inference_dtype: Optional reduced precision ("bfloat16",
+                "float16" or "qint8") for action-selection forward passes.
+                "qint8" uses dynamic int8 quantization of the linear layers,
+                which is CPU-only, so on CUDA it falls back to "float16".
+                Training always runs in float32.
+            compile_network: Whether to torch.compile the Q-network forward
+                pass (PyTorch 2.0+); ignored if compilation is unavailable
+            cuda_graph: Whether train_step() captures its forward, backward
+                and optimizer step into a CUDA graph and replays it; ignored
+                unless the agent runs on CUDA
+            seed: Optional seed for the exploration RNG
 
         """
         if not TORCH_AVAILABLE:
@@ -106,88 +130,348 @@ class DQNAgent(BaseAgent):
 
         self.state_dim = state_dim
         self.action_dim = action_dim
+        self.total_rounds = total_rounds
         self.gamma = gamma
         self.epsilon = epsilon
         self.epsilon_min = epsilon_min
         self.epsilon_decay = epsilon_decay
 
+        # One generator for all exploration draws (epsilon tests and random
+        # actions), so exploring costs a single PCG64 call per batch
+        self._rng = np.random.default_rng(seed)
+
         # Initialize networks
-        self.q_network = DQNetwork(state_dim, action_dim)
-        self.target_network = DQNetwork(state_dim, action_dim)
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.q_network = DQNetwork(state_dim, action_dim).to(self.device)
+        self.target_network = DQNetwork(state_dim, action_dim).to(self.device)
         self.target_network.load_state_dict(self.q_network.state_dict())
 
-        self.optimizer = optim.Adam(self.q_network.parameters(), lr=learning_rate)
+        # Reusable (pinned when CUDA is available) host buffer for single-state
+        # inference, so select_action doesn't allocate a tensor per step.
+        # act() flattens observations straight into its NumPy view.
+        self._state_buf = torch.empty(
+            (1, state_dim),
+            dtype=torch.float32,
+            pin_memory=torch.cuda.is_available(),
+        )
+        self._state_buf_np = self._state_buf.numpy()
+        self._state_buf_dev = self._state_buf.to(self.device)
+
+        # Same for select_actions_batch; allocated on first use and resized
+        # only when the batch size changes. _batch_buf_np shares its memory.
+        # _batch_buf_dev is its device-side twin (the same tensor on CPU), so
+        # the host-to-device copy also reuses memory instead of allocating.
+        self._batch_buf: torch.Tensor | None = None
+        self._batch_buf_np: np.ndarray | None = None
+        self._batch_buf_dev: torch.Tensor | None = None
+
+        # Greedy policy (forward pass + argmax), optionally compiled into one
+        # graph. The uncompiled module is kept as q_network so state_dict keys,
+        # saving and target syncs are unchanged.
+        self._q_greedy = self._greedy_policy
+        if compile_network:
+            try:
+                self._q_greedy = torch.compile(self._greedy_policy, mode="reduce-overhead", dynamic=False)
+            except (AttributeError, RuntimeError):
+                self._q_greedy = self._greedy_policy
+
+        # Optional low-precision copy of q_network used only for acting; it is
+        # re-cast on every target sync rather than on every forward pass
+        if inference_dtype == "qint8" and self.device.type != "cpu":
+            inference_dtype = "float16"
+        self.inference_dtype = getattr(torch, inference_dtype) if inference_dtype else None
+        self._inference_network: DQNetwork | None = None
+        self._sync_inference_network()
+
+        # CUDA graph replay needs an optimizer whose state lives on the device
+        self.use_cuda_graph = cuda_graph and self.device.type == "cuda"
+        self.optimizer = optim.Adam(
+            self.q_network.parameters(),
+            lr=learning_rate,
+            capturable=self.use_cuda_graph,
+        )
         self.loss_fn = nn.MSELoss()
 
-        # Experience replay buffer
-        self.memory = []
-        self.memory_size = 10000
+        # Captured training step and its static input tensors (see train_step)
+        self._graph: Any = None
+        self._graph_batch: tuple | None = None
+        self._graph_loss: Any = None
+
+        # Experience replay buffer: preallocated column tensors on the network's
+        # device used as a ring buffer, so inserts are O(1) and sampled batches
+        # never round-trip through host memory
+        self.memory_size = memory_size
+        self._s = torch.empty((memory_size, state_dim), dtype=torch.float32, device=self.device)
+        self._a = torch.empty(memory_size, dtype=torch.int64, device=self.device)
+        self._r = torch.empty(memory_size, dtype=torch.float32, device=self.device)
+        self._s2 = torch.empty((memory_size, state_dim), dtype=torch.float32, device=self.device)
+        self._done = torch.empty(memory_size, dtype=torch.bool, device=self.device)
+        self._mem_idx = 0
+        self._mem_full = False
+
+    def __len__(self) -> int:
+        """Return the number of transitions currently stored."""
+        return self.memory_size if self._mem_full else self._mem_idx
+
+    def store(
+        self,
+        state: np.ndarray,
+        action: int,
+        reward: float,
+        next_state: np.ndarray,
+        done: bool,
+    ) -> None:
+        """Store a transition, overwriting the oldest one when full.
+
+        Args:
+            state: Observation before the action
+            action: Action index taken
+            reward: Reward received
+            next_state: Observation after the action
+            done: Whether the episode ended
+
+        """
+        i = self._mem_idx
+        self._s[i].copy_(torch.from_numpy(np.asarray(state, dtype=np.float32)), non_blocking=True)
+        self._a[i] = action
+        self._r[i] = reward
+        self._s2[i].copy_(torch.from_numpy(np.asarray(next_state, dtype=np.float32)), non_blocking=True)
+        self._done[i] = done
+
+        self._mem_idx = (i + 1) % self.memory_size
+        if self._mem_idx == 0:
+            self._mem_full = True
+
+    def store_batch(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        """Store a batch of transitions (e.g. one vector-env step) at once.
+
+        Args:
+            states: Observations before the actions, shape (K, state_dim)
+            actions: Action indices taken, shape (K,)
+            rewards: Rewards received, shape (K,)
+            next_states: Observations after the actions, shape (K, state_dim)
+            dones: Whether each episode ended, shape (K,)
+
+        """
+        num = len(actions)
+        if num == 0:
+            return
+
+        idx = torch.arange(self._mem_idx, self._mem_idx + num, device=self.device) % self.memory_size
+        self._s[idx] = torch.from_numpy(np.asarray(states, dtype=np.float32)).to(self.device)
+        self._a[idx] = torch.from_numpy(np.asarray(actions, dtype=np.int64)).to(self.device)
+        self._r[idx] = torch.from_numpy(np.asarray(rewards, dtype=np.float32)).to(self.device)
+        self._s2[idx] = torch.from_numpy(np.asarray(next_states, dtype=np.float32)).to(self.device)
+        self._done[idx] = torch.from_numpy(np.asarray(dones, dtype=np.bool_)).to(self.device)
+
+        end = self._mem_idx + num
+        if end >= self.memory_size:
+            self._mem_full = True
+        self._mem_idx = end % self.memory_size
+
+    def sample(self, batch_size: int) -> tuple:
+        """Sample a batch of stored transitions uniformly with replacement.
+
+        Args:
+            batch_size: Number of transitions to sample
+
+        Returns:
+            Tuple of (states, actions, rewards, next_states, dones) tensors,
+            already on the agent's device
+
+        Raises:
+            ValueError: If the buffer is empty
+
+        """
+        n = len(self)
+        if n == 0:
+            msg = "Cannot sample from an empty replay buffer"
+            raise ValueError(msg)
+
+        idx = torch.randint(0, n, (batch_size,), device=self.device)
+        return self._s[idx], self._a[idx], self._r[idx], self._s2[idx], self._done[idx]
+
+    def _td_loss(self, states, actions, rewards, next_states, dones):
+        """Compute the Q-learning loss of a batch against the target network."""
+        q_values = self.q_network(states).gather(1, actions.unsqueeze(1)).squeeze(1)
+        with torch.no_grad():
+            next_q = self.target_network(next_states).max(1).values
+            targets = rewards + self.gamma * next_q * (~dones)
+        return self.loss_fn(q_values, targets)
+
+    def train_step(self, batch_size: int = 64):
+        """Run one batched Q-learning update on a sample from the replay buffer.
+
+        With ``cuda_graph`` enabled on a CUDA device, the first call captures
+        the loss, backward pass and optimizer step into a CUDA graph; later
+        calls only gather a fresh sample into the graph's static inputs and
+        replay it, so an update costs one graph launch.
+
+        Args:
+            batch_size: Number of transitions per update
+
+        Returns:
+            Detached loss tensor, or None if the buffer holds fewer than
+            batch_size transitions. Call .item() only when logging, since it
+            waits for the device.
 
-    def select_action(self, game_state: GameState, valid_actions: list) -> tuple[str, dict[str, Any]]:
-        """Select action using epsilon-greedy policy.
+        """
+        if len(self) < batch_size:
+            return None
+
+        if self.use_cuda_graph:
+            return self._train_step_graphed(batch_size)
+
+        loss = self._td_loss(*self.sample(batch_size))
+        self.optimizer.zero_grad(set_to_none=True)
+        loss.backward()
+        self.optimizer.step()
+        return loss.detach()
+
+    def _train_step_graphed(self, batch_size: int):
+        """Train from a CUDA graph, capturing it on first use."""
+        if self._graph is None or self._graph_batch[0].shape[0] != batch_size:
+            self._capture_train_graph(batch_size)
+
+        # Gather the new sample straight into the graph's static inputs
+        idx = torch.randint(0, len(self), (batch_size,), device=self.device)
+        for column, static in zip((self._s, self._a, self._r, self._s2, self._done), self._graph_batch, strict=True):
+            torch.index_select(column, 0, idx, out=static)
+
+        self._graph.replay()
+        return self._graph_loss.detach()
+
+    def _capture_train_graph(self, batch_size: int) -> None:
+        """Capture loss, backward and optimizer step for a fixed batch size."""
+        self._graph_batch = tuple(t.clone() for t in self.sample(batch_size))
+
+        # Warm up on a side stream so lazy allocations happen outside capture
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream):
+            for _ in range(3):
+                self.optimizer.zero_grad(set_to_none=True)
+                self._td_loss(*self._graph_batch).backward()
+                self.optimizer.step()
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        # Gradients are allocated inside the graph, so each replay overwrites them
+        self._graph = torch.cuda.CUDAGraph()
+        self.optimizer.zero_grad(set_to_none=True)
+        with torch.cuda.graph(self._graph):
+            self._graph_loss = self._td_loss(*self._graph_batch)
+            self._graph_loss.backward()
+            self.optimizer.step()
+
+    def act(self, observation: Observation) -> Action:
+        """Bank or pass using the epsilon-greedy policy.
 
         Args:
-            game_state: Current game state
-            valid_actions: List of valid actions
+            observation: Current game state observation
 
         Returns:
-            Tuple of (action_name, action_parameters)
+            Action: either "bank" or "pass"
 
         """
-        # Convert game state to observation
-        state_vector = self._state_to_vector(game_state)
+        if not observation["can_bank"]:
+            return "pass"
+        state = flatten_observation(observation, self.total_rounds, out=self._state_buf_np[0])
+        return _ACTIONS[self.select_action(state)]
+
+    def select_action(self, state: np.ndarray) -> int:
+        """Select an action index for one state using epsilon-greedy.
 
-        # Epsilon-greedy action selection
-        if np.random.random() < self.epsilon:
+        Args:
+            state: Flat observation of shape (state_dim,), e.g. from BankEnv
+
+        Returns:
+            Action index (0=pass, 1=bank)
+
+        """
+        if self._rng.random() < self.epsilon:
             # Explore: random action
-            action_idx = np.random.randint(0, self.action_dim)
-        else:
-            # Exploit: best action from Q-network
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state_vector).unsqueeze(0)
-                q_values = self.q_network(state_tensor)
-                action_idx = q_values.argmax().item()
-
-        # Decode action
-        return self._decode_action(action_idx, game_state)
-
-    def _state_to_vector(self, game_state: GameState) -> np.ndarray:
-        """Convert game state to feature vector."""
-        # Simplified state representation
-        # In practice, this should match the BankEnv observation space
-        current_player = game_state.players[self.player_id]
-
-        # One-hot encode hand
-        hand_vec = np.zeros(52, dtype=np.float32)
-        for card in current_player.hand:
-            if 0 <= card - 1 < 52:
-                hand_vec[card - 1] = 1.0
-
-        # One-hot encode bank
-        bank_vec = np.zeros(52, dtype=np.float32)
-        for card in current_player.bank:
-            if 0 <= card - 1 < 52:
-                bank_vec[card - 1] = 1.0
-
-        # Deck size (normalized)
-        deck_size = np.array([len(game_state.deck) / 52.0], dtype=np.float32)
-
-        # Player scores (normalized)
-        scores = np.array(
-            [p.score / 100.0 for p in game_state.players],
-            dtype=np.float32,
-        )
+            return int(self._rng.integers(0, self.action_dim))
+
+        # Exploit: best action from Q-network. act() has already written the
+        # state into the host buffer, in which case this copy is a no-op
+        np.copyto(self._state_buf_np[0], state)
+        with torch.inference_mode():
+            if self._state_buf_dev is not self._state_buf:
+                self._state_buf_dev.copy_(self._state_buf, non_blocking=True)
+            return int(self._act_greedy(self._state_buf_dev)[0])
+
+    def select_actions_batch(self, states: np.ndarray) -> np.ndarray:
+        """Select epsilon-greedy actions for a batch of states in one forward pass.
+
+        Exploration is decided for the whole batch with one vectorized draw,
+        and the forward pass is skipped when every state explores.
+
+        Args:
+            states: Array of shape (K, state_dim), e.g. from VectorBankEnv
 
-        return np.concatenate([hand_vec, bank_vec, deck_size, scores])
+        Returns:
+            Array of K action indices
+
+        """
+        num_states = len(states)
+        explore = self._rng.random(num_states) < self.epsilon
+        random_actions = self._rng.integers(0, self.action_dim, num_states)
+        if explore.all():
+            return random_actions
+
+        # Copy into the reusable host buffer, then one async copy into the
+        # reusable device buffer
+        if self._batch_buf is None or self._batch_buf.shape[0] != num_states:
+            self._batch_buf = torch.empty(
+                (num_states, self.state_dim),
+                dtype=torch.float32,
+                pin_memory=torch.cuda.is_available(),
+            )
+            self._batch_buf_np = self._batch_buf.numpy()
+            self._batch_buf_dev = self._batch_buf.to(self.device)
+        np.copyto(self._batch_buf_np, states)
+
+        with torch.inference_mode():
+            if self._batch_buf_dev is not self._batch_buf:
+                self._batch_buf_dev.copy_(self._batch_buf, non_blocking=True)
+            greedy_actions = self._act_greedy(self._batch_buf_dev).cpu().numpy()
+
+        return np.where(explore, random_actions, greedy_actions)
+
+    def _greedy_policy(self, states):
+        """Return the q_network's greedy action index for each state."""
+        return self.q_network(states).argmax(-1)
+
+    def _act_greedy(self, states):
+        """Return greedy action indices, in reduced precision if configured."""
+        if self._inference_network is None:
+            return self._q_greedy(states)
+        if self.inference_dtype == torch.qint8:
+            # Dynamically quantized layers take float input and quantize it
+            return self._inference_network(states).argmax(-1)
+        return self._inference_network(states.to(self.inference_dtype)).argmax(-1)
+
+    def _sync_inference_network(self) -> None:
+        """Refresh the reduced-precision inference copy from q_network."""
+        if self.inference_dtype is None:
+            return
+        network = copy.deepcopy(self.q_network).eval()
+        if self.inference_dtype == torch.qint8:
+            self._inference_network = torch.ao.quantization.quantize_dynamic(network, {nn.Linear}, dtype=torch.qint8)
+        else:
+            self._inference_network = network.to(self.inference_dtype)
 
-    def _decode_action(self, action_idx: int, game_state: GameState) -> tuple[str, dict[str, Any]]:
-        """Decode action index to game action."""
-        # Simplified action decoding
-        if action_idx < 52:
-            return ("play_card", {"card_idx": min(action_idx, len(game_state.current_player.hand) - 1)})
-        if action_idx == 52:
-            return ("draw_card", {})
-        return ("bank_card", {"card_idx": min(action_idx - 53, len(game_state.current_player.hand) - 1)})
+    def update_target_network(self) -> None:
+        """Copy q_network weights into the target (and inference) networks."""
+        self.target_network.load_state_dict(self.q_network.state_dict())
+        self._sync_inference_network()
 
     def update_epsilon(self) -> None:
         """Decay exploration rate."""
@@ -199,5 +483,5 @@ class DQNAgent(BaseAgent):
 
     def load_model(self, path: str) -> None:
         """Load model weights."""
-        self.q_network.load_state_dict(torch.load(path))
-        self.target_network.load_state_dict(self.q_network.state_dict())
+        self.q_network.load_state_dict(torch.load(path, map_location=self.device))
+        self.update_target_network()
@@ -6,6 +6,7 @@ This module wraps the BANK! game engine for reinforcement learning training.
 from __future__ import annotations
 
 import random
+from collections.abc import Callable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -37,9 +38,31 @@ from bank.agents.rule_based import (
     SmartAgent,
 )
 from bank.game.engine import BankGame
-
-
-def flatten_observation(obs: Observation, total_rounds: int = 10) -> np.ndarray:
+from bank.game.features import OBS_SIZE, fill_features
+
+
+# Opponent constructors by type name; each takes (player_id, agent seed)
+_AGENT_FACTORIES: dict[str, Callable[[int, int], Agent]] = {
+    "random": lambda pid, seed: RandomAgent(pid, seed=seed),
+    "conservative": lambda pid, _seed: ConservativeAgent(pid),
+    "aggressive": lambda pid, _seed: AggressiveAgent(pid),
+    "smart": lambda pid, _seed: SmartAgent(pid),
+    "adaptive": lambda pid, _seed: AdaptiveAgent(pid),
+    "leader_only": lambda pid, _seed: LeaderOnlyAgent(pid),
+    "leader_plus_one": lambda pid, _seed: LeaderPlusOneAgent(pid),
+    "leech": lambda pid, _seed: LeechAgent(pid),
+    "rank_based": lambda pid, _seed: RankBasedAgent(pid),
+}
+
+# Types drawn from when an opponent's type is not configured
+_RANDOM_FACTORIES = tuple(_AGENT_FACTORIES.values())
+
+
+def flatten_observation(
+    obs: Observation,
+    total_rounds: int = 10,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """Convert Observation TypedDict to flat 14-feature vector.
 
     All features are normalized using tanh squashing for robust bounded output.
@@ -70,69 +93,87 @@ def flatten_observation(obs: Observation, total_rounds: int = 10) -> np.ndarray:
     Args:
         obs: Observation dictionary from game engine
         total_rounds: Total rounds in game (for normalization)
+        out: Optional preallocated float32 array of shape (14,) to write the
+            features into. A new array is allocated if not given.
 
     Returns:
-        14-element numpy array with dtype float32
+        14-element numpy array with dtype float32 (``out`` if it was given)
 
     """
-    # Extract dice values (already naturally bounded [0, 1])
-    if obs["last_roll"] is not None:
-        die1 = float(obs["last_roll"][0]) / 6.0
-        die2 = float(obs["last_roll"][1]) / 6.0
+    last_roll = obs["last_roll"]
+    if last_roll is not None:
+        die1 = float(last_roll[0])
+        die2 = float(last_roll[1])
     else:
         die1 = 0.0
         die2 = 0.0
 
-    # Extract player info
-    player_score = float(obs["player_score"])
+    # Engine observations carry the scores as an array indexed by player_id,
+    # which the kernel reads in place; hand-built ones fall back to the dict
     all_scores = obs["all_player_scores"]
-    opponent_scores = [float(score) for pid, score in all_scores.items() if pid != obs["player_id"]]
-
-    # Compute opponent statistics
-    if opponent_scores:
-        avg_opponent = float(np.mean(opponent_scores))
-        max_opponent = float(max(opponent_scores))
-        min_opponent = float(min(opponent_scores))
-        is_leading = 1.0 if player_score > max_opponent else 0.0
-        score_gap = player_score - max_opponent
+    scores = obs.get("all_player_scores_arr")
+    if scores is not None:
+        player_index = obs["player_id"]
     else:
-        # Single player edge case
-        avg_opponent = 0.0
-        max_opponent = 0.0
-        min_opponent = 0.0
-        is_leading = 1.0
-        score_gap = 0.0
-
-    # Total players for normalization
-    num_players = len(all_scores)
-    num_active = len(obs["active_player_ids"])
-
-    # Build feature vector with tanh normalization for unbounded features
-    features = np.array(
-        [
-            float(obs["round_number"]) / float(total_rounds),  # Exact [0, 1]
-            np.tanh(float(obs["roll_count"]) / 7.0),  # ~7 rolls typical
-            np.tanh(float(obs["current_bank"]) / 250.0),  # ~250 typical, 500 high
-            die1,  # Exact [0, 1]
-            die2,  # Exact [0, 1]
-            1.0 if obs["roll_count"] <= 3 else 0.0,  # Exact {0, 1}
-            np.tanh(player_score / 500.0),  # ~500 typical, 1000+ high
-            1.0 if obs["can_bank"] else 0.0,  # Exact {0, 1}
-            float(num_active) / float(num_players),  # Exact [0, 1]
-            np.tanh(avg_opponent / 500.0),  # ~500 typical
-            np.tanh(max_opponent / 500.0),  # ~500 typical
-            np.tanh(min_opponent / 500.0),  # ~500 typical
-            is_leading,  # Exact {0, 1}
-            np.tanh(score_gap / 500.0),  # Centered at 0, ±500 is ±0.76
-        ],
-        dtype=np.float32,
+        scores = np.fromiter(all_scores.values(), dtype=np.float64, count=len(all_scores))
+        player_index = _dict_index(all_scores, obs["player_id"])
+
+    if out is None:
+        out = np.empty(OBS_SIZE, dtype=np.float32)
+
+    fill_features(
+        die1,
+        die2,
+        float(obs["round_number"]),
+        1.0 / total_rounds,
+        float(obs["roll_count"]),
+        float(obs["current_bank"]),
+        float(obs["player_score"]),
+        bool(obs["can_bank"]),
+        float(len(obs["active_player_ids"])),
+        float(len(all_scores)),
+        scores,
+        player_index,
+        out,
     )
+    return out
+
+
+class _ReadOnlyScores(Mapping[int, int]):
+    """Read-only mapping of player ID to score for info["all_scores"].
+
+    Unlike MappingProxyType it can be pickled, so infos survive the trip back
+    from AsyncVectorEnv worker processes.
+    """
+
+    __slots__ = ("_scores",)
+
+    def __init__(self, scores: dict[int, int]) -> None:
+        self._scores = scores
+
+    def __getitem__(self, player_id: int) -> int:
+        return self._scores[player_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._scores)
 
-    return features
+    def __len__(self) -> int:
+        return len(self._scores)
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._scores!r})"
 
-class BankEnv:
-    """Gymnasium-compatible environment for BANK! dice game.
+
+def _dict_index(all_scores: dict[int, int], player_id: int) -> int:
+    """Position of player_id among the dict's keys, or -1 if absent."""
+    for index, pid in enumerate(all_scores):
+        if pid == player_id:
+            return index
+    return -1
+
+
+class BankEnv(gym.Env if GYMNASIUM_AVAILABLE else object):
+    """Gymnasium environment for BANK! dice game.
 
     This environment wraps the BANK! game engine for reinforcement learning.
     The learning agent is always player 0, and competes against opponent agents.
@@ -148,6 +189,17 @@ class BankEnv:
 
     """
 
+    metadata: dict[str, Any] = {"render_modes": ["human"]}
+
+    # Gymnasium spaces, built once and shared by every instance
+    # Note: Most features are in [-1, 1] range due to tanh normalization
+    # Some features (round_number, dice, binary flags) are naturally [0, 1]
+    _OBSERVATION_SPACE = (
+        spaces.Box(low=-1.0, high=1.0, shape=(OBS_SIZE,), dtype=np.float32) if GYMNASIUM_AVAILABLE else None
+    )
+    # Action: 0=pass, 1=bank
+    _ACTION_SPACE = spaces.Discrete(2) if GYMNASIUM_AVAILABLE else None
+
     def __init__(
         self,
         num_opponents: int = 3,
@@ -160,6 +212,8 @@ class BankEnv:
         tournament_rank_weight: float = 1.0,
         tournament_consistency_weight: float = 0.5,
         tournament_consistency_threshold: float = 0.5,
+        include_all_scores: bool = False,
+        rebuild_opponents_every: int = 0,
     ) -> None:
         """Initialize the BANK! environment.
 
@@ -171,7 +225,9 @@ class BankEnv:
                         "leech", "rank_based"
                 If None, randomly selects for each opponent
             total_rounds: Number of rounds per game
-            rng: Random number generator for determinism
+            rng: Random number generator for the game's dice. Its state
+                (read, not advanced) also seeds the env's numpy Generator
+                used to draw opponents
             reward_scheme: Reward calculation method
                 - "sparse": Simple win/loss (±1)
                 - "tournament": Accumulate results over N games, reward based on
@@ -181,6 +237,16 @@ class BankEnv:
             tournament_rank_weight: Weight for rank component (normalized)
             tournament_consistency_weight: Weight for consistency bonus
             tournament_consistency_threshold: Std dev threshold for consistency bonus
+            include_all_scores: Whether step() adds a read-only mapping of
+                every player's score to info["all_scores"]. Off by default,
+                since building it costs a dict per step that most callers
+                never read.
+            rebuild_opponents_every: When every opponent's type is set by
+                opponent_types, rebuild the opponent agents every N
+                episodes. With 0 (default) they are built once and only
+                reset() between episodes. Opponents with a random type are
+                redrawn every episode regardless, and a reset() with a seed
+                always rebuilds them, so seeded episodes stay reproducible.
 
         Raises:
             ImportError: If gymnasium is not installed
@@ -200,19 +266,46 @@ class BankEnv:
             msg = f"total_rounds must be >= 1, got {total_rounds}"
             raise ValueError(msg)
 
+        if rebuild_opponents_every < 0:
+            msg = f"rebuild_opponents_every must be >= 0, got {rebuild_opponents_every}"
+            raise ValueError(msg)
+
         # Store config
         self.num_opponents = num_opponents
         self.total_rounds = total_rounds
         self.rng = rng or random.Random()
-
-        # Store opponent types (will be used in reset)
+        # Opponent types and seeds are drawn in one vectorized call per reset.
+        # The generator's seed is drawn from a copy of the dice RNG, so the
+        # dice sequence is the same as with no opponent draws
+        dice_copy = random.Random()
+        dice_copy.setstate(self.rng.getstate())
+        self._opponent_rng = np.random.default_rng(dice_copy.getrandbits(64))
+
+        # Store opponent types and resolve them to factories once, so bad
+        # names fail here and building opponents does no string lookups
         self.opponent_types = opponent_types
+        self._opponent_factories: list[Callable[[int, int], Agent]] = []
+        for opponent_type in (opponent_types or [])[:num_opponents]:
+            factory = _AGENT_FACTORIES.get(opponent_type)
+            if factory is None:
+                msg = f"Unknown opponent type: {opponent_type}"
+                raise ValueError(msg)
+            self._opponent_factories.append(factory)
+
+        # Configured opponents persist across episodes (built on the first reset())
+        self.rebuild_opponents_every = rebuild_opponents_every
+        self._opponents: list[Agent] | None = None
+        self._episode_count = 0
 
         # Reward calculation configuration
         if reward_scheme not in {"sparse", "tournament"}:
             msg = f"reward_scheme must be 'sparse' or 'tournament', got '{reward_scheme}'"
             raise ValueError(msg)
 
+        if tournament_size < 1:
+            msg = f"tournament_size must be >= 1, got {tournament_size}"
+            raise ValueError(msg)
+
         self.reward_scheme = reward_scheme
         self.tournament_size = tournament_size
         self.tournament_win_weight = tournament_win_weight
@@ -220,26 +313,61 @@ class BankEnv:
         self.tournament_consistency_weight = tournament_consistency_weight
         self.tournament_consistency_threshold = tournament_consistency_threshold
 
-        # Tournament tracking (if using tournament scheme)
-        self.tournament_results: list[dict[str, Any]] = []
+        # Tournament tracking (if using tournament scheme): per-game results
+        # are written by index into preallocated arrays, and only the first
+        # current_tournament_game entries are meaningful
+        self._tour_wins = np.zeros(tournament_size, dtype=np.bool_)
+        self._tour_ranks = np.zeros(tournament_size, dtype=np.int8)
+        self._tour_scores = np.zeros(tournament_size, dtype=np.int32)
         self.current_tournament_game = 0
 
-        # Define Gymnasium spaces
-        # Note: Most features are in [-1, 1] range due to tanh normalization
-        # Some features (round_number, dice, binary flags) are naturally [0, 1]
-        self.observation_space = spaces.Box(
-            low=-1.0,
-            high=1.0,
-            shape=(14,),
-            dtype=np.float32,
-        )
+        # Tournament normalization factors; the player count is fixed by
+        # num_opponents, so they are computed once instead of per tournament
+        self._num_players = 1 + num_opponents
+        self._inv_rank_denom = 1.0 / (self._num_players - 1)
+        self._inv_tournament_size = 1.0 / tournament_size
 
-        # Action: 0=pass, 1=bank
-        self.action_space = spaces.Discrete(2)
+        # Spaces never change, so every instance shares the class-level ones
+        self.observation_space = type(self)._OBSERVATION_SPACE
+        self.action_space = type(self)._ACTION_SPACE
+
+        # Observation buffer reused by reset()/step(); the returned array is
+        # only valid until the next call, so copy it if you need to keep it
+        self._obs_buf = np.zeros(OBS_SIZE, dtype=np.float32)
+
+        # Trigger JIT compilation now so the first real step is not penalized;
+        # engine observations pass a read-only int64 view of the scores
+        warm_scores = np.zeros(2, dtype=np.int64)
+        warm_scores.flags.writeable = False
+        flatten_args = (0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, True, 1.0, 2.0)
+        fill_features(*flatten_args, warm_scores, 0, self._obs_buf)
 
         # Game state (initialized in reset)
         self.game: BankGame | None = None
         self.learning_agent_id = 0  # Always player 0
+        self.include_all_scores = include_all_scores
+
+    def set_obs_buffer(self, buf: np.ndarray) -> None:
+        """Make reset()/step() write observations into a caller-owned buffer.
+
+        The buffer can be a row of a stacked batch or the NumPy view of a
+        (pinned) torch tensor, so observations reach the policy input
+        without a copy. reset() and step() return this same buffer.
+
+        Args:
+            buf: Writable, C-contiguous float32 array of shape (14,)
+
+        Raises:
+            ValueError: If the buffer has the wrong shape, dtype or layout
+
+        """
+        if buf.shape != (OBS_SIZE,) or buf.dtype != np.float32:
+            msg = f"obs buffer must be float32 with shape ({OBS_SIZE},), got {buf.dtype} {buf.shape}"
+            raise ValueError(msg)
+        if not buf.flags.c_contiguous or not buf.flags.writeable:
+            msg = "obs buffer must be C-contiguous and writeable"
+            raise ValueError(msg)
+        self._obs_buf = buf
 
     def reset(
         self,
@@ -253,18 +381,44 @@ class BankEnv:
             options: Additional options (unused)
 
         Returns:
-            Tuple of (observation, info_dict)
+            Tuple of (observation, info_dict). The observation is the env's
+            reusable buffer and is overwritten by the next reset()/step().
 
         """
+        self._reset_game(seed)
+
+        # The engine writes features straight from its state; no dict is built
+        self.game.fill_observation_array(self.learning_agent_id, self.total_rounds, self._obs_buf)
+
+        info: dict[str, Any] = {}
+
+        return self._obs_buf, info
+
+    def _reset_game(self, seed: int | None) -> None:
+        """Reseed if asked, prepare opponents and start a new game."""
         if seed is not None:
             self.rng.seed(seed)
-
-        # Create opponent agents
-        opponent_agents = self._create_opponent_agents()
+            self._opponent_rng = np.random.default_rng(seed)
+
+        # Rebuild opponents when seeded, on first use, on schedule, or when any
+        # type is random (so a new lineup is drawn each episode); otherwise
+        # reuse them and just clear their per-game state
+        rebuild_every = self.rebuild_opponents_every
+        if (
+            seed is not None
+            or self._opponents is None
+            or len(self._opponent_factories) < self.num_opponents
+            or (rebuild_every > 0 and self._episode_count % rebuild_every == 0)
+        ):
+            self._opponents = self._create_opponent_agents()
+        else:
+            for opponent in self._opponents:
+                opponent.reset()
+        self._episode_count += 1
 
         # Create all agents (learning agent + opponents)
         # Learning agent slot will be None - controlled externally
-        all_agents: list[Agent | None] = [None] + opponent_agents
+        all_agents: list[Agent | None] = [None, *self._opponents]
 
         # Create game
         self.game = BankGame(
@@ -278,14 +432,6 @@ class BankEnv:
         # Start first round
         self.game.start_new_round()
 
-        # Get initial observation for learning agent
-        obs = self.game.create_observation(self.learning_agent_id)
-        flat_obs = flatten_observation(obs, self.total_rounds)
-
-        info: dict[str, Any] = {}
-
-        return flat_obs, info
-
     def _create_opponent_agents(self) -> list[Agent]:
         """Create opponent agents based on configuration.
 
@@ -293,114 +439,52 @@ class BankEnv:
             List of opponent Agent instances
 
         """
-        from bank.agents.base import Agent as AgentType
-
-        opponents: list[AgentType] = []
-
-        # Available agent types
-        agent_types = [
-            "random",
-            "conservative",
-            "aggressive",
-            "smart",
-            "adaptive",
-            "leader_only",
-            "leader_plus_one",
-            "leech",
-            "rank_based",
-        ]
-
-        for i in range(self.num_opponents):
+        # Draw every opponent's random type and agent seed up front; configured
+        # types simply ignore their draw
+        num_opponents = self.num_opponents
+        type_draws = self._opponent_rng.integers(0, len(_RANDOM_FACTORIES), size=num_opponents).tolist()
+        seeds = self._opponent_rng.integers(0, 1_000_000, size=num_opponents).tolist()
+        configured = self._opponent_factories
+
+        opponents: list[Agent] = []
+        for i in range(num_opponents):
             # Player ID is 1-indexed (0 is learning agent)
             player_id = i + 1
 
-            # Select opponent type
-            if self.opponent_types and i < len(self.opponent_types):
-                opponent_type = self.opponent_types[i]
-            else:
-                # Random selection
-                opponent_type = self.rng.choice(agent_types)
-
-            # Create agent
-            agent: AgentType
-            if opponent_type == "random":
-                agent = RandomAgent(player_id, seed=self.rng.randint(0, 1_000_000))
-            elif opponent_type == "conservative":
-                agent = ConservativeAgent(player_id)
-            elif opponent_type == "aggressive":
-                agent = AggressiveAgent(player_id)
-            elif opponent_type == "smart":
-                agent = SmartAgent(player_id)
-            elif opponent_type == "adaptive":
-                agent = AdaptiveAgent(player_id)
-            elif opponent_type == "leader_only":
-                agent = LeaderOnlyAgent(player_id)
-            elif opponent_type == "leader_plus_one":
-                agent = LeaderPlusOneAgent(player_id)
-            elif opponent_type == "leech":
-                agent = LeechAgent(player_id)
-            elif opponent_type == "rank_based":
-                agent = RankBasedAgent(player_id)
-            else:
-                msg = f"Unknown opponent type: {opponent_type}"
-                raise ValueError(msg)
-
-            opponents.append(agent)
+            factory = configured[i] if i < len(configured) else _RANDOM_FACTORIES[type_draws[i]]
+            opponents.append(factory(player_id, seeds[i]))
 
         return opponents
 
-    def _is_learning_agent_active(self) -> bool:
-        """Check if learning agent is active (hasn't banked this round)."""
-        if self.game is None:
-            return False
-        player = self.game.state.get_player(self.learning_agent_id)
-        return player is not None and not player.has_banked_this_round
-
-    def _should_start_new_round(self) -> bool:
-        """Check if we should start a new round."""
-        if self.game is None or not self.game.is_round_over():
-            return False
-        if self.game.state.current_round is None:
-            return True
-        return self.game.state.current_round.round_number < self.total_rounds
-
     def _advance_game_to_next_decision(self) -> None:
         """Advance game state until learning agent needs to decide or game ends."""
-        while not self.game.is_game_over():  # type: ignore[union-attr]
-            if self._is_learning_agent_active():
-                # Learning agent active - check if round is over
-                if self._should_start_new_round():
-                    self.game.start_new_round()  # type: ignore[union-attr]
+        # Hoist the game, its state and the learning player into locals; the
+        # player object stays the same for the whole game
+        game = self.game
+        state = game.state  # type: ignore[union-attr]
+        player = state.get_player(self.learning_agent_id)
+        total_rounds = self.total_rounds
+
+        while not state.game_over:
+            if game.is_round_over():  # type: ignore[union-attr]
+                current_round = state.current_round
+                if current_round is not None and current_round.round_number >= total_rounds:
+                    break  # Last round finished; no new round to start
+
+                game.start_new_round()  # type: ignore[union-attr]
+                if player is not None and not player.has_banked_this_round:
                     break  # Learning agent can act in new round
-
-                if self.game.is_round_over():  # type: ignore[union-attr]
-                    break  # Game over check will trigger on next iteration
-
-                # Roll dice and let opponents decide
-                self.game.process_roll()  # type: ignore[union-attr]
-                if self.game.is_round_over():  # type: ignore[union-attr]
-                    continue  # Round ended by seven
-
-                self.game.poll_decisions()  # type: ignore[union-attr]
-                if self.game.is_round_over():  # type: ignore[union-attr]
-                    continue  # All opponents banked
-
-                break  # Learning agent's turn
-
-            # Learning agent has banked - continue without them
-            if self._should_start_new_round():
-                self.game.start_new_round()  # type: ignore[union-attr]
-                if self._is_learning_agent_active():
-                    break  # Learning agent active in new round
                 continue
 
-            if self.game.is_round_over():  # type: ignore[union-attr]
-                break  # Will check game over on next iteration
+            # Roll dice and let opponents decide
+            agent_active = player is not None and not player.has_banked_this_round
+            game.process_roll()  # type: ignore[union-attr]
+            if game.is_round_over():  # type: ignore[union-attr]
+                continue  # Round ended by seven
 
-            # Continue round
-            self.game.process_roll()  # type: ignore[union-attr]
-            if not self.game.is_round_over():  # type: ignore[union-attr]
-                self.game.poll_decisions()  # type: ignore[union-attr]
+            game.poll_decisions()  # type: ignore[union-attr]
+            if agent_active and not game.is_round_over():  # type: ignore[union-attr]
+                break  # Learning agent's turn
 
     def step(
         self,
@@ -417,12 +501,27 @@ class BankEnv:
 
         Returns:
             Tuple of (observation, reward, terminated, truncated, info)
-            - observation: 14-dimensional state vector
+            - observation: 14-dimensional state vector (reused buffer, valid
+              until the next reset()/step())
             - reward: Placeholder 0.0 (Task 2.2 will implement rewards)
             - terminated: True if episode ended naturally (game over)
             - truncated: Always False (no time limits)
             - info: Dictionary with game state information
 
+        Raises:
+            RuntimeError: If called before reset() or after episode ends
+
+        """
+        reward, terminated, info = self._step_game(action)
+
+        # The engine writes features straight from its state; no dict is built
+        self.game.fill_observation_array(self.learning_agent_id, self.total_rounds, self._obs_buf)
+        truncated = False  # No time limits
+        return self._obs_buf, reward, terminated, truncated, info
+
+    def _step_game(self, action: int) -> tuple[float, bool, dict[str, Any]]:
+        """Apply the action, advance the game and compute reward and info.
+
         Raises:
             RuntimeError: If called before reset() or after episode ends
 
@@ -443,23 +542,22 @@ class BankEnv:
         # Continue game until learning agent needs to act again or game ends
         self._advance_game_to_next_decision()
 
-        # Get observation for next state
-        obs = self.game.create_observation(self.learning_agent_id)
-        flat_obs = flatten_observation(obs, self.total_rounds)
-
         # Check if episode terminated
         terminated = self.game.is_game_over()
-        truncated = False  # No time limits
 
         # Calculate reward
         reward = self._calculate_reward(terminated)
 
-        # Collect info
+        # Collect info, read straight from the game state
+        state = self.game.state
         info: dict[str, Any] = {
-            "round_number": obs["round_number"],
-            "player_score": obs["player_score"],
-            "all_scores": obs["all_player_scores"].copy(),
+            "round_number": state.current_round.round_number,  # type: ignore[union-attr]
+            "player_score": state.players[self.learning_agent_id].score,
         }
+        if self.include_all_scores:
+            # A per-step snapshot; the read-only wrapper guards it without copying
+            scores = dict(zip((p.player_id for p in state.players), state.scores_arr.tolist(), strict=True))
+            info["all_scores"] = _ReadOnlyScores(scores)
 
         if terminated:
             # Add terminal info
@@ -472,13 +570,16 @@ class BankEnv:
 
             # Add tournament info if applicable
             if self.reward_scheme == "tournament":
-                info["tournament_game"] = self.current_tournament_game
-                info["tournament_progress"] = len(self.tournament_results)
-                if len(self.tournament_results) == self.tournament_size:
+                # The game counter wraps to 0 when this game completed a tournament
+                tournament_complete = self.current_tournament_game == 0
+                progress = self.tournament_size if tournament_complete else self.current_tournament_game
+                info["tournament_game"] = progress
+                info["tournament_progress"] = progress
+                if tournament_complete:
                     info["tournament_complete"] = True
                     info["tournament_reward"] = reward
 
-        return flat_obs, reward, terminated, truncated, info
+        return reward, terminated, info
 
     def get_action_mask(self) -> np.ndarray:
         """Get mask for valid actions.
@@ -491,9 +592,9 @@ class BankEnv:
         if self.game is None:
             return np.array([1, 1], dtype=np.int8)
 
-        # Get current observation
-        obs = self.game.create_observation(self.learning_agent_id)
-        can_bank = obs["can_bank"]
+        # Read the banked flag directly instead of building an observation
+        player = self.game.state.get_player(self.learning_agent_id)
+        can_bank = player is not None and not player.has_banked_this_round
 
         # Pass is always valid, bank only if can_bank is True
         return np.array([1, 1 if can_bank else 0], dtype=np.int8)
@@ -508,17 +609,16 @@ class BankEnv:
         if self.game is None:
             return 1
 
-        # Get all final scores
-        scores = [(p.player_id, p.score) for p in self.game.state.players]
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
-
-        # Find learning agent's rank
-        for rank, (pid, _) in enumerate(scores, start=1):
-            if pid == self.learning_agent_id:
-                return rank
-
-        return len(scores)  # Fallback
+        # Count players ranked ahead: higher scores, plus ties with a lower
+        # player ID (the order a stable descending sort would give)
+        scores = self.game.state.scores_arr.tolist()
+        me = self.learning_agent_id
+        my_score = scores[me]
+        ahead = 0
+        for pid, score in enumerate(scores):
+            if score > my_score or (score == my_score and pid < me):
+                ahead += 1
+        return ahead + 1
 
     def _calculate_reward(self, game_over: bool) -> float:
         """Calculate reward based on configured scheme.
@@ -580,35 +680,25 @@ class BankEnv:
 
         # Record this game's result
         winner = self.game.get_winner()
-        did_win = winner is not None and winner.player_id == self.learning_agent_id
-        rank = self._get_player_rank()
-
-        game_result = {
-            "did_win": did_win,
-            "rank": rank,
-            "score": self.game.state.get_player(self.learning_agent_id).score
-            if self.game.state.get_player(self.learning_agent_id)
-            else 0,
-        }
-
-        self.tournament_results.append(game_result)
+        player = self.game.state.get_player(self.learning_agent_id)
+        i = self.current_tournament_game
+        self._tour_wins[i] = winner is not None and winner.player_id == self.learning_agent_id
+        self._tour_ranks[i] = self._get_player_rank()
+        self._tour_scores[i] = player.score if player else 0
         self.current_tournament_game += 1
 
         # If tournament not complete, return 0
-        if len(self.tournament_results) < self.tournament_size:
+        if self.current_tournament_game < self.tournament_size:
             return 0.0
 
         # Tournament complete - calculate aggregate reward
-        wins = sum(1 for r in self.tournament_results if r["did_win"])
-        win_rate = wins / len(self.tournament_results)
-        avg_rank = float(np.mean([r["rank"] for r in self.tournament_results]))
-        ranks = [r["rank"] for r in self.tournament_results]
-        rank_std = float(np.std(ranks))
+        win_rate = int(self._tour_wins.sum()) * self._inv_tournament_size
+        avg_rank = int(self._tour_ranks.sum()) * self._inv_tournament_size
+        rank_std = float(self._tour_ranks.std())
 
         # Normalize rank to [0, 1] where 1 is best
         # With N players: rank 1 → 1.0, rank N → 0.0
-        num_players = len(self.game.state.players)
-        normalized_rank = (num_players - avg_rank) / (num_players - 1) if num_players > 1 else 1.0
+        normalized_rank = (self._num_players - avg_rank) * self._inv_rank_denom
 
         # Consistency bonus: reward low variance in ranks
         consistency_bonus = (
@@ -620,8 +710,7 @@ class BankEnv:
             self.tournament_win_weight * win_rate + self.tournament_rank_weight * normalized_rank + consistency_bonus
         )
 
-        # Reset tournament tracking
-        self.tournament_results = []
+        # Start the next tournament; the arrays are overwritten in place
         self.current_tournament_game = 0
 
         return reward
@@ -3,12 +3,29 @@
 Main training loop for DQN agents.
 
 NOTE: This module is part of Phase 4 (Training Environment & DQN) and is
-currently in development. It uses legacy interfaces from the card game
-implementation and needs to be updated for the dice game. See Phase 4
-in docs/PROJECT_PLAN.md for implementation roadmap.
+currently in development. See Phase 4 in docs/PROJECT_PLAN.md for the
+implementation roadmap.
 """
 
+from pathlib import Path
+
 import click
+import numpy as np
+
+try:
+    from bank.training.dqn_agent import TORCH_AVAILABLE, DQNAgent
+    from bank.training.environment import OBS_SIZE
+    from bank.training.vec_env import GYMNASIUM_AVAILABLE, make_vec_env
+
+    # These modules import without torch/gymnasium and only fail once used
+    ML_AVAILABLE = TORCH_AVAILABLE and GYMNASIUM_AVAILABLE
+    _ML_IMPORT_ERROR = None if ML_AVAILABLE else "torch and gymnasium are required"
+except ImportError as e:
+    ML_AVAILABLE = False
+    _ML_IMPORT_ERROR = str(e)
+
+# Episodes between progress lines
+LOG_EVERY = 100
 
 
 @click.command()
@@ -16,36 +33,72 @@ import click
 @click.option("--players", "-p", default=2, help="Number of players")
 @click.option("--save-path", "-s", default="models/dqn_agent.pth", help="Path to save trained model")
 @click.option("--load-path", "-l", default=None, help="Path to load existing model")
-def main(episodes: int, players: int, save_path: str, load_path: str | None):
+@click.option("--num-envs", "-n", default=8, help="Number of environments stepped in parallel")
+@click.option(
+    "--async-envs/--sync-envs",
+    default=True,
+    help="Step environments in worker processes or in this process",
+)
+@click.option(
+    "--compile-policy",
+    is_flag=True,
+    help="Compile the float32 forward pass and argmax into one graph (torch.compile) instead of acting in int8",
+)
+@click.option("--batch-size", default=64, help="Transitions per Q-network update")
+@click.option("--train-every", default=4, help="Vector-env steps between Q-network updates")
+@click.option("--target-update", default=1000, help="Vector-env steps between target network syncs")
+def main(
+    episodes: int,
+    players: int,
+    save_path: str,
+    load_path: str | None,
+    num_envs: int,
+    async_envs: bool,
+    compile_policy: bool,
+    batch_size: int,
+    train_every: int,
+    target_update: int,
+):
     """Train a DQN agent to play BANK!
 
     This script trains a Deep Q-Network agent using self-play and/or
     against other agents.
     """
-    try:
-        import numpy as np
-        import torch
-
-        from bank.training.dqn_agent import DQNAgent
-        from bank.training.environment import BankEnv
-    except ImportError as e:
+    if not ML_AVAILABLE:
         click.echo("Error: Missing required dependencies for training.")
         click.echo("Install with: pip install bank-game[ml]")
-        click.echo(f"Details: {e}")
+        click.echo(f"Details: {_ML_IMPORT_ERROR}")
         return
 
+    # Resolve the output directory up front so a bad path fails before training
+    save_dir = Path(save_path).parent
+    save_dir.mkdir(parents=True, exist_ok=True)
+
     click.echo("=" * 50)
     click.echo("DQN Training for BANK!")
     click.echo("=" * 50)
     click.echo(f"Episodes: {episodes}")
     click.echo(f"Players: {players}")
+    click.echo(f"Parallel environments: {num_envs} ({'async' if async_envs else 'sync'})")
     click.echo()
 
-    # Create environment
-    env = BankEnv(num_players=players)
+    # Create environments. Worker processes (one per env) pay off once steps
+    # are expensive; --sync-envs avoids the IPC cost for cheap ones
+    vec_env = make_vec_env(num_envs, asynchronous=async_envs and num_envs > 1, num_opponents=players - 1)
 
     # Create agent
-    agent = DQNAgent(player_id=0, name="DQN-Trainee")
+    # By default rollouts act through an int8 (float16 on CUDA) copy of the
+    # network that is refreshed on every target sync; updates train the
+    # float32 network. --compile-policy acts with a compiled float32 policy.
+    agent = DQNAgent(
+        player_id=0,
+        name="DQN-Trainee",
+        state_dim=OBS_SIZE,
+        action_dim=2,
+        inference_dtype=None if compile_policy else "qint8",
+        compile_network=compile_policy,
+        cuda_graph=True,
+    )
 
     if load_path:
         click.echo(f"Loading model from {load_path}")
@@ -54,42 +107,66 @@ def main(episodes: int, players: int, save_path: str, load_path: str | None):
     # Training loop
     click.echo("Starting training...")
 
-    for episode in range(episodes):
-        state, info = env.reset()
-        episode_reward = 0
-        done = False
-
-        while not done:
-            # Select action (using environment's action space)
-            if np.random.random() < agent.epsilon:
-                action = env.action_space.sample()
-            else:
-                with torch.no_grad():
-                    state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                    q_values = agent.q_network(state_tensor)
-                    action = q_values.argmax().item()
-
-            # Take action
-            next_state, reward, terminated, truncated, info = env.step(action)
-            done = terminated or truncated
-
-            episode_reward += reward
-            state = next_state
-
-        # Decay exploration
-        agent.update_epsilon()
-
-        # Log progress
-        if (episode + 1) % 100 == 0:
-            click.echo(
-                f"Episode {episode + 1}/{episodes} - Reward: {episode_reward:.2f} - Epsilon: {agent.epsilon:.3f}",
-            )
+    # Finished environments are reset on their next step, so the loop just
+    # keeps stepping and counts episodes as they end
+    states, _ = vec_env.reset()
+    # Per-env running returns, accumulated with one vectorized add per step
+    episode_rewards = np.zeros(num_envs, dtype=np.float32)
+    # False for an env whose next step is its autoreset (not a real transition)
+    recording = np.ones(num_envs, dtype=np.bool_)
+    completed = 0
+    next_log = LOG_EVERY
+    step = 0
+
+    while completed < episodes:
+        # One batched forward pass of shape (N, 14), epsilon-greedy per env
+        actions = agent.select_actions_batch(states)
+
+        next_states, rewards, terminated, truncated, _ = vec_env.step(actions)
+        done = terminated | truncated
+        episode_rewards += rewards
+
+        # Store the whole step's transitions in one replay-buffer insert
+        agent.store_batch(
+            states[recording],
+            actions[recording],
+            rewards[recording],
+            next_states[recording],
+            terminated[recording],
+        )
+        recording = ~done
+        states = next_states
+        step += 1
+
+        # Batched updates from the replay buffer
+        if step % train_every == 0:
+            agent.train_step(batch_size)
+        if step % target_update == 0:
+            agent.update_target_network()
+
+        # Most steps finish no episode; skip the bookkeeping entirely then
+        if not done.any():
+            continue
+
+        for i in np.flatnonzero(done):
+            completed += 1
+
+            # Decay exploration
+            agent.update_epsilon()
+
+            # Log progress (rewards are only formatted when a line is printed)
+            if completed >= next_log:
+                next_log += LOG_EVERY
+                click.echo(
+                    f"Episode {completed}/{episodes} - Reward: {float(episode_rewards[i]):.2f} - "
+                    f"Epsilon: {agent.epsilon:.3f}",
+                )
+        episode_rewards[done] = 0.0
+
+    vec_env.close()
 
     # Save model
     click.echo(f"\nSaving model to {save_path}")
-    import os
-
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     agent.save_model(save_path)
 
     click.echo("Training complete!")
@@ -0,0 +1,164 @@
+"""Vectorized BANK! environments.
+
+Steps several BankEnv instances together and exposes their observations as a
+single stacked array, so a policy can evaluate all of them in one batched
+forward pass.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+import numpy as np
+
+try:
+    import gymnasium as gym
+
+    GYMNASIUM_AVAILABLE = True
+except ImportError:
+    GYMNASIUM_AVAILABLE = False
+    gym = None
+
+from bank.training.environment import OBS_SIZE, BankEnv
+
+
+def make_vec_env(num_envs: int, asynchronous: bool = True, **env_kwargs: Any) -> gym.vector.VectorEnv:
+    """Create a Gymnasium vector env of BankEnv instances.
+
+    With ``asynchronous=True`` every environment runs in its own worker
+    process, so N games are simulated in parallel. Finished environments are
+    reset automatically on their next step() call (Gymnasium's next-step
+    autoreset), so a training loop can keep stepping without checking for
+    episode ends itself.
+
+    Args:
+        num_envs: Number of environments to run
+        asynchronous: Use AsyncVectorEnv (subprocesses) instead of SyncVectorEnv
+        **env_kwargs: Keyword arguments passed to every BankEnv
+
+    Returns:
+        Vector environment with observations of shape (num_envs, 14)
+
+    Raises:
+        ImportError: If gymnasium is not installed
+        ValueError: If num_envs is less than 1 or an ``rng`` is passed
+
+    """
+    if not GYMNASIUM_AVAILABLE:
+        msg = "Gymnasium is required for training. Install with: pip install gymnasium"
+        raise ImportError(msg)
+
+    if num_envs < 1:
+        msg = f"num_envs must be >= 1, got {num_envs}"
+        raise ValueError(msg)
+
+    # Every worker would get its own copy of the same generator state and
+    # play identical games; seed through reset(seed=...) instead
+    if "rng" in env_kwargs:
+        msg = "make_vec_env does not accept rng; pass seed to reset() instead"
+        raise ValueError(msg)
+
+    env_fns = [partial(BankEnv, **env_kwargs) for _ in range(num_envs)]
+    if asynchronous:
+        return gym.vector.AsyncVectorEnv(env_fns)
+    return gym.vector.SyncVectorEnv(env_fns)
+
+
+class VectorBankEnv:
+    """Runs K independent BankEnv instances in lockstep.
+
+    Environments are stepped in a Python loop, but observations, rewards and
+    termination flags are returned as stacked arrays. Finished environments
+    are reset automatically: their row in the returned observations holds the
+    first observation of the new episode, and the terminal observation is
+    kept in that env's info dict under ``"final_observation"``.
+
+    Attributes:
+        envs: The wrapped environments
+        num_envs: Number of environments (K)
+
+    """
+
+    def __init__(self, num_envs: int, **env_kwargs: Any) -> None:
+        """Create the wrapped environments.
+
+        Args:
+            num_envs: Number of environments to run
+            **env_kwargs: Keyword arguments passed to every BankEnv
+
+        Raises:
+            ValueError: If num_envs is less than 1
+
+        """
+        if num_envs < 1:
+            msg = f"num_envs must be >= 1, got {num_envs}"
+            raise ValueError(msg)
+
+        self.envs = [BankEnv(**env_kwargs) for _ in range(num_envs)]
+        self.num_envs = num_envs
+
+        # Stacked buffers reused across calls; valid until the next reset()/step()
+        self._obs = np.zeros((num_envs, OBS_SIZE), dtype=np.float32)
+        # Each env writes its observations straight into its own row
+        for env, row in zip(self.envs, self._obs, strict=True):
+            env.set_obs_buffer(row)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._terminated = np.zeros(num_envs, dtype=np.bool_)
+        self._truncated = np.zeros(num_envs, dtype=np.bool_)
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, list[dict[str, Any]]]:
+        """Reset every environment.
+
+        Args:
+            seed: Base seed; environment i is reset with ``seed + i``
+
+        Returns:
+            Tuple of (observations of shape (K, 14), list of info dicts)
+
+        """
+        infos = []
+        for i, env in enumerate(self.envs):
+            env_seed = None if seed is None else seed + i
+            _, info = env.reset(seed=env_seed)
+            infos.append(info)
+        return self._obs, infos
+
+    def step(
+        self,
+        actions: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict[str, Any]]]:
+        """Step every environment with its action, resetting finished ones.
+
+        Args:
+            actions: Array of K actions (0=pass, 1=bank)
+
+        Returns:
+            Tuple of (observations, rewards, terminated, truncated, infos)
+
+        """
+        # Each env's engine writes its features directly into this env's row
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, actions, strict=True)):
+            obs, reward, terminated, truncated, info = env.step(int(action))
+            self._rewards[i] = reward
+            self._terminated[i] = terminated
+            self._truncated[i] = truncated
+
+            if terminated or truncated:
+                # The row is about to be overwritten by the new episode
+                info["final_observation"] = obs.copy()
+                env.reset()
+
+            infos.append(info)
+
+        return self._obs, self._rewards, self._terminated, self._truncated, infos
+
+    def get_action_masks(self) -> np.ndarray:
+        """Get the valid-action mask of every environment.
+
+        Returns:
+            Array of shape (K, 2) with 1 for valid actions
+
+        """
+        return np.stack([env.get_action_mask() for env in self.envs])
@@ -1,9 +1,25 @@
 """Configuration utilities for BANK!"""
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple[str, ...]:
+    """Split a dot-notation key once; hot keys are looked up repeatedly."""
+    return tuple(key.split("."))
+
 
 class Config:
     """Configuration manager for BANK! game and training."""
@@ -36,21 +52,30 @@ class Config:
             config_path: Path to JSON config file (optional)
 
         """
-        self.config = self.DEFAULT_CONFIG.copy()
+        # Deep copy, so edits to a section never leak into DEFAULT_CONFIG
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
 
         if config_path and Path(config_path).exists():
             self.load(config_path)
 
     def load(self, path: str) -> None:
-        """Load configuration from JSON file."""
-        with open(path) as f:
-            custom_config = json.load(f)
-            self._merge_config(custom_config)
+        """Load configuration from JSON file (parsed with orjson when available)."""
+        with open(path, "rb") as f:
+            payload = f.read()
+        custom_config = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+        self._merge_config(custom_config)
 
     def save(self, path: str) -> None:
-        """Save configuration to JSON file."""
-        with open(path, "w") as f:
-            json.dump(self.config, f, indent=2)
+        """Save configuration to JSON file (encoded with orjson when available).
+
+        Non-string keys are written as strings by either encoder.
+        """
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(self.config, indent=2).encode()
+        with open(path, "wb") as f:
+            f.write(payload)
 
     def _merge_config(self, custom_config: dict[str, Any]) -> None:
         """Merge custom config with defaults."""
@@ -61,11 +86,14 @@ class Config:
                 self.config[key] = value
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by dot-notation key."""
-        keys = key.split(".")
+        """Get configuration value by dot-notation key.
+
+        The path is resolved against the live config dict, so changes made
+        directly to ``config`` (or to a returned section) are seen too.
+        """
         value = self.config
 
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
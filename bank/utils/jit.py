@@ -0,0 +1,49 @@
+"""Optional Numba JIT support.
+
+Numeric kernels decorate themselves with ``njit`` from this module. When
+numba is installed they are compiled to native code; otherwise the decorator
+is a no-op and the kernels run as plain Python with identical results.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile a function with ``numba.njit`` if numba is available.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms. Without
+    numba the function is returned unchanged.
+
+    Args:
+        *args: The function to compile, or nothing when options are given
+        **kwargs: Options forwarded to ``numba.njit``
+
+    Returns:
+        The compiled function, or a decorator producing it
+
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
+
+
+# Parallel range inside njit(parallel=True) kernels; plain range otherwise
+prange = numba.prange if NUMBA_AVAILABLE else range
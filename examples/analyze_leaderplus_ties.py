@@ -4,6 +4,12 @@ This script runs a large number of games with only LeaderPlusN agents and report
 """
 
 import collections
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
 
 from bank.agents.advanced_agents import (
     LeaderPlusFiveAgent,
@@ -14,6 +20,7 @@ from bank.agents.advanced_agents import (
     LeaderPlusThreeAgent,
     LeaderPlusTwoAgent,
 )
+from bank.experiments.parallel import pool_context
 from bank.game.engine import BankGame
 
 AGENT_CLASSES = [
@@ -31,24 +38,50 @@ NUM_ROUNDS = 20
 NUM_PLAYERS = 4
 
 
-def run_tournament(num_games=NUM_GAMES, num_rounds=NUM_ROUNDS, agent_classes=AGENT_CLASSES):
-    win_counts = collections.Counter()
-    tie_counts = collections.Counter()
-    all_ties = 0
-    for game_idx in range(num_games):
-        agents = [cls(i) for i, cls in enumerate(agent_classes[:NUM_PLAYERS])]
-        engine = BankGame(num_players=len(agents), agents=agents, total_rounds=num_rounds)
-        state = engine.play_game()
-        # Find all players with the highest score
-        scores = [p.score for p in state.players]
-        max_score = max(scores)
-        winners = [p.player_id for p in state.players if p.score == max_score]
-        if len(winners) > 1:
-            all_ties += 1
-            for w in winners:
-                tie_counts[w] += 1
-        for w in winners:
-            win_counts[w] += 1
+# Agents and engine reused across the games a process plays, keyed by setup
+_GAMES = {}
+
+
+def _play_one(seed, num_rounds, agent_classes):
+    """Play one seeded game and return each player's final score."""
+    key = (num_rounds, agent_classes)
+    cached = _GAMES.get(key)
+    if cached is None:
+        agents = [cls(i) for i, cls in enumerate(agent_classes)]
+        engine = BankGame(num_players=len(agents), agents=agents, total_rounds=num_rounds, rng=random.Random(seed))
+        _GAMES[key] = (agents, engine)
+    else:
+        agents, engine = cached
+        for agent in agents:
+            agent.reset()
+        engine.reset(seed=seed)
+    state = engine.play_game()
+    return np.fromiter((p.score for p in state.players), dtype=np.int32, count=len(state.players))
+
+
+def run_tournament(num_games=NUM_GAMES, num_rounds=NUM_ROUNDS, agent_classes=AGENT_CLASSES, workers=os.cpu_count()):
+    # Seat the first NUM_PLAYERS classes once; workers receive only those
+    play = partial(_play_one, num_rounds=num_rounds, agent_classes=tuple(agent_classes[:NUM_PLAYERS]))
+    seeds = range(num_games)
+
+    # Games are independent, so spread them across CPU cores
+    if not workers or workers <= 1:
+        results = [play(s) for s in seeds]
+    else:
+        chunksize = max(1, num_games // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+            results = list(pool.map(play, seeds, chunksize=chunksize))
+    score_matrix = np.stack(results)  # (num_games, num_players)
+
+    # Every player holding the game's top score is a winner; >1 winner is a tie
+    winner_mask = score_matrix == score_matrix.max(axis=1, keepdims=True)
+    tie_mask = winner_mask.sum(axis=1) > 1
+    win_totals = winner_mask.sum(axis=0)
+    tie_totals = (winner_mask & tie_mask[:, None]).sum(axis=0)
+
+    win_counts = collections.Counter({pid: int(n) for pid, n in enumerate(win_totals) if n})
+    tie_counts = collections.Counter({pid: int(n) for pid, n in enumerate(tie_totals) if n})
+    all_ties = int(tie_mask.sum())
     return win_counts, tie_counts, all_ties
 
 
@@ -4,6 +4,8 @@ This example shows how to inspect and analyze game state during a BANK! dice gam
 Demonstrates programmatic game execution, state access, and statistical analysis.
 """
 
+import numpy as np
+
 from bank.agents.random_agent import RandomAgent
 from bank.agents.rule_based import SmartAgent, ThresholdAgent
 from bank.game.engine import BankGame
@@ -17,6 +19,8 @@ def analyze_game_state(game: BankGame) -> None:
 
     """
     state = game.state
+    # Live int64 view of every player's score (indexed like state.players)
+    scores = state.scores_view
 
     print("\n" + "=" * 60)
     print("Game State Analysis")
@@ -54,7 +58,9 @@ def analyze_game_state(game: BankGame) -> None:
 
     # Player details
     print("\nPlayer Details:")
-    sorted_players = sorted(state.players, key=lambda p: p.score, reverse=True)
+    # Stable sort keeps tied players in seat order
+    order = np.argsort(-scores, kind="stable")
+    sorted_players = [state.players[i] for i in order]
 
     for rank, player in enumerate(sorted_players, 1):
         print(f"\n  {rank}. {player.name}:")
@@ -67,9 +73,9 @@ def analyze_game_state(game: BankGame) -> None:
 
     # Calculate statistics
     if state.players:
-        avg_score = sum(p.score for p in state.players) / len(state.players)
-        max_score = max(p.score for p in state.players)
-        min_score = min(p.score for p in state.players)
+        avg_score = float(scores.mean())
+        max_score = int(scores.max())
+        min_score = int(scores.min())
         print("\nScore Statistics:")
         print(f"  Average: {avg_score:.1f} points")
         print(f"  Highest: {max_score} points")
@@ -171,25 +177,18 @@ def inspect_single_round() -> None:
     print(f"Initial active players: {game.state.current_round.active_player_ids}")
     print(f"Roll count: {game.state.current_round.roll_count}")
 
-    # Simulate a few rolls manually to show inspection
-    for i in range(3):
+    # Play up to three rolls in one engine call, then inspect each of them
+    rolls = game.play_round_until(3)
+    for i, ((die1, die2), banked) in enumerate(rolls):
         print(f"\n--- Roll {i + 1} ---")
-        game.roll_dice()
-
-        if game.state.current_round.last_roll:
-            die1, die2 = game.state.current_round.last_roll
-            print(f"Dice: [{die1}] [{die2}]")
-            print(f"Bank now: {game.state.current_round.current_bank}")
-            print(f"Active players: {len(game.state.current_round.active_player_ids)}")
-
-        # Poll for decisions
-        banked = game.poll_decisions()
+        print(f"Dice: [{die1}] [{die2}]")
         if banked:
             print(f"Players who banked: {banked}")
 
-        if game.is_round_over():
-            print("Round ended!")
-            break
+    print(f"\nBank now: {game.state.current_round.current_bank}")
+    print(f"Active players: {len(game.state.current_round.active_player_ids)}")
+    if game.is_round_over():
+        print("Round ended!")
 
     print("\n" + "=" * 60)
 
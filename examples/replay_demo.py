@@ -5,53 +5,81 @@ This example shows how to:
 2. Save the replay to a JSON file
 3. Load and view replays with ReplayViewer
 4. Analyze specific rounds and player statistics
+5. Record several games at once and compare players across them
 
 Run with: python examples/replay_demo.py
 """
 
+import os
 import random
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from bank.agents.random_agent import RandomAgent
 from bank.agents.rule_based import AggressiveAgent, ConservativeAgent, SmartAgent
+from bank.experiments.parallel import pool_context
 from bank.game.engine import BankGame
 from bank.replay.recorder import GameRecorder, load_replay, save_replay
 from bank.replay.viewer import ReplayViewer
 
 
-def record_game() -> str:
-    """Record a game and save it to a temporary file.
+PLAYER_NAMES = ["Alice (Smart)", "Bob (Aggressive)", "Charlie (Conservative)", "Diana (Random)"]
+
+
+def record_one(seed: int) -> GameRecorder:
+    """Play one seeded game and return its recorder.
+
+    Args:
+        seed: Seed for the game's dice
 
     Returns:
-        Path to the saved replay file
+        Recorder holding the game's events
 
     """
-    print("=" * 60)
-    print("RECORDING A GAME")
-    print("=" * 60)
-
     # Create recorder
     recorder = GameRecorder()
 
     # Set up agents
     agents = [
-        SmartAgent(player_id=0, name="Alice (Smart)"),
-        AggressiveAgent(player_id=1, name="Bob (Aggressive)"),
-        ConservativeAgent(player_id=2, name="Charlie (Conservative)"),
-        RandomAgent(player_id=3, name="Diana (Random)"),
+        SmartAgent(player_id=0, name=PLAYER_NAMES[0]),
+        AggressiveAgent(player_id=1, name=PLAYER_NAMES[1]),
+        ConservativeAgent(player_id=2, name=PLAYER_NAMES[2]),
+        RandomAgent(player_id=3, name=PLAYER_NAMES[3]),
     ]
 
     # Create game with recorder
     game = BankGame(
         num_players=4,
-        player_names=["Alice (Smart)", "Bob (Aggressive)", "Charlie (Conservative)", "Diana (Random)"],
+        player_names=PLAYER_NAMES,
         total_rounds=5,
         agents=agents,
         recorder=recorder,  # Attach the recorder
-        rng=random.Random(42),  # Use seed for reproducible demo
+        rng=random.Random(seed),  # Use seed for reproducible demo
     )
 
+    game.play_game()
+    return recorder
+
+
+def _replay_dir() -> Path:
+    """Return (creating it if needed) the directory replays are saved to."""
+    temp_dir = Path(tempfile.gettempdir()) / "bank_replays"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir
+
+
+def record_game() -> str:
+    """Record a game and save it to a temporary file.
+
+    Returns:
+        Path to the saved replay file
+
+    """
+    print("=" * 60)
+    print("RECORDING A GAME")
+    print("=" * 60)
+
     # Play the game
     print("\nPlaying game with 4 agents...")
     print("- Alice uses SmartAgent strategy")
@@ -60,12 +88,10 @@ def record_game() -> str:
     print("- Diana uses RandomAgent strategy")
     print()
 
-    game.play_game()
+    recorder = record_one(42)
 
     # Save replay to temporary file
-    temp_dir = Path(tempfile.gettempdir()) / "bank_replays"
-    temp_dir.mkdir(exist_ok=True)
-    replay_path = str(temp_dir / "demo_game.json")
+    replay_path = str(_replay_dir() / "demo_game.json")
 
     save_replay(recorder, replay_path)
     print(f"\n✓ Game recorded and saved to: {replay_path}\n")
@@ -73,6 +99,35 @@ def record_game() -> str:
     return replay_path
 
 
+def record_games(n_games: int, workers: int | None = os.cpu_count()) -> list[str]:
+    """Record many games concurrently and save each replay.
+
+    Games are independent, so they are played across a process pool; game
+    i is seeded with i, so the replays do not depend on the worker count.
+
+    Args:
+        n_games: Number of games to record
+        workers: Number of worker processes; 1 (or None) records in-process
+
+    Returns:
+        Paths to the saved replay files, in game order
+
+    """
+    if not workers or workers <= 1 or n_games <= 1:
+        recorders = [record_one(seed) for seed in range(n_games)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+            recorders = list(pool.map(record_one, range(n_games)))
+
+    temp_dir = _replay_dir()
+    paths = []
+    for i, recorder in enumerate(recorders):
+        path = str(temp_dir / f"game_{i}.json")
+        save_replay(recorder, path)
+        paths.append(path)
+    return paths
+
+
 def view_replay(replay_path: str) -> None:
     """Load and display a replay using various viewer methods.
 
@@ -118,6 +173,28 @@ def view_replay(replay_path: str) -> None:
         viewer.print_player_stats(player_id)
 
 
+def compare_replays(replay_paths: list[str]) -> None:
+    """Print each player's statistics averaged over several replays.
+
+    Args:
+        replay_paths: Paths to saved replay files of games between the same players
+
+    """
+    print("=" * 60)
+    print(f"COMPARING {len(replay_paths)} REPLAYS")
+    print("=" * 60)
+
+    viewers = [ReplayViewer(load_replay(path)) for path in replay_paths]
+    print(f"\n{'Player':<24} {'Avg Score':>10} {'Avg Banks':>10} {'Avg Bank':>10}")
+    for player_id, name in enumerate(PLAYER_NAMES):
+        stats = [viewer.get_player_stats(player_id) for viewer in viewers]
+        avg_score = sum(s["final_score"] for s in stats) / len(stats)
+        avg_banks = sum(s["times_banked"] for s in stats) / len(stats)
+        avg_bank = sum(s["average_bank"] for s in stats) / len(stats)
+        print(f"{name:<24} {avg_score:>10.1f} {avg_banks:>10.1f} {avg_bank:>10.1f}")
+    print()
+
+
 def demonstrate_replay_analysis() -> None:
     """Run a complete demonstration of replay recording and viewing."""
     print()
@@ -134,6 +211,10 @@ def demonstrate_replay_analysis() -> None:
     # View the replay
     view_replay(replay_path)
 
+    # Record a batch of games in parallel and compare the players across them
+    print()
+    compare_replays(record_games(8))
+
     print("\n" + "=" * 60)
     print("DEMO COMPLETE")
     print("=" * 60)
@@ -145,11 +226,12 @@ def demonstrate_replay_analysis() -> None:
     print("  - Play-by-play: Complete game narrative with emojis")
     print("  - Round analysis: Detailed breakdown of specific rounds")
     print("  - Player stats: Banking patterns and decision metrics")
+    print("• Many games can be recorded in parallel and compared")
     print()
     print("Try modifying this script to:")
     print("• Record games with different agent combinations")
     print("• Analyze different rounds")
-    print("• Compare player statistics across multiple replays")
+    print("• Compare different agent lineups across multiple replays")
     print()
 
 
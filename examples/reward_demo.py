@@ -4,7 +4,10 @@ This script demonstrates both sparse and tournament reward schemes
 with a simple threshold-based strategy.
 """
 
+import numpy as np
+
 from bank.training.environment import BankEnv
+from bank.training.vec_env import VectorBankEnv
 
 
 def demo_sparse():
@@ -13,30 +16,37 @@ def demo_sparse():
     print("SPARSE REWARD DEMO (5 games)")
     print("=" * 70)
 
-    env = BankEnv(
+    # All 5 games run side by side; game i is seeded with i
+    num_games = 5
+    vec_env = VectorBankEnv(
+        num_games,
         num_opponents=3,
         opponent_types=["conservative", "aggressive", "smart"],
         total_rounds=5,
         reward_scheme="sparse",
     )
 
-    for game in range(5):
-        obs, _ = env.reset(seed=game)
-        total_reward = 0.0
+    obs, _ = vec_env.reset(seed=0)
+    total_rewards = np.zeros(num_games)
+    finished = np.zeros(num_games, dtype=np.bool_)
+    final_infos: list[dict] = [{}] * num_games
 
-        while True:
-            # Simple strategy: bank when >= 50 points
-            current_bank_feature = obs[2]  # tanh(current_bank/250)
-            action = 1 if current_bank_feature > 0.19 else 0
+    while not finished.all():
+        # Simple strategy: bank when >= 50 points
+        current_bank_feature = obs[:, 2]  # tanh(current_bank/250)
+        actions = (current_bank_feature > 0.19).astype(np.int64)
 
-            obs, reward, terminated, truncated, info = env.step(action)
-            total_reward += reward
+        obs, rewards, terminated, truncated, infos = vec_env.step(actions)
+        # Finished games are auto-reset; ignore them until the rest catch up
+        total_rewards += np.where(finished, 0.0, rewards)
 
-            if terminated:
-                break
+        for i in np.flatnonzero(terminated & ~finished):
+            final_infos[i] = infos[i]
+        finished |= terminated
 
+    for game, info in enumerate(final_infos):
         won = "✓" if info.get("did_win") else "✗"
-        print(f"  Game {game + 1}: {won} Score={info['player_score']:3d} Reward={total_reward:+.1f}")
+        print(f"  Game {game + 1}: {won} Score={info['player_score']:3d} Reward={total_rewards[game]:+.1f}")
 
     print()
 
@@ -1,6 +1,6 @@
 """Simulate a single round of BANK! with multiple LeaderPlusN agents, printing their wait counters and actions after each roll."""
 
-import random
+import numpy as np
 
 from bank.agents.advanced_agents import (
     LeaderPlusFourAgent,
@@ -9,12 +9,13 @@ from bank.agents.advanced_agents import (
     LeaderPlusTwoAgent,
 )
 
+# Rolls drawn per refill of the dice buffer
+ROLL_BUFFER_SIZE = 64
 
-class DummyObservation(dict):
-    pass
 
-
-def simulate_leaderplus_round():
+def simulate_leaderplus_round(seed: int | None = None):
+    rng = np.random.default_rng(seed)
+    dice: list[list[int]] = []
     agents = [
         LeaderPlusOneAgent(0),
         LeaderPlusTwoAgent(1),
@@ -27,27 +28,36 @@ def simulate_leaderplus_round():
     active = [True, True, True, True]
     wait_counters = [a._wait_counter for a in agents]
     was_leader = [a._was_leader for a in agents]
+    # One observation dict reused for every agent and roll; Observation is a
+    # TypedDict, so a plain dict is all agents need. all_player_scores is
+    # updated in place when someone banks, so later agents still see it.
+    score_map = dict(enumerate(scores))
+    obs = {
+        "roll_count": 0,
+        "can_bank": True,
+        "player_id": 0,
+        "player_score": 0,
+        "current_bank": 0,
+        "all_player_scores": score_map,
+    }
     print(f"Initial scores: {scores}")
     print(f"Agents: {[a.plus_n for a in agents]}")
     while any(active):
         roll_count += 1
-        die1, die2 = random.randint(1, 6), random.randint(1, 6)
+        # Draw dice in blocks rather than making two RNG calls per roll
+        if (roll_count - 1) % ROLL_BUFFER_SIZE == 0:
+            dice = rng.integers(1, 7, size=(ROLL_BUFFER_SIZE, 2)).tolist()
+        die1, die2 = dice[(roll_count - 1) % ROLL_BUFFER_SIZE]
         dice_sum = die1 + die2
         bank += dice_sum
         print(f"\nRoll {roll_count}: {die1} + {die2} = {dice_sum}, bank={bank}")
         for i, agent in enumerate(agents):
             if not active[i]:
                 continue
-            obs = DummyObservation(
-                {
-                    "roll_count": roll_count,
-                    "can_bank": True,
-                    "player_id": i,
-                    "player_score": scores[i],
-                    "current_bank": bank,
-                    "all_player_scores": {j: scores[j] for j in range(4)},
-                }
-            )
+            obs["roll_count"] = roll_count
+            obs["player_id"] = i
+            obs["player_score"] = scores[i]
+            obs["current_bank"] = bank
             action = agent.act(obs)
             wait_counters[i] = agent._wait_counter
             was_leader[i] = agent._was_leader
@@ -56,6 +66,7 @@ def simulate_leaderplus_round():
             )
             if action == "bank":
                 scores[i] += bank
+                score_map[i] = scores[i]
                 active[i] = False
                 print(f"    Agent {i} BANKS! New score: {scores[i]}")
         if all(not a for a in active):
@@ -5,8 +5,13 @@ Demonstrates how to create agents, run games in batch, and analyze performance.
 """
 
 import argparse
-from collections import defaultdict
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 
+import numpy as np
 from tqdm import tqdm
 
 from bank.agents.random_agent import RandomAgent
@@ -17,121 +22,190 @@ from bank.agents.rule_based import (
     SmartAgent,
     ThresholdAgent,
 )
+from bank.experiments.parallel import pool_context
+from bank.experiments.vectorized import simulate_threshold_games
 from bank.game.engine import BankGame
 
 
-def run_tournament(agent_configs: list[dict], num_games: int = 50, num_rounds: int = 5) -> dict:
+# Games per worker task; each task builds its agents once and resets them
+# between games, so this (not the worker count) fixes which games share agents
+_GAMES_PER_TASK = 64
+
+
+def _play_batch(seeds: range, agent_configs: list[dict], num_rounds: int) -> np.ndarray:
+    """Play a run of seeded tournament games with one reused set of agents.
+
+    Args:
+        seeds: Dice seed for each game
+        agent_configs: List of dicts with 'class', 'name', and optional 'kwargs'
+        num_rounds: Number of rounds per game
+
+    Returns:
+        Final scores with shape (len(seeds), num_players)
+
+    """
+    agents = [cfg["class"](player_id=i, name=cfg["name"], **cfg.get("kwargs", {})) for i, cfg in enumerate(agent_configs)]
+    game = BankGame(
+        num_players=len(agents),
+        player_names=[cfg["name"] for cfg in agent_configs],
+        agents=agents,
+        total_rounds=num_rounds,
+        rng=random.Random(),
+    )
+    scores = np.empty((len(seeds), len(agents)), dtype=np.int64)
+    for row, game_seed in enumerate(seeds):
+        for agent in agents:
+            agent.reset()
+        state = game.reset(seed=game_seed)
+        game.play_game()
+        scores[row] = state.scores_arr
+    return scores
+
+
+def run_tournament(
+    agent_configs: list[dict],
+    num_games: int = 50,
+    num_rounds: int = 5,
+    seed: int = 0,
+    workers: int | None = os.cpu_count(),
+) -> dict:
     """Run a tournament between multiple agents.
 
+    Games are independent, so they are spread across worker processes in
+    batches of ``_GAMES_PER_TASK``. Each batch constructs its agents once and
+    calls ``reset()`` between games. Game ``i`` is seeded with ``seed + i``
+    and batches are fixed, so results do not depend on the number of workers.
+
     Args:
         agent_configs: List of dicts with 'class', 'name', and optional 'kwargs'
         num_games: Number of games to play
         num_rounds: Number of rounds per game
+        seed: Base seed; game i uses seed + i
+        workers: Number of worker processes; 1 (or None) plays every game here
 
     Returns:
         Dictionary of statistics per agent
 
     """
-    stats = defaultdict(
-        lambda: {
-            "wins": 0,  # solo wins only
-            "tie_wins": 0,  # games where agent tied for first
-            "weighted_wins": 0.0,  # fractional win for ties
-            "total_score": 0,
-            "games": 0,
-            "avg_rounds_to_bank": 0.0,
-            "total_banks": 0,
-        },
-    )
-    # Head-to-head: stats[agent]['h2h'][opponent] = [games_played, games_won]
-    for cfg in agent_configs:
-        stats[cfg["name"]]["h2h"] = defaultdict(lambda: [0, 0])
-
     print(f"\n{'=' * 70}")
     print(f"Running Tournament: {num_games} games, {num_rounds} rounds each")
     print(f"{'=' * 70}\n")
     print(f"Competitors: {', '.join(cfg['name'] for cfg in agent_configs)}")
     print()
 
-    leader = None
-    leader_wins = 0
-    tie_games = 0
-    with tqdm(total=num_games, desc="Tournament Progress", ncols=100) as pbar:
-        for game_num in range(num_games):
-            # Create game
-            player_names = [cfg["name"] for cfg in agent_configs]
-            game = BankGame(
-                num_players=len(agent_configs),
-                player_names=player_names,
-                total_rounds=num_rounds,
-            )
+    names = [cfg["name"] for cfg in agent_configs]
+    play = partial(_play_batch, agent_configs=agent_configs, num_rounds=num_rounds)
+    batches = [
+        range(start, min(start + _GAMES_PER_TASK, seed + num_games))
+        for start in range(seed, seed + num_games, _GAMES_PER_TASK)
+    ]
+    # Solo wins so far, only for the progress bar's leader display. Wins only
+    # grow, so the leader can only be overtaken by an agent that just won.
+    solo_wins = np.zeros(len(names), dtype=np.int64)
+    leader = 0
+
+    with ExitStack() as stack:
+        if not workers or workers <= 1 or len(batches) <= 1:
+            played = map(play, batches)
+        else:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()))
+            played = pool.map(play, batches)
+
+        results = []
+        with tqdm(total=num_games, desc="Tournament Progress", ncols=100) as pbar:
+            for scores in played:
+                results.append(scores)
+                top = scores == scores.max(axis=1, keepdims=True)
+                solo = top.sum(axis=1) == 1
+                gained = np.bincount(scores[solo].argmax(axis=1), minlength=len(names))
+                solo_wins += gained
+                winners = np.flatnonzero(gained)
+                if winners.size:
+                    challenger = int(winners[solo_wins[winners].argmax()])
+                    if solo_wins[challenger] > solo_wins[leader]:
+                        leader = challenger
+                    if gained[leader]:
+                        pbar.set_postfix({"leader": names[leader], "wins": int(solo_wins[leader])}, refresh=False)
+                pbar.update(len(scores))
+
+    if not results:
+        return stats_from_scores(names, np.empty((0, len(names)), dtype=np.int64))
+    return stats_from_scores(names, np.concatenate(results))
+
+
+def stats_from_scores(names: list[str], scores: np.ndarray) -> dict:
+    """Build run_tournament()-style statistics from a score matrix.
+
+    Args:
+        names: Agent name for each column of scores
+        scores: Final scores with shape (num_games, num_players)
+
+    Returns:
+        Dictionary of statistics per agent, as returned by run_tournament()
 
-            # Create agent instances
-            agents = []
-            for i, cfg in enumerate(agent_configs):
-                agent_class = cfg["class"]
-                kwargs = cfg.get("kwargs", {})
-                agent = agent_class(player_id=i, name=cfg["name"], **kwargs)
-                agents.append(agent)
-
-            # Set agents and run game
-            game.agents = agents
-            game.play_game()
-
-            # Collect statistics
-            max_score = max(p.score for p in game.state.players)
-            winners = [player for player in game.state.players if player.score == max_score]
-            if len(winners) > 1:
-                tie_games += 1
-            # Head-to-head: for each pair, track who scored higher
-            player_scores = {p.name: p.score for p in game.state.players}
-            for agent_name in player_scores:
-                for opponent_name in player_scores:
-                    if agent_name == opponent_name:
-                        continue
-                    stats[agent_name]["h2h"][opponent_name][0] += 1
-                    if player_scores[agent_name] > player_scores[opponent_name]:
-                        stats[agent_name]["h2h"][opponent_name][1] += 1
-
-            for player in game.state.players:
-                agent_name = player.name
-                stats[agent_name]["games"] += 1
-                stats[agent_name]["total_score"] += player.score
-                # Check if winner (handle ties)
-                if player.score == max_score:
-                    if len(winners) == 1:
-                        stats[agent_name]["wins"] += 1  # solo win
-                        stats[agent_name]["weighted_wins"] += 1.0
-                    else:
-                        stats[agent_name]["tie_wins"] += 1  # tied for first
-                        stats[agent_name]["weighted_wins"] += 1.0 / len(winners)
-
-            # Update leader info
-            leader, leader_wins = max(stats.items(), key=lambda x: x[1]["wins"])
-            pbar.set_postfix({"leader": leader, "wins": leader_wins["wins"]})
-            pbar.update(1)
-    stats["_tie_games"] = tie_games
+    """
+    num_games = len(scores)
+    num_players = len(names)
+    winner_mask = scores == scores.max(axis=1, keepdims=True)
+    num_winners = winner_mask.sum(axis=1)
+    solo_wins = np.bincount(scores.argmax(axis=1)[num_winners == 1], minlength=num_players)
+    tie_wins = (winner_mask & (num_winners > 1)[:, None]).sum(axis=0)
+    weighted = (winner_mask / num_winners[:, None]).sum(axis=0)
+    # beats[i, j] = games in which player i outscored player j, built one row
+    # at a time so memory stays O(games * players) rather than O(games * players^2)
+    beats = np.zeros((num_players, num_players), dtype=np.int64)
+    for i in range(num_players):
+        beats[i] = (scores[:, i : i + 1] > scores).sum(axis=0)
+
+    stats: dict = {}
+    for i, name in enumerate(names):
+        stats[name] = {
+            "wins": int(solo_wins[i]),
+            "tie_wins": int(tie_wins[i]),
+            "weighted_wins": float(weighted[i]),
+            "total_score": int(scores[:, i].sum()),
+            "games": num_games,
+            "avg_rounds_to_bank": 0.0,
+            "total_banks": 0,
+            "h2h": {other: [num_games, int(beats[i, j])] for j, other in enumerate(names) if j != i},
+        }
+    stats["_tie_games"] = int((num_winners > 1).sum())
     stats["_num_games"] = num_games
+    stats["_h2h_names"] = list(names)
+    stats["_h2h_wins"] = beats
     return stats
 
 
+def run_tournament_vectorized(agent_configs: list[dict], num_games: int = 50, num_rounds: int = 5, seed: int = 0) -> dict:
+    """Run a ThresholdAgent-only tournament with all games played at once.
+
+    Args:
+        agent_configs: List of dicts with 'class' (ThresholdAgent), 'name', and optional 'kwargs'
+        num_games: Number of games to play
+        num_rounds: Number of rounds per game
+        seed: Seed for the dice
+
+    Returns:
+        Dictionary of statistics per agent, as returned by run_tournament()
+
+    Raises:
+        ValueError: If any agent is not a ThresholdAgent
+
+    """
+    for cfg in agent_configs:
+        if cfg["class"] is not ThresholdAgent:
+            msg = f"Vectorized tournaments only support ThresholdAgent, got {cfg['class'].__name__}"
+            raise ValueError(msg)
+
+    thresholds = [cfg.get("kwargs", {}).get("threshold", 50) for cfg in agent_configs]
+    scores = simulate_threshold_games(thresholds, num_games, seed=seed, total_rounds=num_rounds)
+    return stats_from_scores([cfg["name"] for cfg in agent_configs], scores)
+
+
 def print_tournament_results(stats: dict) -> None:
-    # Head-to-head matrix output
-    agent_names = [k for k, v in stats.items() if isinstance(v, dict) and "h2h" in v]
-    agent_names.sort()
-    for row_agent in agent_names:
-        row = f"{row_agent[:14]:>16}"
-        for col_agent in agent_names:
-            if row_agent == col_agent:
-                row += f"{'--':>13}"
-            else:
-                games, wins = stats[row_agent]["h2h"][col_agent]
-                pct = (wins / games * 100) if games > 0 else 0.0
-                row += f"{pct:>12.1f}% "
     """Print formatted tournament results with proper standard competition ranking and tie counts."""
-    print(f"\n{'=' * 70}")
-    print("Tournament Results")
-    print(f"{'=' * 70}\n")
+    # Lines are collected and written once at the end
+    lines = ["", "=" * 70, "Tournament Results", "=" * 70, ""]
 
     # Filter out debug keys (like '_tie_games', '_num_games')
     agent_items = [(k, v) for k, v in stats.items() if isinstance(v, dict) and "h2h" in v]
@@ -143,16 +217,17 @@ def print_tournament_results(stats: dict) -> None:
         tie_wins = agent_stats.get("tie_wins", 0)
         agent_stats["losses"] = games - wins - tie_wins
         agent_stats["avg_score"] = agent_stats["total_score"] / games if games > 0 else 0
-    # Sort by fewest losses (ascending), then most solo wins (descending), then weighted wins (descending), then avg score (descending)
-    sorted_agents = sorted(
-        agent_items,
-        key=lambda x: (
-            x[1]["losses"],
-            -x[1]["wins"],
-            -x[1].get("weighted_wins", 0),
-            -x[1]["avg_score"],
+    # Sort by fewest losses (ascending), then most solo wins (descending), then weighted wins (descending), then avg score (descending).
+    # np.lexsort is stable and treats its last key as the primary one.
+    order = np.lexsort(
+        (
+            -np.array([a["avg_score"] for _, a in agent_items], dtype=float),
+            -np.array([a.get("weighted_wins", 0) for _, a in agent_items], dtype=float),
+            -np.array([a["wins"] for _, a in agent_items], dtype=np.int64),
+            np.array([a["losses"] for _, a in agent_items], dtype=np.int64),
         ),
     )
+    sorted_agents = [agent_items[i] for i in order]
 
     # Group by wins for standard competition ranking
     results = []
@@ -168,11 +243,11 @@ def print_tournament_results(stats: dict) -> None:
         results.append((rank, win_group))
         rank += len(win_group)
 
-    # Print header
-    print(
+    # Header
+    lines.append(
         f"{'Rank':<5} {'Agent':<22} {'Losses':<8} {'Wins':<6} {'Ties':<6} {'WtdWins':<8} {'Avg Score':<10} {'Win Rate':<13} {'Tie Rate':<10} {'Medal':<5}",
     )
-    print("-" * 110)
+    lines.append("-" * 110)
 
     # Print each group of tied agents
     for rank, win_group in results:
@@ -200,10 +275,46 @@ def print_tournament_results(stats: dict) -> None:
             weighted_win_str = f"{weighted_wins:.2f} ({weighted_win_rate:.1f}%)"
             win_rate_str = f"{wins} ({win_rate:.1f}%)"
             tie_rate_str = f"{tie_wins} ({tie_rate:.1f}%)"
-            print(
+            lines.append(
                 f"{rank_str:<5} {agent_name:<22} {losses:<8} {wins:<6} {tie_wins:<6} {weighted_win_str:<8} {avg_score:<10.1f} {win_rate_str:<13} {tie_rate_str:<10} {medal_str:<5}",
             )
-    print()
+    lines.append("")
+    lines += head_to_head_lines(stats)
+    print("\n".join(lines))
+
+
+def head_to_head_lines(stats: dict) -> list[str]:
+    """Format the head-to-head win-rate matrix from a tournament's statistics.
+
+    Cell (row, column) is the percentage of games in which the row agent
+    outscored the column agent. Reads the ``_h2h_wins`` matrix directly
+    rather than the per-agent ``h2h`` dicts.
+
+    Args:
+        stats: Statistics as returned by run_tournament()
+
+    Returns:
+        Output lines, or an empty list if the stats have no matrix
+
+    """
+    names = stats.get("_h2h_names")
+    if not names:
+        return []
+    wins = stats["_h2h_wins"]
+    games = stats["_num_games"]
+    rates = wins / games * 100 if games > 0 else np.zeros_like(wins, dtype=float)
+    order = sorted(range(len(names)), key=names.__getitem__)
+
+    lines = [
+        "Head-to-Head Win Rates (row outscored column)",
+        "-" * 110,
+        f"{'':>16}" + "".join(f"{names[j][:12]:>13}" for j in order),
+    ]
+    for i in order:
+        cells = (f"{'--':>13}" if i == j else f"{rates[i, j]:>12.1f}%" for j in order)
+        lines.append(f"{names[i][:14]:>16}" + "".join(cells))
+    lines.append("")
+    return lines
 
 
 def compare_strategies(num_games=1000, num_rounds=20) -> None:
@@ -221,21 +332,7 @@ def compare_strategies(num_games=1000, num_rounds=20) -> None:
         LeechAgent,
         RankBasedAgent,
     )
-    from bank.agents.threshold_agents import (
-        threshold_250_agent,
-        threshold_275_agent,
-        threshold_300_agent,
-        threshold_325_agent,
-        threshold_350_agent,
-        threshold_375_agent,
-        threshold_400_agent,
-        threshold_425_agent,
-        threshold_450_agent,
-        threshold_475_agent,
-        threshold_500_agent,
-        threshold_550_agent,
-        threshold_600_agent,
-    )
+    from bank.agents.threshold_agents import AdaptiveThresholdAgent
 
     agent_configs = [
         {"class": RandomAgent, "name": "Random", "kwargs": {"seed": 42}},
@@ -255,19 +352,11 @@ def compare_strategies(num_games=1000, num_rounds=20) -> None:
         {"class": LeaderPlusSevenAgent, "name": "LeaderPlusSeven"},
         {"class": LeechAgent, "name": "Leech"},
         {"class": RankBasedAgent, "name": "RankBased"},
-        {"class": threshold_250_agent, "name": "Threshold-250"},
-        {"class": threshold_275_agent, "name": "Threshold-275"},
-        {"class": threshold_300_agent, "name": "Threshold-300"},
-        {"class": threshold_325_agent, "name": "Threshold-325"},
-        {"class": threshold_350_agent, "name": "Threshold-350"},
-        {"class": threshold_375_agent, "name": "Threshold-375"},
-        {"class": threshold_400_agent, "name": "Threshold-400"},
-        {"class": threshold_425_agent, "name": "Threshold-425"},
-        {"class": threshold_450_agent, "name": "Threshold-450"},
-        {"class": threshold_475_agent, "name": "Threshold-475"},
-        {"class": threshold_500_agent, "name": "Threshold-500"},
-        {"class": threshold_550_agent, "name": "Threshold-550"},
-        {"class": threshold_600_agent, "name": "Threshold-600"},
+    ]
+    # One class parameterized by threshold, rather than a factory per value
+    agent_configs += [
+        {"class": AdaptiveThresholdAgent, "name": f"Threshold-{t}", "kwargs": {"threshold": t}}
+        for t in (250, 275, 300, 325, 350, 375, 400, 425, 450, 475, 500, 550, 600)
     ]
 
     # Run tournament
@@ -305,13 +394,31 @@ def quick_comparison() -> None:
     print_tournament_results(stats)
 
 
+def threshold_sweep(num_games=100_000, num_rounds=20) -> None:
+    """Compare fixed banking thresholds with the vectorized simulator."""
+    agent_configs = [
+        {"class": ThresholdAgent, "name": f"Threshold{t}", "kwargs": {"threshold": t}} for t in range(20, 201, 30)
+    ]
+    print(f"\nThreshold sweep: {num_games} games, {num_rounds} rounds each (vectorized)")
+    stats = run_tournament_vectorized(agent_configs, num_games=num_games, num_rounds=num_rounds)
+    print_tournament_results(stats)
+
+
 def main():
     parser = argparse.ArgumentParser(description="BANK! Tournament Runner")
     parser.add_argument("--games", type=int, default=1000, help="Number of games to run")
     parser.add_argument("--rounds", type=int, default=20, help="Number of rounds per game")
+    parser.add_argument(
+        "--threshold-sweep",
+        action="store_true",
+        help="Run a ThresholdAgent-only sweep with the vectorized simulator instead",
+    )
     args = parser.parse_args()
 
-    compare_strategies(num_games=args.games, num_rounds=args.rounds)
+    if args.threshold_sweep:
+        threshold_sweep(num_games=args.games, num_rounds=args.rounds)
+    else:
+        compare_strategies(num_games=args.games, num_rounds=args.rounds)
 
 
 if __name__ == "__main__":
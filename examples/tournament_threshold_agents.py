@@ -2,10 +2,11 @@
 
 Runs a 1000-game tournament (20 rounds each) for all advanced threshold agents and selected others.
 Collects stats on wins, ties, and losses for each agent.
+Games are independent, so they are spread across a process pool.
 """
 
+import multiprocessing
 import random
-from collections import Counter, defaultdict
 
 from bank.agents.advanced_agents import (
     LeaderOnlyAgent,
@@ -13,6 +14,7 @@ from bank.agents.advanced_agents import (
     LeechAgent,
     RankBasedAgent,
 )
+from bank.agents.base import Agent
 from bank.agents.rule_based import AggressiveAgent, ConservativeAgent, SmartAgent
 from bank.agents.threshold_agents import (
     threshold_300_agent,
@@ -21,6 +23,7 @@ from bank.agents.threshold_agents import (
     threshold_450_agent,
     threshold_500_agent,
 )
+from bank.experiments.parallel import pool_context
 from bank.game.engine import BankGame
 
 AGENT_FACTORIES = [
@@ -41,37 +44,97 @@ AGENT_FACTORIES = [
 NUM_GAMES = 1000
 ROUNDS = 20
 
-results = defaultdict(lambda: Counter({"win": 0, "tie": 0, "loss": 0}))
-
-for i, (name, factory) in enumerate(AGENT_FACTORIES):
-    print(f"\nEvaluating {name} agent...")
-    for game_idx in range(NUM_GAMES):
-        # Each agent plays against 3 random others (no duplicates)
-        others = [f for j, f in enumerate(AGENT_FACTORIES) if j != i]
-        opponents = random.sample(others, 3)
-        agents = [factory(0)] + [op(1 + k) for k, op in enumerate(opponents)]
-        agent_names = [name] + [n for n, _ in random.sample(others, 3)]
-        game = BankGame(num_players=4, agents=agents, total_rounds=ROUNDS, rng=random.Random(game_idx))
-        game.play_game()
-        winner = game.state.winner
-        my_score = game.state.players[0].score
-        scores = [p.score for p in game.state.players]
-        max_score = max(scores)
-        if my_score == max_score:
-            if scores.count(max_score) > 1:
-                results[name]["tie"] += 1
-            else:
-                results[name]["win"] += 1
-        else:
-            results[name]["loss"] += 1
-    print(f"{name}: {results[name]['win']} wins, {results[name]['tie']} ties, {results[name]['loss']} losses")
-
-print("\n--- TOURNAMENT SUMMARY ---")
-for name, stats in results.items():
-    total = stats["win"] + stats["tie"] + stats["loss"]
-    win_pct = 100 * stats["win"] / total
-    tie_pct = 100 * stats["tie"] / total
-    loss_pct = 100 * stats["loss"] / total
-    print(
-        f"{name:15}: {stats['win']:4} wins, {stats['tie']:4} ties, {stats['loss']:4} losses | Win%: {win_pct:.1f}  Tie%: {tie_pct:.1f}  Loss%: {loss_pct:.1f}"
+# Opponent pool (indices into AGENT_FACTORIES) for each evaluated agent: everyone else
+OPPONENT_POOLS = [[j for j in range(len(AGENT_FACTORIES)) if j != i] for i in range(len(AGENT_FACTORIES))]
+
+# Per-process RNGs, reseeded for every game instead of allocating new ones
+_OPPONENT_RNG = random.Random()
+_DICE_RNG = random.Random()
+
+# Per-process agents keyed by (index into AGENT_FACTORIES, player_id). Every
+# agent here clears its per-game state in reset(), so one instance per seat
+# serves all of this process's games
+_AGENT_CACHE: dict[tuple[int, int], Agent] = {}
+
+
+def get_agent(factory_idx: int, player_id: int) -> Agent:
+    """Return this process's agent for a seat, reset for a new game.
+
+    Args:
+        factory_idx: Index into AGENT_FACTORIES
+        player_id: Seat the agent plays in
+
+    Returns:
+        The cached agent, built on first use
+
+    """
+    agent = _AGENT_CACHE.get((factory_idx, player_id))
+    if agent is None:
+        agent = _AGENT_CACHE[factory_idx, player_id] = AGENT_FACTORIES[factory_idx][1](player_id)
+    else:
+        agent.reset()
+    return agent
+
+
+def run_one_game(job: tuple[int, int]) -> tuple[str, str]:
+    """Play one game for an evaluated agent against 3 random others.
+
+    Only ints cross the process boundary; agents come from the worker's cache.
+    The opponents and dice are seeded from the job, so results do not depend
+    on which worker plays it.
+
+    Args:
+        job: (game index, index into AGENT_FACTORIES of the evaluated agent)
+
+    Returns:
+        (agent name, "win" | "tie" | "loss")
+
+    """
+    game_idx, agent_idx = job
+    _DICE_RNG.seed(game_idx)
+    name = AGENT_FACTORIES[agent_idx][0]
+    # Each agent plays against 3 random others (no duplicates)
+    _OPPONENT_RNG.seed(agent_idx * NUM_GAMES + game_idx)
+    seats = [agent_idx, *_OPPONENT_RNG.sample(OPPONENT_POOLS[agent_idx], 3)]
+    agent_names = [AGENT_FACTORIES[idx][0] for idx in seats]
+    agents = [get_agent(idx, player_id) for player_id, idx in enumerate(seats)]
+    game = BankGame(
+        num_players=4,
+        player_names=agent_names,
+        agents=agents,
+        total_rounds=ROUNDS,
+        rng=_DICE_RNG,
     )
+    game.play_game()
+    # The engine's winner is the first top scorer, so it is player 0 exactly
+    # when the evaluated agent has the top score (alone or tied)
+    if game.state.winner != 0:
+        return name, "loss"
+    scores = game.state.scores_arr
+    if (scores == scores[0]).sum() > 1:
+        return name, "tie"
+    return name, "win"
+
+
+def main() -> None:
+    # The agent set is fixed, so every tally is allocated up front
+    results = {name: {"win": 0, "tie": 0, "loss": 0} for name, _ in AGENT_FACTORIES}
+    jobs = [(game_idx, i) for i in range(len(AGENT_FACTORIES)) for game_idx in range(NUM_GAMES)]
+
+    print(f"Playing {len(jobs)} games across {multiprocessing.cpu_count()} processes...")
+    with pool_context().Pool() as pool:
+        for name, outcome in pool.imap_unordered(run_one_game, jobs, chunksize=50):
+            results[name][outcome] += 1
+
+    rows = [
+        f"{name:15}: {stats['win']:4} wins, {stats['tie']:4} ties, {stats['loss']:4} losses | "
+        f"Win%: {100 * stats['win'] / total:.1f}  Tie%: {100 * stats['tie'] / total:.1f}  "
+        f"Loss%: {100 * stats['loss'] / total:.1f}"
+        for name, stats in results.items()
+        if (total := stats["win"] + stats["tie"] + stats["loss"])
+    ]
+    print("\n--- TOURNAMENT SUMMARY ---\n" + "\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
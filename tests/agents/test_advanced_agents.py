@@ -14,6 +14,22 @@ from bank.agents.base import Observation
 from bank.game.engine import BankGame
 
 
+@pytest.fixture
+def base_obs() -> Observation:
+    """Two-player mid-round observation; tests override the fields they vary."""
+    return {
+        "round_number": 1,
+        "roll_count": 3,
+        "current_bank": 15,
+        "last_roll": (4, 3),
+        "active_player_ids": {0, 1},
+        "player_id": 0,
+        "player_score": 50,
+        "can_bank": True,
+        "all_player_scores": {0: 50, 1: 60},
+    }
+
+
 class TestLeaderOnlyAgent:
     """Tests for LeaderOnlyAgent."""
 
@@ -26,78 +42,47 @@ class TestLeaderOnlyAgent:
         agent_custom = LeaderOnlyAgent(player_id=1, name="CustomLeader")
         assert agent_custom.name == "CustomLeader"
 
-    def test_banks_when_becoming_leader(self) -> None:
-        """Test agent banks when it would become the leader."""
+    @pytest.mark.parametrize(
+        ("opponent_score", "expected"),
+        [
+            # Player has 50, bank is 15: 65 > 60 takes the lead
+            (60, "bank"),
+            # 65 < 80 would not take the lead
+            (80, "pass"),
+        ],
+    )
+    def test_banks_only_when_becoming_leader(self, base_obs: Observation, opponent_score: int, expected: str) -> None:
+        """Test agent banks exactly when banking would make it the leader."""
         agent = LeaderOnlyAgent(player_id=0)
+        obs: Observation = {**base_obs, "all_player_scores": {0: 50, 1: opponent_score}}
 
-        # Scenario: player has 50, opponent has 60, bank is 15
-        # After banking: player would have 65 > 60
-        obs: Observation = {
-            "round_number": 1,
-            "roll_count": 3,
-            "current_bank": 15,
-            "last_roll": (4, 3),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 50,
-            "can_bank": True,
-            "all_player_scores": {0: 50, 1: 60},
-        }
-
-        assert agent.act(obs) == "bank"
-
-    def test_does_not_bank_when_not_becoming_leader(self) -> None:
-        """Test agent passes when banking wouldn't make it leader."""
-        agent = LeaderOnlyAgent(player_id=0)
+        assert agent.act(obs) == expected
 
-        # Scenario: player has 50, opponent has 80, bank is 15
-        # After banking: player would have 65 < 80
-        obs: Observation = {
-            "round_number": 1,
-            "roll_count": 3,
-            "current_bank": 15,
-            "last_roll": (4, 3),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 50,
-            "can_bank": True,
-            "all_player_scores": {0: 50, 1: 80},
-        }
-
-        assert agent.act(obs) == "pass"
-
-    def test_respects_can_bank_constraint(self) -> None:
+    def test_respects_can_bank_constraint(self, base_obs: Observation) -> None:
         """Test agent passes when can_bank is False."""
         agent = LeaderOnlyAgent(player_id=0)
 
         obs: Observation = {
-            "round_number": 1,
-            "roll_count": 3,
+            **base_obs,
             "current_bank": 100,
             "last_roll": (5, 5),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 50,
             "can_bank": False,  # Already banked
             "all_player_scores": {0: 50, 1: 40},
         }
 
         assert agent.act(obs) == "pass"
 
-    def test_banks_with_small_amount_when_already_leader(self) -> None:
+    def test_banks_with_small_amount_when_already_leader(self, base_obs: Observation) -> None:
         """Test agent banks even small amounts when already leading."""
         agent = LeaderOnlyAgent(player_id=0)
 
         # Already leading (100 > 80), bank is only 5
         obs: Observation = {
-            "round_number": 1,
+            **base_obs,
             "roll_count": 2,
             "current_bank": 5,
             "last_roll": (2, 3),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
             "player_score": 100,
-            "can_bank": True,
             "all_player_scores": {0: 100, 1: 80},
         }
 
@@ -114,63 +99,46 @@ class TestLeaderPlusOneAgent:
         assert agent.player_id == 0
         assert "LeaderPlusOne" in agent.name
 
-    def test_does_not_bank_on_first_roll(self) -> None:
+    def test_does_not_bank_on_first_roll(self, base_obs: Observation) -> None:
         """Test agent waits at least one roll even when becoming leader."""
         agent = LeaderPlusOneAgent(player_id=0)
 
         # Would become leader but roll_count is 1
-        obs: Observation = {
-            "round_number": 1,
-            "roll_count": 1,
-            "current_bank": 20,
-            "last_roll": (6, 6),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 50,
-            "can_bank": True,
-            "all_player_scores": {0: 50, 1: 60},
-        }
+        obs: Observation = {**base_obs, "roll_count": 1, "current_bank": 20, "last_roll": (6, 6)}
 
         assert agent.act(obs) == "pass"
 
-    def test_banks_after_waiting_when_becoming_leader(self) -> None:
+    def test_banks_after_waiting_when_becoming_leader(self, base_obs: Observation) -> None:
         """Test agent banks after waiting when it would become leader."""
         agent = LeaderPlusOneAgent(player_id=0)
 
         # Roll 2+, would become leader
-        obs: Observation = {
-            "round_number": 1,
-            "roll_count": 2,
-            "current_bank": 20,
-            "last_roll": (5, 4),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 50,
-            "can_bank": True,
-            "all_player_scores": {0: 50, 1: 60},
-        }
+        obs: Observation = {**base_obs, "roll_count": 2, "current_bank": 20, "last_roll": (5, 4)}
 
         assert agent.act(obs) == "bank"
 
-    def test_does_not_bank_when_not_leader_even_after_waiting(self) -> None:
+    def test_does_not_bank_when_not_leader_even_after_waiting(self, base_obs: Observation) -> None:
         """Test agent still won't bank if not becoming leader."""
         agent = LeaderPlusOneAgent(player_id=0)
 
         # Waited (roll 3) but still wouldn't be leader
-        obs: Observation = {
-            "round_number": 1,
-            "roll_count": 3,
-            "current_bank": 15,
-            "last_roll": (4, 3),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 50,
-            "can_bank": True,
-            "all_player_scores": {0: 50, 1: 80},
-        }
+        obs: Observation = {**base_obs, "all_player_scores": {0: 50, 1: 80}}
 
         assert agent.act(obs) == "pass"
 
+    def test_reset_clears_wait_state(self) -> None:
+        """Test reset() returns the agent to its freshly constructed state."""
+        agent = LeaderPlusOneAgent(player_id=0)
+        agent._was_leader = True
+        agent._wait_counter = 1
+        agent._last_roll_count = 5
+
+        agent.reset()
+
+        assert agent._was_leader is False
+        assert agent._wait_counter == 0
+        assert agent._last_roll_count is None
+
 
 class TestLeechAgent:
     """Tests for LeechAgent."""
@@ -186,60 +154,45 @@ class TestLeechAgent:
         assert agent_custom.min_bank == 50
         assert agent_custom.min_banked_players == 1
 
-    def test_banks_when_enough_players_banked(self) -> None:
-        """Test agent banks when enough players have banked."""
-        agent = LeechAgent(player_id=0, min_banked_players=2)
-
-        # 4 total players, 2 active (0 and 1), so 2 have banked
-        obs: Observation = {
-            "round_number": 1,
+    @pytest.fixture
+    def leech_obs(self, base_obs: Observation) -> Observation:
+        """Four-player observation where players 2 and 3 have banked."""
+        return {
+            **base_obs,
             "roll_count": 5,
             "current_bank": 50,
             "last_roll": (3, 4),
-            "active_player_ids": {0, 1},  # Only 2 still active
-            "player_id": 0,
             "player_score": 100,
-            "can_bank": True,
             "all_player_scores": {0: 100, 1: 90, 2: 110, 3: 95},
         }
 
-        assert agent.act(obs) == "bank"
+    def test_banks_when_enough_players_banked(self, leech_obs: Observation) -> None:
+        """Test agent banks when enough players have banked."""
+        agent = LeechAgent(player_id=0, min_banked_players=2)
 
-    def test_does_not_bank_when_too_few_banked(self) -> None:
+        # 4 total players, 2 active (0 and 1), so 2 have banked
+        assert agent.act(leech_obs) == "bank"
+
+    def test_does_not_bank_when_too_few_banked(self, leech_obs: Observation) -> None:
         """Test agent waits when not enough players have banked."""
         agent = LeechAgent(player_id=0, min_banked_players=2)
 
         # 4 total, 3 active, only 1 has banked
         obs: Observation = {
-            "round_number": 1,
+            **leech_obs,
             "roll_count": 3,
-            "current_bank": 50,
-            "last_roll": (3, 4),
             "active_player_ids": {0, 1, 2},  # 3 still active
-            "player_id": 0,
-            "player_score": 100,
-            "can_bank": True,
             "all_player_scores": {0: 100, 1: 90, 2: 85, 3: 95},
         }
 
         assert agent.act(obs) == "pass"
 
-    def test_does_not_bank_when_bank_too_low(self) -> None:
+    def test_does_not_bank_when_bank_too_low(self, leech_obs: Observation) -> None:
         """Test agent waits when bank value is below threshold."""
         agent = LeechAgent(player_id=0, min_bank=50)
 
         # Enough players banked but bank is only 30
-        obs: Observation = {
-            "round_number": 1,
-            "roll_count": 4,
-            "current_bank": 30,  # Below min_bank of 50
-            "last_roll": (2, 3),
-            "active_player_ids": {0, 1},
-            "player_id": 0,
-            "player_score": 100,
-            "can_bank": True,
-            "all_player_scores": {0: 100, 1: 90, 2: 110, 3: 95},
-        }
+        obs: Observation = {**leech_obs, "roll_count": 4, "current_bank": 30, "last_roll": (2, 3)}
 
         assert agent.act(obs) == "pass"
 
@@ -265,74 +218,98 @@ class TestRankBasedAgent:
         assert agent_custom.middle_threshold == 70
         assert agent_custom.last_threshold == 120
 
-    def test_conservative_when_leading(self) -> None:
-        """Test agent uses low threshold when in first place."""
+    @pytest.fixture
+    def rank_obs(self, base_obs: Observation) -> Observation:
+        """Four-player observation with everyone still active."""
+        return {**base_obs, "active_player_ids": {0, 1, 2, 3}}
+
+    @pytest.mark.parametrize(("current_bank", "expected"), [(45, "bank"), (35, "pass")])
+    def test_conservative_when_leading(self, rank_obs: Observation, current_bank: int, expected: str) -> None:
+        """Test agent uses low threshold (40) when in first place."""
         agent = RankBasedAgent(player_id=0, leader_threshold=40)
 
         # Player 0 is leading (150 > all others)
         obs: Observation = {
-            "round_number": 1,
-            "roll_count": 3,
-            "current_bank": 45,  # Above leader threshold of 40
+            **rank_obs,
+            "current_bank": current_bank,
             "last_roll": (3, 4),
-            "active_player_ids": {0, 1, 2, 3},
-            "player_id": 0,
             "player_score": 150,
-            "can_bank": True,
             "all_player_scores": {0: 150, 1: 120, 2: 110, 3: 100},
         }
 
-        assert agent.act(obs) == "bank"
+        assert agent.act(obs) == expected
 
-        # Below leader threshold
-        obs["current_bank"] = 35
-        assert agent.act(obs) == "pass"
-
-    def test_aggressive_when_last(self) -> None:
-        """Test agent uses high threshold when in last place."""
+    @pytest.mark.parametrize(("current_bank", "expected"), [(105, "bank"), (95, "pass")])
+    def test_aggressive_when_last(self, rank_obs: Observation, current_bank: int, expected: str) -> None:
+        """Test agent uses high threshold (100) when in last place."""
         agent = RankBasedAgent(player_id=0, last_threshold=100)
 
         # Player 0 is last (80 < all others)
         obs: Observation = {
-            "round_number": 1,
+            **rank_obs,
             "roll_count": 4,
-            "current_bank": 105,  # Above last threshold of 100
+            "current_bank": current_bank,
             "last_roll": (6, 5),
-            "active_player_ids": {0, 1, 2, 3},
-            "player_id": 0,
             "player_score": 80,
-            "can_bank": True,
             "all_player_scores": {0: 80, 1: 120, 2: 150, 3: 100},
         }
 
-        assert agent.act(obs) == "bank"
-
-        # Below last threshold
-        obs["current_bank"] = 95
-        assert agent.act(obs) == "pass"
+        assert agent.act(obs) == expected
 
-    def test_balanced_when_middle_rank(self) -> None:
-        """Test agent uses medium threshold when in middle ranks."""
+    @pytest.mark.parametrize(("current_bank", "expected"), [(65, "bank"), (55, "pass")])
+    def test_balanced_when_middle_rank(self, rank_obs: Observation, current_bank: int, expected: str) -> None:
+        """Test agent uses medium threshold (60) when in middle ranks."""
         agent = RankBasedAgent(player_id=0, middle_threshold=60)
 
         # Player 0 is rank 2 out of 4 (middle)
         obs: Observation = {
-            "round_number": 1,
-            "roll_count": 3,
-            "current_bank": 65,  # Above middle threshold of 60
-            "last_roll": (4, 3),
-            "active_player_ids": {0, 1, 2, 3},
-            "player_id": 0,
+            **rank_obs,
+            "current_bank": current_bank,
             "player_score": 120,
-            "can_bank": True,
             "all_player_scores": {0: 120, 1: 100, 2: 150, 3: 130},
         }
 
-        assert agent.act(obs) == "bank"
+        assert agent.act(obs) == expected
 
-        # Below middle threshold
-        obs["current_bank"] = 55
-        assert agent.act(obs) == "pass"
+
+class TestLeaderPlusBatchDecisions:
+    """Tests for LeaderPlusBaseAgent.act_batch."""
+
+    def test_act_batch_matches_act(self) -> None:
+        """Test that batched decisions equal per-agent act() decisions."""
+        game = BankGame(num_players=4)
+        game.start_new_round()
+        for player, score in zip(game.state.players, [50, 60, 40, 60], strict=True):
+            player.score = score
+        game.state.current_round.roll_count = 3
+        game.state.current_round.current_bank = 15
+
+        observations = [game.create_observation(pid) for pid in range(4)]
+        single = [LeaderOnlyAgent(pid).act(obs) for pid, obs in enumerate(observations)]
+        batched = LeaderOnlyAgent.act_batch([LeaderOnlyAgent(pid) for pid in range(4)], observations)
+
+        assert batched == single
+        assert batched == ["bank", "bank", "pass", "bank"]
+
+
+class TestRankBasedBatchDecisions:
+    """Tests for RankBasedAgent.act_batch."""
+
+    def test_act_batch_matches_act(self) -> None:
+        """Test that batched decisions equal per-agent act() decisions."""
+        game = BankGame(num_players=4)
+        game.start_new_round()
+        for player, score in zip(game.state.players, [120, 100, 150, 130], strict=True):
+            player.score = score
+        game.state.current_round.current_bank = 60
+
+        observations = [game.create_observation(pid) for pid in range(4)]
+        single = [RankBasedAgent(pid).act(obs) for pid, obs in enumerate(observations)]
+        batched = RankBasedAgent.act_batch([RankBasedAgent(pid) for pid in range(4)], observations)
+
+        assert batched == single
+        # Last place needs 100, the middle ranks 60 and the leader 40
+        assert batched == ["bank", "pass", "bank", "bank"]
 
 
 class TestAdvancedAgentsIntegration:
@@ -582,3 +582,76 @@ class TestAgentReset:
 
         for agent in agents:
             agent.reset()  # Should not raise errors
+
+
+class TestAgentBatchDecisions:
+    """Test that act_batch() matches act() for every agent class."""
+
+    @staticmethod
+    def _observations() -> list[Observation]:
+        observations: list[Observation] = []
+        for roll_count in (1, 3, 4, 8):
+            for current_bank in (0, 20, 30, 50, 80, 120, 200):
+                for can_bank in (True, False):
+                    observations.append(
+                        {
+                            "round_number": 2,
+                            "roll_count": roll_count,
+                            "current_bank": current_bank,
+                            "last_roll": (3, 5),
+                            "active_player_ids": {0, 1},
+                            "player_id": 0,
+                            "player_score": 40,
+                            "can_bank": can_bank,
+                            "all_player_scores": {0: 40, 1: 60},
+                        },
+                    )
+        return observations
+
+    def test_batch_matches_individual_decisions(self) -> None:
+        """Each class's act_batch should give the same actions as act()."""
+        observations = self._observations()
+        factories = [
+            lambda i: RandomAgent(i, seed=i),
+            lambda i: ThresholdAgent(i, threshold=25 + i),
+            lambda i: ConservativeAgent(i, early_threshold=30 + i, late_threshold=20),
+            lambda i: AggressiveAgent(i, min_threshold=80, early_multiplier=1.0 + i / 10),
+            lambda i: SmartAgent(i),
+        ]
+
+        for factory in factories:
+            batch_agents = [factory(i) for i in range(len(observations))]
+            single_agents = [factory(i) for i in range(len(observations))]
+
+            batch_actions = type(batch_agents[0]).act_batch(batch_agents, observations)
+            single_actions = [agent.act(obs) for agent, obs in zip(single_agents, observations, strict=True)]
+
+            assert batch_actions == single_actions
+
+    def test_subclass_overriding_act_is_respected(self) -> None:
+        """A subclass that changes act() should not inherit the fused batch rule."""
+
+        class NeverBankThreshold(ThresholdAgent):
+            def act(self, observation: Observation) -> str:
+                return "pass"
+
+        observations = self._observations()
+        agents = [NeverBankThreshold(0, threshold=0) for _ in observations]
+
+        assert set(NeverBankThreshold.act_batch(agents, observations)) == {"pass"}
+
+    def test_subclass_overriding_threshold_applies_to_both_paths(self) -> None:
+        """Overriding bank_threshold() should change act() and act_batch() alike."""
+
+        class LateOnlyConservative(ConservativeAgent):
+            def bank_threshold(self, roll_count: int) -> int:
+                return self.late_threshold if roll_count > 3 else 10_000
+
+        observations = self._observations()
+        agents = [LateOnlyConservative(0) for _ in observations]
+
+        batch_actions = LateOnlyConservative.act_batch(agents, observations)
+        assert batch_actions == [agent.act(obs) for agent, obs in zip(agents, observations, strict=True)]
+        assert all(
+            action == "pass" for action, obs in zip(batch_actions, observations, strict=True) if obs["roll_count"] <= 3
+        )
@@ -0,0 +1 @@
+"""Tests for batch experiment helpers."""
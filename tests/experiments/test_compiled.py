@@ -0,0 +1,51 @@
+"""Tests for compiled strategy sweeps."""
+
+import random
+
+import pytest
+
+from bank.agents.advanced_agents import LeaderOnlyAgent, LeaderPlusTwoAgent
+from bank.agents.rule_based import ThresholdAgent
+from bank.experiments._numba_core import lcg_die, lcg_next
+from bank.experiments.compiled import simulate_games
+from bank.game.engine import BankGame
+
+
+class _LcgRandom(random.Random):
+    """random.Random whose randint draws dice from the kernel's generator."""
+
+    def __init__(self, seed: int) -> None:
+        super().__init__()
+        self._state = seed
+
+    def randint(self, a: int, b: int) -> int:  # noqa: ARG002
+        self._state = lcg_next(self._state)
+        return lcg_die(self._state)
+
+
+class TestSimulateGames:
+    """Tests for simulate_games."""
+
+    def test_result_shape(self) -> None:
+        """Test that one row of non-negative scores is returned per game."""
+        scores = simulate_games([("threshold", 30), ("leader_plus", 1)], n_games=20, total_rounds=3)
+
+        assert scores.shape == (20, 2)
+        assert (scores >= 0).all()
+
+    @pytest.mark.parametrize("game_index", [0, 1, 2])
+    def test_matches_engine_on_same_dice(self, game_index: int) -> None:
+        """Test that game i replays BankGame with the same agents and dice."""
+        players = [("threshold", 40), ("leader_plus", 0), ("leader_plus", 2)]
+        scores = simulate_games(players, n_games=3, seed=11, total_rounds=8)
+
+        agents = [ThresholdAgent(0, threshold=40), LeaderOnlyAgent(1), LeaderPlusTwoAgent(2)]
+        game = BankGame(num_players=3, agents=agents, total_rounds=8, rng=_LcgRandom(11 + game_index))
+        state = game.play_game()
+
+        assert scores[game_index].tolist() == [p.score for p in state.players]
+
+    def test_unknown_strategy(self) -> None:
+        """Test that an unknown strategy name is rejected."""
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            simulate_games([("threshold", 30), ("bluff", 1)], n_games=1)
@@ -0,0 +1,41 @@
+"""Tests for process-parallel tournament simulation."""
+
+import random
+
+from bank.agents.rule_based import ThresholdAgent
+from bank.experiments.parallel import run_tournament
+from bank.game.engine import BankGame
+
+
+class TestRunTournament:
+    """Tests for run_tournament."""
+
+    def test_result_shape(self) -> None:
+        """Test that one row of scores is returned per game."""
+        scores = run_tournament([20, 40, 60], n_games=5, workers=1, total_rounds=3)
+
+        assert scores.shape == (5, 3)
+        assert (scores >= 0).all()
+
+    def test_matches_sequential_game(self) -> None:
+        """Test that game i reproduces a BankGame seeded with seed + i."""
+        scores = run_tournament([30, 50], n_games=3, seed=10, workers=1, total_rounds=4)
+
+        agents = [ThresholdAgent(0, threshold=30), ThresholdAgent(1, threshold=50)]
+        game = BankGame(num_players=2, agents=agents, total_rounds=4, rng=random.Random(12))
+        state = game.play_game()
+
+        assert scores[2].tolist() == [p.score for p in state.players]
+
+    def test_parallel_matches_serial(self) -> None:
+        """Test that results do not depend on the number of workers."""
+        serial = run_tournament([25, 75], n_games=8, seed=3, workers=1, total_rounds=3)
+        parallel = run_tournament([25, 75], n_games=8, seed=3, workers=2, total_rounds=3)
+
+        assert (serial == parallel).all()
+
+    def test_zero_games(self) -> None:
+        """Test that an empty sweep returns an empty score matrix."""
+        scores = run_tournament([25, 75], n_games=0, workers=1)
+
+        assert scores.shape == (0, 2)
@@ -0,0 +1,67 @@
+"""Tests for vectorized threshold-game simulation."""
+
+import random
+
+import numpy as np
+
+from bank.agents.rule_based import ThresholdAgent
+from bank.experiments.vectorized import simulate_threshold_games
+from bank.game.engine import BankGame
+
+
+class _ScriptedRandom(random.Random):
+    """random.Random whose randint replays a fixed sequence of dice."""
+
+    def __init__(self, dice: list[int]) -> None:
+        super().__init__()
+        self._dice = iter(dice)
+
+    def randint(self, a: int, b: int) -> int:  # noqa: ARG002
+        return next(self._dice)
+
+
+class _ScriptedGenerator:
+    """Stand-in for np.random.Generator that replays the same dice."""
+
+    def __init__(self, dice: list[int]) -> None:
+        self._dice = iter(dice)
+
+    def integers(self, low: int, high: int, size: tuple[int, int]) -> np.ndarray:  # noqa: ARG002
+        return np.array([[next(self._dice) for _ in range(size[1])] for _ in range(size[0])])
+
+
+class TestSimulateThresholdGames:
+    """Tests for simulate_threshold_games."""
+
+    def test_result_shape(self) -> None:
+        """Test that one row of non-negative scores is returned per game."""
+        scores = simulate_threshold_games([20, 40, 60], n_games=50, total_rounds=3)
+
+        assert scores.shape == (50, 3)
+        assert (scores >= 0).all()
+
+    def test_matches_engine_on_same_dice(self) -> None:
+        """Test that a game replays exactly like BankGame given the same dice."""
+        source = random.Random(5)
+        dice = [source.randint(1, 6) for _ in range(2000)]
+
+        scores = simulate_threshold_games([30, 90], n_games=1, total_rounds=6, rng=_ScriptedGenerator(dice))
+
+        agents = [ThresholdAgent(0, threshold=30), ThresholdAgent(1, threshold=90)]
+        game = BankGame(num_players=2, agents=agents, total_rounds=6, rng=_ScriptedRandom(dice))
+        state = game.play_game()
+
+        assert scores[0].tolist() == [p.score for p in state.players]
+
+    def test_seeded_runs_repeat(self) -> None:
+        """Test that the same seed gives the same scores."""
+        first = simulate_threshold_games([25, 75], n_games=20, seed=3, total_rounds=4)
+        second = simulate_threshold_games([25, 75], n_games=20, seed=3, total_rounds=4)
+
+        assert (first == second).all()
+
+    def test_zero_games(self) -> None:
+        """Test that an empty sweep returns an empty score matrix."""
+        scores = simulate_threshold_games([25, 75], n_games=0)
+
+        assert scores.shape == (0, 2)
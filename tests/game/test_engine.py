@@ -8,6 +8,13 @@ Unit tests for specific functionality are in separate test modules:
 - test_engine_banking.py: Banking and accumulation rules
 """
 
+import random
+
+import numpy as np
+
+from bank.agents.advanced_agents import LeaderPlusTwoAgent
+from bank.agents.rule_based import SmartAgent, ThresholdAgent
+from bank.experiments._numba_core import STRATEGY_LEADER_PLUS, STRATEGY_THRESHOLD, play_game
 from bank.game.engine import BankGame
 from bank.game.state import GameState
 
@@ -192,3 +199,48 @@ class TestGetters:
         game.player_banks(1)
         active = game.get_active_players()
         assert len(active) == 1
+
+
+class TestPlayGameFast:
+    """Tests for the compiled play_game_fast() path."""
+
+    def test_threshold_and_leader_agents_use_kernel(self):
+        """Test supported agents are played by the kernel with a seed drawn from the game rng."""
+        agents = [ThresholdAgent(0, threshold=40), LeaderPlusTwoAgent(1), ThresholdAgent(2, threshold=90)]
+        game = BankGame(num_players=3, agents=agents, total_rounds=8, rng=random.Random(5))
+
+        state = game.play_game_fast()
+
+        expected = np.zeros(3, dtype=np.int64)
+        play_game(
+            np.array([STRATEGY_THRESHOLD, STRATEGY_LEADER_PLUS, STRATEGY_THRESHOLD], dtype=np.int8),
+            np.array([40, 2, 90], dtype=np.int64),
+            8,
+            random.Random(5).getrandbits(48),
+            expected,
+        )
+        assert [p.score for p in state.players] == expected.tolist()
+        assert state.game_over is True
+        assert state.winner == int(np.argmax(expected))
+
+    def test_unsupported_agents_fall_back_to_play_game(self):
+        """Test games the kernel cannot play match play_game() exactly."""
+
+        def make_game() -> BankGame:
+            agents = [ThresholdAgent(0, threshold=40), SmartAgent(1)]
+            return BankGame(num_players=2, agents=agents, total_rounds=5, rng=random.Random(3))
+
+        fast = make_game().play_game_fast()
+        slow = make_game().play_game()
+
+        assert [p.score for p in fast.players] == [p.score for p in slow.players]
+        assert fast.winner == slow.winner
+
+    def test_game_in_progress_falls_back(self):
+        """Test a game with a round underway is finished by play_game()."""
+        agents = [ThresholdAgent(0, threshold=30), ThresholdAgent(1, threshold=60)]
+        game = BankGame(num_players=2, agents=agents, total_rounds=3, rng=random.Random(9))
+        game.start_new_round()
+
+        assert game._compiled_strategies() is None
+        assert game.play_game_fast().game_over is True
@@ -1,7 +1,16 @@
 """Tests for BANK! game engine agent polling and decision making."""
 
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+from bank.agents.base import Action, Agent, Observation, max_opponent_score, player_rank
 from bank.agents.test_agents import AlwaysBankAgent, AlwaysPassAgent, ThresholdAgent
 from bank.game.engine import BankGame
+from bank.game.features import OBS_SIZE
+from bank.training.environment import flatten_observation
 
 
 class TestAgentPolling:
@@ -165,6 +174,82 @@ class TestAgentPolling:
         assert obs["player_score"] == 15
         assert obs["can_bank"] is True
         assert obs["all_player_scores"] == {0: 15, 1: 20}
+        with pytest.raises(TypeError):
+            obs["all_player_scores"][0] = 0
+        assert obs["all_player_scores_arr"].tolist() == [15, 20]
+
+    def test_observation_max_opponent_score(self):
+        """Test that each observation carries the best score among the other players."""
+        agents = [AlwaysPassAgent(i) for i in range(4)]
+        game = BankGame(num_players=4, agents=agents)
+        game.start_new_round()
+        for player, score in zip(game.state.players, [50, 60, 40, 60], strict=True):
+            player.score = score
+
+        assert [game.create_observation(pid)["max_opponent_score"] for pid in range(4)] == [60, 60, 60, 60]
+
+        game.state.players[3].score = 10
+        assert [game.create_observation(pid)["max_opponent_score"] for pid in range(4)] == [60, 50, 60, 60]
+
+        # Hand-built observations without the field fall back to a scan
+        observation = game.create_observation(1)
+        del observation["max_opponent_score"]
+        assert max_opponent_score(observation) == 50
+
+    def test_observation_my_rank(self):
+        """Test that each observation carries the player's rank, with ties sharing a rank."""
+        agents = [AlwaysPassAgent(i) for i in range(4)]
+        game = BankGame(num_players=4, agents=agents)
+        game.start_new_round()
+        for player, score in zip(game.state.players, [50, 60, 40, 60], strict=True):
+            player.score = score
+
+        assert [game.create_observation(pid)["my_rank"] for pid in range(4)] == [3, 1, 4, 1]
+
+        observation = game.create_observation(0)
+        del observation["my_rank"]
+        assert player_rank(observation) == 3
+
+    def test_observation_active_mask(self):
+        """Test observations carry the active players as a bitmask and a read-only snapshot."""
+        agents = [AlwaysPassAgent(i) for i in range(4)]
+        game = BankGame(num_players=4, agents=agents)
+        game.start_new_round()
+        game.player_banks(1)
+
+        obs = game.create_observation(0)
+
+        assert obs["active_player_ids"] == {0, 2, 3}
+        assert obs["active_mask"] == 0b1101
+        assert obs["active_mask"].bit_count() == len(obs["active_player_ids"])
+        assert isinstance(obs["active_player_ids"], frozenset)
+
+    def test_observation_scores_array_is_read_only_view(self):
+        """Test that the observation's score array tracks the game without exposing writes."""
+        game = BankGame(num_players=2, agents=[AlwaysPassAgent(0), AlwaysPassAgent(1)])
+        game.start_new_round()
+
+        scores = game.create_observation(0)["all_player_scores_arr"]
+        game.state.players[1].score = 30
+
+        assert scores.tolist() == [0, 30]
+        with pytest.raises(ValueError, match="read-only"):
+            scores[0] = 100
+
+    def test_fill_observation_array_matches_flattened_observation(self):
+        """Test that the engine's feature fill equals flattening its observation dict."""
+        agents = [AlwaysBankAgent(0), AlwaysPassAgent(1), AlwaysPassAgent(2)]
+        game = BankGame(num_players=3, agents=agents, rng=random.Random(7))
+        game.start_new_round()
+        game.roll_dice()
+        game.roll_dice()
+        game.player_banks(0)
+
+        for player_id in range(3):
+            out = np.empty(OBS_SIZE, dtype=np.float32)
+            game.fill_observation_array(player_id, 10, out)
+            expected = flatten_observation(game.create_observation(player_id), 10)
+            np.testing.assert_allclose(out, expected)
 
     def test_observation_after_banking(self):
         """Test that observations reflect banking status correctly."""
@@ -269,3 +354,92 @@ class TestIntegrationWithRolling:
             assert False, "Should have raised ValueError"
         except ValueError as e:
             assert "must match" in str(e).lower()
+
+
+class EventAgent(Agent):
+    """Async agent that either waits for or sets a shared event before deciding."""
+
+    def __init__(self, player_id: int, event: asyncio.Event, *, waits: bool) -> None:
+        super().__init__(player_id)
+        self.event = event
+        self.waits = waits
+
+    def act(self, observation: Observation) -> Action:
+        raise AssertionError("async polling should use aact()")
+
+    async def aact(self, observation: Observation) -> Action:
+        if self.waits:
+            await self.event.wait()
+        else:
+            self.event.set()
+        return "bank"
+
+
+class FailingAgent(Agent):
+    """Agent that raises when asked to act."""
+
+    def act(self, observation: Observation) -> Action:
+        msg = "agent failure"
+        raise RuntimeError(msg)
+
+
+class TestAsyncPolling:
+    """Tests for asyncio-based agent polling."""
+
+    def test_async_poll_runs_agents_concurrently(self):
+        """Test that aact() coroutines are awaited concurrently, not one by one."""
+
+        async def run() -> list[int]:
+            event = asyncio.Event()
+            # Player 0 is polled first and waits on player 1
+            agents = [EventAgent(0, event, waits=True), EventAgent(1, event, waits=False)]
+            game = BankGame(num_players=2, agents=agents)
+            game.start_new_round()
+            game.state.current_round.current_bank = 40
+            # Sequential awaiting would never get to player 1
+            return await asyncio.wait_for(game.poll_decisions_async(), timeout=5)
+
+        assert asyncio.run(run()) == [0, 1]
+
+    def test_async_poll_wraps_sync_agents(self):
+        """Test that synchronous agents work through the default aact()."""
+        agents = [AlwaysPassAgent(0), AlwaysBankAgent(1), ThresholdAgent(2, threshold=50)]
+        game = BankGame(num_players=3, agents=agents)
+        game.start_new_round()
+        game.state.current_round.current_bank = 30
+
+        banked = asyncio.run(game.poll_decisions_async())
+
+        assert banked == [1]
+        assert game.state.players[1].score == 30
+
+    def test_async_poll_deterministic_mode(self):
+        """Test that deterministic async polling processes in player ID order."""
+        agents = [AlwaysBankAgent(0), AlwaysBankAgent(1), AlwaysBankAgent(2)]
+        game = BankGame(num_players=3, agents=agents, deterministic_polling=True)
+        game.start_new_round()
+        game.state.current_round.current_bank = 100
+
+        assert asyncio.run(game.poll_decisions_async()) == [0, 1, 2]
+
+    def test_async_poll_reraises_agent_errors(self):
+        """Test that an agent exception is raised and no decisions are applied."""
+        agents = [AlwaysBankAgent(0), FailingAgent(1)]
+        game = BankGame(num_players=2, agents=agents)
+        game.start_new_round()
+        game.state.current_round.current_bank = 50
+
+        with pytest.raises(RuntimeError, match="agent failure"):
+            asyncio.run(game.poll_decisions_async())
+
+        assert game.state.players[0].score == 0
+
+    def test_play_game_async_completes(self):
+        """Test that a full game can be played with async polling."""
+        agents = [ThresholdAgent(0, threshold=20), ThresholdAgent(1, threshold=40)]
+        game = BankGame(num_players=2, agents=agents, total_rounds=3)
+
+        state = asyncio.run(game.play_game_async())
+
+        assert state.game_over is True
+        assert state.current_round.round_number == 3
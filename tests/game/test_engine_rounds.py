@@ -1,5 +1,8 @@
 """Tests for BANK! game engine round management."""
 
+import random
+
+from bank.agents.test_agents import AlwaysBankAgent, AlwaysPassAgent
 from bank.game.engine import BankGame
 
 
@@ -62,3 +65,27 @@ class TestRoundManagement:
 
         assert game.state.game_over
         assert game.state.winner is not None
+
+    def test_play_round_until_stops_at_roll_limit(self):
+        """Test that play_round_until makes at most max_rolls rolls."""
+        agents = [AlwaysPassAgent(0), AlwaysPassAgent(1)]
+        game = BankGame(num_players=2, agents=agents, rng=random.Random(3))
+        game.start_new_round()
+
+        rolls = game.play_round_until(2)
+
+        assert len(rolls) <= 2
+        assert game.state.current_round.roll_count == len(rolls)
+        assert all(banked == [] for _, banked in rolls)
+
+    def test_play_round_until_stops_when_round_ends(self):
+        """Test that play_round_until returns early once everyone has banked."""
+        agents = [AlwaysBankAgent(0), AlwaysBankAgent(1)]
+        game = BankGame(num_players=2, agents=agents, rng=random.Random(3))
+        game.start_new_round()
+
+        rolls = game.play_round_until(10)
+
+        assert len(rolls) == 1
+        assert sorted(rolls[0][1]) == [0, 1]
+        assert game.is_round_over()
@@ -1,6 +1,19 @@
 """Tests for game state dataclasses."""
 
-from bank.game.state import FIRST_THREE_ROLLS, GameState, PlayerState, RoundState
+import copy
+import pickle
+
+import numpy as np
+
+from bank.game.state import (
+    FIRST_THREE_ROLLS,
+    NO_ROLL,
+    GameState,
+    PlayerState,
+    RoundState,
+    pack_roll,
+    unpack_roll,
+)
 
 
 class TestPlayerState:
@@ -455,3 +468,133 @@ class TestGameState:
         repr_str = repr(game)
         assert "3" in repr_str
         assert "10" in repr_str  # total rounds
+
+
+class TestSharedScoreArrays:
+    """Tests for the structure-of-arrays score storage on GameState."""
+
+    def test_player_scores_back_onto_game_state_array(self):
+        """Player score writes are visible in scores_arr and vice versa."""
+        players = [PlayerState(player_id=0, name="A", score=5), PlayerState(player_id=1, name="B")]
+        state = GameState(players=players)
+
+        assert state.scores_arr.dtype == np.int64
+        assert state.scores_arr.tolist() == [5, 0]
+
+        players[1].score += 30
+        assert state.scores_arr[1] == 30
+
+        state.scores_arr[0] = 99
+        assert players[0].score == 99
+        assert isinstance(players[0].score, int)
+
+    def test_banked_flags_back_onto_game_state_array(self):
+        """has_banked_this_round is stored in banked_arr and returns a Python bool."""
+        players = [PlayerState(player_id=1, name="A"), PlayerState(player_id=3, name="B")]
+        state = GameState(players=players)
+
+        players[1].has_banked_this_round = True
+        assert state.banked_arr.tolist() == [False, True]
+
+        state.banked_arr[:] = False
+        assert players[1].has_banked_this_round is False
+
+    def test_round_trip_serialization_unchanged(self):
+        """to_dict/from_dict still produce plain ints and equal states."""
+        players = [PlayerState(player_id=0, name="A", score=12, has_banked_this_round=True)]
+        state = GameState(players=players)
+
+        data = state.to_dict()
+        assert data["players"][0]["score"] == 12
+        assert type(data["players"][0]["score"]) is int
+
+        restored = GameState.from_dict(data)
+        assert restored.players == state.players
+        assert restored.scores_arr.tolist() == [12]
+
+
+class TestPackedLastRoll:
+    """Tests for the packed last_roll storage on RoundState."""
+
+    def test_pack_unpack_all_rolls(self):
+        """Every dice combination survives a pack/unpack round trip in 6 bits."""
+        for die1 in range(1, 7):
+            for die2 in range(1, 7):
+                packed = pack_roll(die1, die2)
+                assert 0 <= packed < 64
+                assert unpack_roll(packed) == (die1, die2)
+        assert unpack_roll(NO_ROLL) is None
+
+    def test_last_roll_property_uses_packed_storage(self):
+        """Assigning last_roll stores a packed int and reads back a tuple."""
+        round_state = RoundState(round_number=1)
+        assert round_state.last_roll is None
+
+        round_state.last_roll = (4, 6)
+        assert round_state.last_roll_packed == pack_roll(4, 6)
+        assert round_state.last_roll == (4, 6)
+
+        round_state.last_roll = None
+        assert round_state.last_roll_packed == NO_ROLL
+
+    def test_set_last_roll_and_constructor(self):
+        """set_last_roll packs the dice; a last_roll argument survives __init__."""
+        round_state = RoundState(round_number=1, last_roll=(2, 2))
+        assert round_state.last_roll == (2, 2)
+
+        round_state.set_last_roll(6, 1)
+        assert round_state.last_roll_packed == pack_roll(6, 1)
+        assert round_state.last_roll == (6, 1)
+        assert round_state == RoundState(round_number=1, last_roll=(6, 1))
+
+
+class TestPlayerBinding:
+    """Tests for binding players to the shared arrays and copying state."""
+
+    def test_unbound_player_keeps_its_own_values(self):
+        """A player outside any GameState stores score and flag on itself."""
+        player = PlayerState(player_id=0, name="A", score=7)
+
+        player.score += 3
+        player.has_banked_this_round = True
+
+        assert player.slot == -1
+        assert player.score == 10
+        assert player.has_banked_this_round is True
+
+    def test_add_player_binds_new_player(self):
+        """Players added after construction are backed by the grown arrays."""
+        state = GameState(players=[PlayerState(player_id=0, name="A", score=4)])
+        late = PlayerState(player_id=1, name="B", score=9, has_banked_this_round=True)
+
+        state.add_player(late)
+        late.score += 1
+
+        assert late.slot == 1
+        assert state.scores_arr.tolist() == [4, 10]
+        assert state.banked_arr.tolist() == [False, True]
+        assert state.scores_view.tolist() == [4, 10]
+        assert not state.scores_view.flags.writeable
+
+    def test_deepcopy_is_independent_and_read_only(self):
+        """A deep copy gets its own bound arrays and a read-only view of them."""
+        state = GameState(players=[PlayerState(player_id=0, name="A"), PlayerState(player_id=1, name="B")])
+        state.players[1].score = 20
+
+        clone = copy.deepcopy(state)
+        clone.players[0].score = 5
+
+        assert clone.scores_arr.tolist() == [5, 20]
+        assert clone.scores_view.tolist() == [5, 20]
+        assert not clone.scores_view.flags.writeable
+        assert state.scores_arr.tolist() == [0, 20]
+
+    def test_pickle_round_trip_keeps_binding(self):
+        """Unpickled players still write through to the restored arrays."""
+        state = GameState(players=[PlayerState(player_id=0, name="A", score=3)])
+
+        restored = pickle.loads(pickle.dumps(state))
+        restored.players[0].score += 1
+
+        assert restored.scores_view.tolist() == [4]
+        assert not restored.scores_view.flags.writeable
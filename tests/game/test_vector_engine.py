@@ -0,0 +1,63 @@
+"""Tests for the batched threshold-game engine."""
+
+import numpy as np
+
+from bank.game.vector_engine import BatchedBankGame
+
+
+class _ScriptedGenerator:
+    """Stand-in for np.random.Generator that replays fixed rolls per step."""
+
+    def __init__(self, rolls: list[list[tuple[int, int]]]) -> None:
+        self._rolls = iter(rolls)
+
+    def integers(self, low: int, high: int, size: tuple[int, int]) -> np.ndarray:  # noqa: ARG002
+        return np.array(next(self._rolls))
+
+
+class TestBatchedBankGame:
+    """Tests for BatchedBankGame."""
+
+    def test_step_applies_rules_per_game(self) -> None:
+        """Test each game's bank, banking and round end advance independently."""
+        rolls = [
+            [(3, 4), (2, 2)],  # Seven bonus in game 0; doubles at face value in game 1
+            [(1, 1), (5, 6)],
+            [(2, 3), (1, 2)],
+            [(4, 4), (3, 4)],  # Doubles double game 0's bank; a seven ends game 1's round
+        ]
+        game = BatchedBankGame([30, 100], num_games=2, total_rounds=1, rng=_ScriptedGenerator(rolls))
+        game.start_new_round()
+
+        game.step()
+        assert game.bank.tolist() == [70, 4]
+        # Player 0 (threshold 30) banks 70 in game 0 only
+        assert game.scores.tolist() == [[70, 0], [0, 0]]
+
+        game.step()
+        game.step()
+        assert game.bank.tolist() == [77, 18]
+        assert game.scores.tolist() == [[70, 0], [0, 0]]
+
+        game.step()
+        assert game.bank.tolist() == [154, 18]
+        assert game.scores.tolist() == [[70, 154], [0, 0]]
+        assert game.in_round.tolist() == [False, False]
+        assert game.is_game_over()
+
+    def test_play_all_shape_and_rounds(self) -> None:
+        """Test play_all plays every round and returns one score row per game."""
+        game = BatchedBankGame([20, 40, 60], num_games=25, total_rounds=4, rng=np.random.default_rng(1))
+
+        scores = game.play_all()
+
+        assert scores.shape == (25, 3)
+        assert (scores >= 0).all()
+        assert game.round_number == 4
+        assert game.is_game_over()
+
+    def test_no_games(self) -> None:
+        """Test an empty batch finishes immediately."""
+        scores = BatchedBankGame([10, 20], num_games=0, total_rounds=3).play_all()
+
+        assert scores.shape == (0, 2)
@@ -241,6 +241,47 @@ class TestGameRecorder:
         assert recorder.events[-1]["type"] == "game_end"
 
 
+class TestRecordedEvents:
+    """Tests for the read-only events view."""
+
+    def _recorder(self) -> GameRecorder:
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 42)
+        recorder.record_round_start(1)
+        recorder.record_roll(1, 1, (3, 4), 0, 70)
+        return recorder
+
+    def test_indexing_and_slicing(self) -> None:
+        """Test negative indices, slices and out-of-range access."""
+        recorder = self._recorder()
+        events = recorder.events
+
+        assert events[-1]["type"] == "roll"
+        assert [e["type"] for e in events[1:]] == ["round_start", "roll"]
+        with pytest.raises(IndexError):
+            events[3]
+
+    def test_view_tracks_new_events(self) -> None:
+        """Test that a view taken earlier sees events recorded later."""
+        recorder = self._recorder()
+        events = recorder.events
+
+        recorder.record_bank(1, 0, "Alice", 70, 0, 70)
+
+        assert len(events) == 4
+        assert events == list(recorder.events)
+
+    def test_view_is_read_only(self) -> None:
+        """Test that the view cannot be appended to or edited in place."""
+        recorder = self._recorder()
+
+        with pytest.raises(AttributeError):
+            recorder.events.append({})  # type: ignore[attr-defined]
+        recorder.events[2]["data"]["bank_after"] = 0
+
+        assert recorder.events[2]["data"]["bank_after"] == 70
+
+
 class TestSaveLoadReplay:
     """Tests for save_replay and load_replay functions."""
 
@@ -337,3 +378,254 @@ class TestSaveLoadReplay:
 
         finally:
             Path(temp_path).unlink()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_backends_are_interchangeable(self, monkeypatch, tmp_path, use_orjson) -> None:
+        """Replays written by either JSON backend load identically with the other."""
+        from bank.replay import recorder as recorder_module
+
+        if use_orjson and not recorder_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_end(1, "seven_rolled", 0, {0: 5, 1: 3})
+
+        path = tmp_path / "replay.json"
+        monkeypatch.setattr(recorder_module, "ORJSON_AVAILABLE", use_orjson)
+        save_replay(recorder, path)
+        monkeypatch.setattr(recorder_module, "ORJSON_AVAILABLE", not use_orjson and recorder_module.orjson is not None)
+        loaded = load_replay(path)
+
+        assert loaded["metadata"] == recorder.metadata
+        assert loaded["events"][1]["data"]["player_scores"] == {"0": 5, "1": 3}
+
+
+class TestColumnarStorage:
+    """Tests for the column-wise event storage in GameRecorder."""
+
+    def test_rolls_and_banks_are_stored_in_columns(self) -> None:
+        """Frequent events append to typed columns instead of dicts."""
+        recorder = GameRecorder()
+        recorder.record_roll(1, 1, (3, 4), 0, 70)
+        recorder.record_roll(1, 2, (2, 2), 70, 140)
+        recorder.record_bank(1, 0, "Alice", 140, 0, 140)
+
+        assert list(recorder.roll_round) == [1, 1]
+        assert list(recorder.roll_die1) == [3, 2]
+        assert list(recorder.roll_bank_after) == [70, 140]
+        assert list(recorder.bank_amount) == [140]
+        assert recorder.events[1]["data"] == {
+            "round_number": 1,
+            "roll_count": 2,
+            "dice": [2, 2],
+            "bank_before": 70,
+            "bank_after": 140,
+            "delta": 70,
+        }
+
+    def test_from_dict_round_trip(self) -> None:
+        """from_dict rebuilds columns that export the same events."""
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 42)
+        recorder.record_round_start(1)
+        recorder.record_roll(1, 1, (6, 1), 0, 70)
+        recorder.record_bank(1, 1, "Bob", 70, 0, 70)
+        recorder.record_round_end(1, "seven_rolled", 0, {0: 0, 1: 70})
+        recorder.record_game_end({0: 0, 1: 70}, [1], ["Bob"])
+
+        data = recorder.to_dict()
+        rebuilt = GameRecorder.from_dict(data)
+
+        assert rebuilt.to_dict() == data
+
+    def test_timestamps_stored_as_ns_and_exported_as_iso(self) -> None:
+        """Timestamps are kept as integer nanoseconds and formatted on export."""
+        from datetime import datetime
+
+        recorder = GameRecorder()
+        recorder.record_round_start(1)
+
+        assert isinstance(recorder._timestamps[0], int)
+        exported = recorder.events[0]["timestamp"]
+        assert isinstance(datetime.fromisoformat(exported), datetime)
+
+    def test_event_type_codes_map_to_file_labels(self) -> None:
+        """EventType codes round-trip through their replay-file strings."""
+        from bank.replay import EventType
+
+        assert EventType.ROLL.label == "roll"
+        assert EventType.from_label("round_end") is EventType.ROUND_END
+        assert [t.label for t in EventType] == [
+            "game_start",
+            "round_start",
+            "roll",
+            "bank",
+            "round_end",
+            "game_end",
+        ]
+
+    def test_from_dict_rejects_unknown_event_type(self) -> None:
+        """Unknown event types raise ValueError."""
+        data = {"metadata": {}, "events": [{"type": "mystery", "timestamp": "2024-01-01T00:00:00", "data": {}}]}
+        with pytest.raises(ValueError, match="Unknown event type"):
+            GameRecorder.from_dict(data)
+
+    def test_rare_events_use_slotted_records(self) -> None:
+        """Round and game end events are stored as slotted records."""
+        from bank.replay.recorder import GameEndEvent, RoundEndEvent
+
+        recorder = GameRecorder()
+        recorder.record_round_end(1, "all_banked", 20, {0: 20})
+        recorder.record_game_end({0: 20}, [0], ["Alice"])
+
+        assert isinstance(recorder._other_data[0], RoundEndEvent)
+        assert isinstance(recorder._other_data[1], GameEndEvent)
+        assert not hasattr(recorder._other_data[0], "__dict__")
+        assert recorder.events[0]["data"]["player_scores"] == {0: 20}
+
+
+def _load_uncompressed(recorder: GameRecorder, directory: Path) -> dict:
+    """Save and load a recorder through an uncompressed file."""
+    path = directory / "plain.json"
+    save_replay(recorder, path)
+    return load_replay(path)
+
+
+class TestCompressedReplay:
+    """Tests for gzip-compressed replay files."""
+
+    def test_gz_suffix_writes_gzip(self, tmp_path) -> None:
+        """A .gz path is written as gzip and loads back transparently."""
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_start(1)
+        recorder.record_roll(1, 1, (3, 4), 0, 70)
+
+        path = tmp_path / "replay.json.gz"
+        save_replay(recorder, path)
+
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert load_replay(path) == _load_uncompressed(recorder, tmp_path)
+
+    def test_gzip_detected_by_magic_bytes(self, tmp_path) -> None:
+        """Compressed content is detected even without a .gz suffix."""
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+
+        compressed = tmp_path / "replay.json.gz"
+        save_replay(recorder, compressed)
+        renamed = compressed.rename(tmp_path / "replay.json")
+
+        assert load_replay(renamed)["metadata"]["num_players"] == 2
+
+
+class TestJsonLinesReplay:
+    """Tests for the JSON Lines replay format and event streaming."""
+
+    def _record_short_game(self, recorder: GameRecorder) -> None:
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_start(1)
+        recorder.record_roll(1, 1, (3, 4), 0, 70)
+        recorder.record_bank(1, 0, "Alice", 70, 0, 70)
+        recorder.record_round_end(1, "seven_rolled", 0, {0: 70, 1: 0})
+        recorder.record_game_end({0: 70, 1: 0}, [0], ["Alice"])
+
+    def test_jsonl_matches_json(self, tmp_path) -> None:
+        """A .jsonl replay loads into the same dict as a .json replay."""
+        recorder = GameRecorder()
+        self._record_short_game(recorder)
+
+        save_replay(recorder, tmp_path / "replay.jsonl")
+        lines = (tmp_path / "replay.jsonl").read_text().splitlines()
+
+        assert len(lines) == 7
+        assert load_replay(tmp_path / "replay.jsonl") == _load_uncompressed(recorder, tmp_path)
+
+    def test_iter_replay_events(self, tmp_path) -> None:
+        """iter_replay_events yields events from both formats."""
+        from bank.replay import iter_replay_events
+
+        recorder = GameRecorder()
+        self._record_short_game(recorder)
+        save_replay(recorder, tmp_path / "replay.jsonl.gz")
+        save_replay(recorder, tmp_path / "replay.json")
+
+        jsonl_types = [e["type"] for e in iter_replay_events(tmp_path / "replay.jsonl.gz")]
+        json_types = [e["type"] for e in iter_replay_events(tmp_path / "replay.json")]
+
+        assert jsonl_types == json_types == ["game_start", "round_start", "roll", "bank", "round_end", "game_end"]
+
+    def test_stream_to_writes_events_as_recorded(self, tmp_path) -> None:
+        """stream_to appends each event to disk as soon as it is recorded."""
+        path = tmp_path / "live.jsonl"
+        recorder = GameRecorder()
+        recorder.stream_to(path)
+
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_start(1)
+        partial = load_replay(path)
+        assert partial["metadata"]["num_players"] == 2
+        assert [e["type"] for e in partial["events"]] == ["game_start", "round_start"]
+
+        recorder.record_roll(1, 1, (3, 4), 0, 70)
+        recorder.stop_streaming()
+
+        assert load_replay(path) == _load_uncompressed(recorder, tmp_path)
+
+    def test_stream_to_after_start_writes_history(self, tmp_path) -> None:
+        """Streaming started mid-game first writes the events recorded so far."""
+        path = tmp_path / "late.jsonl"
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_start(1)
+
+        recorder.stream_to(path)
+        recorder.record_roll(1, 1, (2, 2), 0, 4)
+        recorder.stop_streaming()
+
+        assert len(load_replay(path)["events"]) == 3
+
+
+class TestStreamingLoad:
+    """Tests for load_replay_streaming and streamed viewers."""
+
+    @pytest.mark.parametrize("filename", ["replay.json", "replay.json.gz", "replay.jsonl"])
+    def test_streaming_matches_eager_load(self, tmp_path, filename) -> None:
+        """Streamed records reproduce load_replay's metadata and events."""
+        from bank.replay import load_replay_streaming
+
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_start(1)
+        recorder.record_roll(1, 1, (3, 4), 0, 70)
+        recorder.record_round_end(1, "seven_rolled", 0, {0: 0, 1: 0})
+        recorder.record_game_end({0: 0, 1: 0}, [0, 1], ["Alice", "Bob"])
+        path = tmp_path / filename
+        save_replay(recorder, path)
+
+        records = list(load_replay_streaming(path))
+        eager = load_replay(path)
+
+        assert records[0] == ("metadata", eager["metadata"])
+        assert [record for kind, record in records[1:]] == eager["events"]
+        assert all(kind == "event" for kind, _ in records[1:])
+
+    def test_viewer_from_stream(self, tmp_path) -> None:
+        """A viewer built from a stream sees the same events as an eager one."""
+        from bank.replay import load_replay_streaming
+        from bank.replay.viewer import ReplayViewer
+
+        recorder = GameRecorder()
+        recorder.start_game(2, ["Alice", "Bob"], 1, 7)
+        recorder.record_round_start(1)
+        recorder.record_bank(1, 1, "Bob", 40, 0, 40)
+        recorder.record_game_end({0: 0, 1: 40}, [1], ["Bob"])
+        path = tmp_path / "replay.json"
+        save_replay(recorder, path)
+
+        streamed = ReplayViewer.from_stream(load_replay_streaming(path))
+        eager = ReplayViewer(load_replay(path))
+
+        assert list(streamed.events) == list(eager.events)
+        assert streamed.get_player_stats(1) == eager.get_player_stats(1)
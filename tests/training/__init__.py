@@ -0,0 +1,3 @@
+"""
+Test initialization file.
+"""
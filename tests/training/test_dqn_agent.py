@@ -0,0 +1,110 @@
+"""Smoke tests for the DQN agent."""
+
+import random
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("gymnasium")
+
+from bank.game.engine import BankGame  # noqa: E402
+from bank.training.dqn_agent import DQNAgent  # noqa: E402
+from bank.training.environment import OBS_SIZE, flatten_observation  # noqa: E402
+
+
+def _observation(can_bank: bool = True):
+    """Build a real mid-round observation for player 0."""
+    game = BankGame(num_players=2, rng=random.Random(0))
+    game.start_new_round()
+    game.process_roll()
+    observation = game.create_observation(0)
+    observation["can_bank"] = can_bank
+    return observation
+
+
+def _fill_buffer(agent: DQNAgent, count: int) -> None:
+    """Store count random transitions."""
+    rng = np.random.default_rng(0)
+    states = rng.uniform(-1.0, 1.0, (count, OBS_SIZE)).astype(np.float32)
+    agent.store_batch(
+        states,
+        rng.integers(0, 2, count),
+        rng.standard_normal(count).astype(np.float32),
+        states[::-1].copy(),
+        rng.random(count) < 0.1,
+    )
+
+
+class TestDQNAgent:
+    """Tests for DQNAgent."""
+
+    def test_acts_in_a_game(self) -> None:
+        """Test that the agent can be seated in a BankGame and finish it."""
+        agents = [DQNAgent(0, epsilon=0.5, seed=1), DQNAgent(1, epsilon=0.0)]
+        game = BankGame(num_players=2, agents=agents, total_rounds=3, rng=random.Random(4))
+
+        state = game.play_game()
+
+        assert state.game_over
+
+    def test_greedy_act_returns_action(self) -> None:
+        """Test that a greedy act() returns the network's action."""
+        agent = DQNAgent(0, epsilon=0.0)
+        observation = _observation()
+
+        action = agent.act(observation)
+
+        with torch.inference_mode():
+            q_values = agent.q_network(torch.from_numpy(flatten_observation(observation)).unsqueeze(0))
+        assert action == ("bank" if int(q_values.argmax()) == 1 else "pass")
+
+    def test_passes_when_cannot_bank(self) -> None:
+        """Test that an agent that already banked always passes."""
+        agent = DQNAgent(0, epsilon=1.0, seed=0)
+
+        assert all(agent.act(_observation(can_bank=False)) == "pass" for _ in range(20))
+
+    def test_select_actions_batch(self) -> None:
+        """Test that batched selection returns one valid index per state."""
+        agent = DQNAgent(0, epsilon=0.5, seed=0)
+        states = np.zeros((6, OBS_SIZE), dtype=np.float32)
+
+        actions = agent.select_actions_batch(states)
+
+        assert actions.shape == (6,)
+        assert set(actions.tolist()) <= {0, 1}
+
+    def test_train_step(self) -> None:
+        """Test that updates wait for a full batch, then return a finite loss."""
+        agent = DQNAgent(0, memory_size=64)
+        _fill_buffer(agent, 8)
+        assert agent.train_step(batch_size=16) is None
+
+        _fill_buffer(agent, 80)
+        loss = agent.train_step(batch_size=16)
+
+        assert len(agent) == 64
+        assert torch.isfinite(loss)
+
+    def test_qint8_inference(self) -> None:
+        """Test that the int8 inference copy acts and refreshes on target sync."""
+        agent = DQNAgent(0, epsilon=0.0, inference_dtype="qint8", cuda_graph=True)
+        states = np.zeros((3, OBS_SIZE), dtype=np.float32)
+
+        agent.update_target_network()
+
+        assert set(agent.select_actions_batch(states).tolist()) <= {0, 1}
+        assert agent.use_cuda_graph == (agent.device.type == "cuda")
+
+    def test_save_and_load(self, tmp_path) -> None:
+        """Test that saved weights load into a fresh agent."""
+        agent = DQNAgent(0)
+        path = tmp_path / "dqn.pth"
+        agent.save_model(str(path))
+
+        other = DQNAgent(0)
+        other.load_model(str(path))
+
+        for a, b in zip(agent.q_network.parameters(), other.target_network.parameters(), strict=True):
+            assert torch.equal(a, b)
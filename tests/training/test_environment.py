@@ -0,0 +1,35 @@
+"""Tests for the BANK! gymnasium environment."""
+
+import random
+
+import pytest
+
+pytest.importorskip("gymnasium")
+
+from bank.training.environment import BankEnv  # noqa: E402
+
+
+class TestOpponentReuse:
+    """Tests for how opponents are kept between episodes."""
+
+    def test_random_opponents_vary_across_unseeded_resets(self) -> None:
+        """Test unconfigured opponent types are redrawn every episode."""
+        env = BankEnv(num_opponents=3, rng=random.Random(0))
+        env.reset(seed=0)
+
+        lineups = set()
+        for _ in range(20):
+            env.reset()
+            lineups.add(tuple(type(agent).__name__ for agent in env.game.agents[1:]))
+
+        assert len(lineups) > 1
+
+    def test_configured_opponents_are_reused(self) -> None:
+        """Test configured opponents are built once and reset between episodes."""
+        env = BankEnv(num_opponents=2, opponent_types=["smart", "leader_only"], rng=random.Random(0))
+        env.reset()
+        first = list(env.game.agents[1:])
+
+        env.reset()
+
+        assert all(a is b for a, b in zip(env.game.agents[1:], first, strict=True))
@@ -3,6 +3,9 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
+from bank.utils import config as config_module
 from bank.utils.config import Config
 
 
@@ -76,3 +79,46 @@ def test_merge_config():
     assert config.get("new_section.key") == "value"
     # Check that other settings are preserved
     assert config.get("training.episodes") == 1000
+
+
+def test_get_section_and_replaced_subtree():
+    """Test that sections resolve and replaced subtrees drop their old keys."""
+    config = Config()
+
+    assert config.get("cli") == {"ai_delay": 1.0, "human_timeout": 30}
+
+    config.set("cli", {"ai_delay": 0.5})
+    assert config.get("cli.ai_delay") == 0.5
+    assert config.get("cli.human_timeout") is None
+
+
+def test_get_sees_direct_changes():
+    """Test that edits made through the config dict or a section are visible."""
+    config = Config()
+
+    config.config["game"]["total_rounds"] = 12
+    section = config.get("training")
+    section["episodes"] = 5
+
+    assert config.get("game.total_rounds") == 12
+    assert config.get("training.episodes") == 5
+    assert Config().get("game.total_rounds") == Config.DEFAULT_CONFIG["game"]["total_rounds"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_load_round_trip(monkeypatch, tmp_path, use_orjson):
+    """Test that both encoders round-trip the config and stringify non-str keys."""
+    monkeypatch.setattr(config_module, "ORJSON_AVAILABLE", use_orjson and config_module.orjson is not None)
+    config = Config()
+    config.set("cli.ai_delay", 0.25)
+    config.set("extra", {"names": ["a", "b"], "enabled": True})
+    path = tmp_path / "config.json"
+
+    config.save(str(path))
+
+    assert Config(str(path)).config == config.config
+
+    config.set("extra.lookup", {1: "one"})
+    config.save(str(path))
+
+    assert Config(str(path)).get("extra.lookup") == {"1": "one"}
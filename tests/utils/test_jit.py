@@ -0,0 +1,32 @@
+"""Tests for the optional numba JIT shim."""
+
+import math
+
+import numpy as np
+
+from bank.utils import jit
+
+
+def _scaled_tanh(values, out):
+    for i in range(values.shape[0]):
+        out[i] = math.tanh(values[i] / 500.0)
+
+
+def test_njit_matches_python():
+    """Test that a kernel gives the same results compiled or not."""
+    kernel = jit.njit(cache=False)(_scaled_tanh)
+    values = np.array([-750.0, 0.0, 250.0, 1000.0])
+    out = np.empty(4, dtype=np.float32)
+
+    kernel(values, out)
+
+    expected = np.tanh(values / 500.0).astype(np.float32)
+    assert np.allclose(out, expected)
+
+
+def test_njit_fallback_without_numba(monkeypatch):
+    """Test that both decorator forms are no-ops when numba is missing."""
+    monkeypatch.setattr(jit, "NUMBA_AVAILABLE", False)
+
+    assert jit.njit(_scaled_tanh) is _scaled_tanh
+    assert jit.njit(cache=True, fastmath=True)(_scaled_tanh) is _scaled_tanh